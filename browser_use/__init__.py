@@ -16,7 +16,15 @@ from asyncio import base_subprocess
 from browser_use.agent.prompts import SystemPrompt
 from browser_use.agent.service import Agent
 from browser_use.agent.views import ActionModel, ActionResult, AgentHistoryList
-from browser_use.browser import Browser, BrowserConfig, BrowserContext, BrowserContextConfig, BrowserProfile, BrowserSession
+from browser_use.browser import (
+	Browser,
+	BrowserConfig,
+	BrowserContext,
+	BrowserContextConfig,
+	BrowserPool,
+	BrowserProfile,
+	BrowserSession,
+)
 from browser_use.controller.service import Controller
 from browser_use.dom.service import DomService
 from browser_use.llm import (
@@ -56,6 +64,7 @@ __all__ = [
 	'BrowserConfig',
 	'BrowserSession',
 	'BrowserProfile',
+	'BrowserPool',
 	'Controller',
 	'DomService',
 	'SystemPrompt',
@@ -20,12 +20,17 @@ from browser_use.llm.messages import (
 	BaseMessage,
 	ContentPartTextParam,
 	SystemMessage,
+	UserMessage,
 )
 from browser_use.observability import observe_debug
-from browser_use.utils import match_url_with_domain_pattern, time_execution_sync
+from browser_use.sensitive_data import SensitiveData, SensitiveDataIndex, get_sensitive_data_index
+from browser_use.utils import time_execution_sync
 
 logger = logging.getLogger(__name__)
 
+# the cacheable prefix of the agent history grows in chunks of this many items, see agent_history_prefix
+HISTORY_CACHE_CHUNK_SIZE = 10
+
 
 # ========== Logging Helper Functions ==========
 # These functions are used ONLY for formatting debug log output.
@@ -124,7 +129,10 @@ class MessageManager:
 		self.include_attributes = include_attributes or []
 		self.message_context = message_context
 		self.sensitive_data = sensitive_data
+		self._sensitive_data_index: SensitiveDataIndex | None = None
 		self.last_input_messages = []
+		# (history items list, number of items in the prefix, rendered prefix) of agent_history_prefix
+		self._history_prefix: tuple[list[HistoryItem] | None, int, str] = (None, 0, '')
 		# Only initialize messages if state is empty
 		if len(self.state.history.get_messages()) == 0:
 			self._add_message_with_type(self.system_prompt, 'system')
@@ -132,15 +140,13 @@ class MessageManager:
 	@property
 	def agent_history_description(self) -> str:
 		"""Build agent history description from list of items, respecting max_history_items limit"""
-		if self.max_history_items is None:
-			# Include all items
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
-
-		total_items = len(self.state.agent_history_items)
+		items = self.state.agent_history_items
+		total_items = len(items)
 
-		# If we have fewer items than the limit, just return all items
-		if total_items <= self.max_history_items:
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+		if self.max_history_items is None or total_items <= self.max_history_items:
+			# Include all items, the rendered prefix is extended as items are added instead of joined again every step
+			prefix_count, prefix = self._get_history_prefix()
+			return '\n'.join(([prefix] if prefix else []) + [item.to_string() for item in items[prefix_count:]])
 
 		# We have more items than the limit, so we need to omit some
 		omitted_count = total_items - self.max_history_items
@@ -150,14 +156,42 @@ class MessageManager:
 		recent_items_count = self.max_history_items - 1  # -1 for first item
 
 		items_to_include = [
-			self.state.agent_history_items[0].to_string(),  # Keep first item (initialization)
+			items[0].to_string(),  # Keep first item (initialization)
 			f'<sys>[... {omitted_count} previous steps omitted...]</sys>',
 		]
 		# Add most recent items
-		items_to_include.extend([item.to_string() for item in self.state.agent_history_items[-recent_items_count:]])
+		items_to_include.extend([item.to_string() for item in items[-recent_items_count:]])
 
 		return '\n'.join(items_to_include)
 
+	@property
+	def agent_history_prefix(self) -> str:
+		"""
+		The start of agent_history_description that stays the same in the following steps, for prompt caching.
+
+		The prefix covers whole chunks of HISTORY_CACHE_CHUNK_SIZE items, so it stays the same for that many steps and
+		then grows by a chunk, providers that cache prompt prefixes find the previous one at the block boundary.
+		Empty once max_history_items cuts the history, the window moves every step.
+		"""
+		return self._get_history_prefix()[1]
+
+	def _get_history_prefix(self) -> tuple[int, str]:
+		"""Number of items in agent_history_prefix and the prefix"""
+		items = self.state.agent_history_items
+		if self.max_history_items is not None and len(items) > self.max_history_items:
+			return 0, ''
+
+		prefix_count = len(items) // HISTORY_CACHE_CHUNK_SIZE * HISTORY_CACHE_CHUNK_SIZE
+		cached_items, cached_count, prefix = self._history_prefix
+		if cached_items is not items or cached_count > prefix_count:
+			# a different history (e.g. restored state), start over
+			cached_count, prefix = 0, ''
+		if cached_count < prefix_count:
+			# items are only appended, the new chunks are added to the rendered prefix
+			prefix = '\n'.join(([prefix] if prefix else []) + [item.to_string() for item in items[cached_count:prefix_count]])
+			self._history_prefix = (items, prefix_count, prefix)
+		return prefix_count, prefix
+
 	def add_new_task(self, new_task: str) -> None:
 		self.task = new_task
 		task_update_item = HistoryItem(system_message=f'User updated <user_request> to: {new_task}')
@@ -226,16 +260,7 @@ class MessageManager:
 			return ''
 
 		# Collect placeholders for sensitive data
-		placeholders: set[str] = set()
-
-		for key, value in sensitive_data.items():
-			if isinstance(value, dict):
-				# New format: {domain: {key: value}}
-				if match_url_with_domain_pattern(current_page_url, key, True):
-					placeholders.update(value.keys())
-			else:
-				# Old format: {key: value}
-				placeholders.add(key)
+		placeholders = self._get_sensitive_data_index(sensitive_data).placeholders_for_url(current_page_url)
 
 		if placeholders:
 			placeholder_list = sorted(list(placeholders))
@@ -282,6 +307,7 @@ class MessageManager:
 			browser_state_summary=browser_state_summary,
 			file_system=self.file_system,
 			agent_history_description=self.agent_history_description,
+			agent_history_prefix=self.agent_history_prefix,
 			read_state_description=self.state.read_state_description,
 			task=self.task,
 			include_attributes=self.include_attributes,
@@ -356,6 +382,10 @@ class MessageManager:
 		else:
 			raise ValueError(f'Invalid message type: {message_type}')
 
+	def _get_sensitive_data_index(self, sensitive_data: SensitiveData) -> SensitiveDataIndex:
+		self._sensitive_data_index = get_sensitive_data_index(sensitive_data, self._sensitive_data_index)
+		return self._sensitive_data_index
+
 	@time_execution_sync('--filter_sensitive_data')
 	def _filter_sensitive_data(self, message: BaseMessage) -> BaseMessage:
 		"""Filter out sensitive data from the message"""
@@ -364,36 +394,32 @@ class MessageManager:
 			if not self.sensitive_data:
 				return value
 
-			# Collect all sensitive values, immediately converting old format to new format
-			sensitive_values: dict[str, str] = {}
-
-			# Process all sensitive data entries
-			for key_or_domain, content in self.sensitive_data.items():
-				if isinstance(content, dict):
-					# Already in new format: {domain: {key: value}}
-					for key, val in content.items():
-						if val:  # Skip empty values
-							sensitive_values[key] = val
-				elif content:  # Old format: {key: value} - convert to new format internally
-					# We treat this as if it was {'http*://*': {key_or_domain: content}}
-					sensitive_values[key_or_domain] = content
+			index = self._get_sensitive_data_index(self.sensitive_data)
 
 			# If there are no valid sensitive data entries, just return the original value
-			if not sensitive_values:
+			if not index.redactions:
 				logger.warning('No valid entries found in sensitive_data dictionary')
 				return value
 
 			# Replace all valid sensitive data values with their placeholder tags
-			for key, val in sensitive_values.items():
-				value = value.replace(val, f'<secret>{key}</secret>')
+			return index.redact(value)
 
-			return value
+		def replace_sensitive_in_first_text(value: str) -> str:
+			if not isinstance(message, UserMessage) or not message.cache_prefix_length:
+				return replace_sensitive(value)
+			# the cacheable prefix is redacted on its own, its length changes with the redactions
+			prefix = replace_sensitive(value[: message.cache_prefix_length])
+			rest = replace_sensitive(value[message.cache_prefix_length :])
+			message.cache_prefix_length = len(prefix)
+			return prefix + rest
 
 		if isinstance(message.content, str):
-			message.content = replace_sensitive(message.content)
+			message.content = replace_sensitive_in_first_text(message.content)
 		elif isinstance(message.content, list):
+			first_text = True
 			for i, item in enumerate(message.content):
 				if isinstance(item, ContentPartTextParam):
-					item.text = replace_sensitive(item.text)
+					item.text = replace_sensitive_in_first_text(item.text) if first_text else replace_sensitive(item.text)
+					first_text = False
 					message.content[i] = item
 		return message
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from browser_use.llm.messages import (
 	BaseMessage,
@@ -25,6 +25,9 @@ class HistoryItem(BaseModel):
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	# items are not changed once they are added to the history, the string is only built once
+	_string: str | None = PrivateAttr(default=None)
+
 	def model_post_init(self, __context) -> None:
 		"""Validate that error and system_message are not both provided"""
 		if self.error is not None and self.system_message is not None:
@@ -32,6 +35,11 @@ class HistoryItem(BaseModel):
 
 	def to_string(self) -> str:
 		"""Get string representation of the history item"""
+		if self._string is None:
+			self._string = self._build_string()
+		return self._string
+
+	def _build_string(self) -> str:
 		step_str = f'step_{self.step_number}' if self.step_number is not None else 'step_unknown'
 
 		if self.error:
@@ -80,6 +80,7 @@ class AgentMessagePrompt:
 		browser_state_summary: 'BrowserStateSummary',
 		file_system: 'FileSystem',
 		agent_history_description: str | None = None,
+		agent_history_prefix: str | None = None,
 		read_state_description: str | None = None,
 		task: str | None = None,
 		include_attributes: list[str] | None = None,
@@ -93,6 +94,8 @@ class AgentMessagePrompt:
 		self.browser_state: 'BrowserStateSummary' = browser_state_summary
 		self.file_system: 'FileSystem | None' = file_system
 		self.agent_history_description: str | None = agent_history_description
+		# start of agent_history_description that is the same in the following steps, the prompt is cached up to its end
+		self.agent_history_prefix: str | None = agent_history_prefix
 		self.read_state_description: str | None = read_state_description
 		self.task: str | None = task
 		self.include_attributes = include_attributes
@@ -264,6 +267,12 @@ Interactive elements from top layer of the current page inside the viewport{trun
 			state_description += 'For this page, these additional actions are available:\n'
 			state_description += self.page_filtered_actions + '\n'
 
+		# the end of the history prefix, providers that support it (Anthropic) cache the prompt up to there
+		cache_prefix_length = None
+		history_start = '<agent_history>\n'
+		if self.agent_history_prefix and state_description.startswith(history_start + self.agent_history_prefix):
+			cache_prefix_length = len(history_start) + len(self.agent_history_prefix)
+
 		if use_vision is True and self.screenshots:
 			# Start with text description
 			content_parts: list[ContentPartTextParam | ContentPartImageParam] = [ContentPartTextParam(text=state_description)]
@@ -292,6 +301,6 @@ Interactive elements from top layer of the current page inside the viewport{trun
 					)
 				)
 
-			return UserMessage(content=content_parts)
+			return UserMessage(content=content_parts, cache_prefix_length=cache_prefix_length)
 
-		return UserMessage(content=state_description)
+		return UserMessage(content=state_description, cache_prefix_length=cache_prefix_length)
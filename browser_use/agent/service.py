@@ -25,11 +25,12 @@ from browser_use.agent.message_manager.utils import save_conversation
 from browser_use.dom.views import DEFAULT_INCLUDE_ATTRIBUTES
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.messages import BaseMessage, UserMessage
+from browser_use.llm.streaming import IncrementalJSONArrayParser
+from browser_use.llm.views import ChatInvokeCompletion
 from browser_use.tokens.service import TokenCost
 
 load_dotenv()
 
-from bubus import EventBus
 from pydantic import ValidationError
 from uuid_extensions import uuid7str
 
@@ -63,8 +64,10 @@ from browser_use.dom.history_tree_processor.service import (
 	HistoryTreeProcessor,
 )
 from browser_use.filesystem.file_system import FileSystem
+from browser_use.http_clients import release_shared_clients, retain_shared_clients
 from browser_use.observability import observe, observe_debug
 from browser_use.sync import CloudSync
+from browser_use.sync.wal import WALEventBus
 from browser_use.telemetry.service import ProductTelemetry
 from browser_use.telemetry.views import AgentTelemetryEvent
 from browser_use.utils import (
@@ -164,6 +167,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		available_file_paths: list[str] | None = None,
 		include_attributes: list[str] = DEFAULT_INCLUDE_ATTRIBUTES,
 		max_actions_per_step: int = 10,
+		stream_actions: bool = False,
 		use_thinking: bool = True,
 		flash_mode: bool = False,
 		max_history_items: int = 40,
@@ -247,6 +251,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			generate_gif=generate_gif,
 			include_attributes=include_attributes,
 			max_actions_per_step=max_actions_per_step,
+			stream_actions=stream_actions,
 			use_thinking=use_thinking,
 			flash_mode=flash_mode,
 			max_history_items=max_history_items,
@@ -439,12 +444,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Event bus with WAL persistence
 		# Default to ~/.config/browseruse/events/{agent_session_id}.jsonl
 		wal_path = CONFIG.BROWSER_USE_CONFIG_DIR / 'events' / f'{self.session_id}.jsonl'
-		self.eventbus = EventBus(name=f'Agent_{str(self.id)[-4:]}', wal_path=wal_path)
+		self.eventbus = WALEventBus(name=f'Agent_{str(self.id)[-4:]}', wal_path=wal_path)
 
 		# Cloud sync service
 		self.enable_cloud_sync = CONFIG.BROWSER_USE_CLOUD_SYNC
 		if self.enable_cloud_sync or cloud_sync is not None:
-			self.cloud_sync = cloud_sync or CloudSync()
+			self.cloud_sync = cloud_sync or CloudSync(background_upload=True)
 			# Register cloud sync handler
 			self.eventbus.on('*', self.cloud_sync.handle_event)
 
@@ -988,7 +993,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		"""Get next action from LLM based on current state"""
 
 		try:
-			response = await self.llm.ainvoke(input_messages, output_format=self.AgentOutput)
+			if self.settings.stream_actions and hasattr(self.llm, 'ainvoke_streaming'):
+				response = await self._get_streamed_model_output(input_messages)
+			else:
+				response = await self.llm.ainvoke(input_messages, output_format=self.AgentOutput)
 			parsed = response.completion
 
 			# cut the number of actions to max_actions_per_step if needed
@@ -1004,6 +1012,34 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Just re-raise - Pydantic's validation errors are already descriptive
 			raise
 
+	async def _get_streamed_model_output(self, input_messages: list[BaseMessage]) -> ChatInvokeCompletion[AgentOutput]:
+		"""
+		Stream the LLM output and pick the actions out of it as they complete.
+
+		Only the first action is acted on early: its target element is located while the remaining actions are still
+		being generated, so executing it doesn't have to wait for that lookup. Later actions may depend on the page
+		changes made by the first one, they are only looked at once the whole output has been validated.
+		"""
+		parser = IncrementalJSONArrayParser(array_key='action')
+		selector_map = await self.browser_session.get_selector_map() if self.browser_session else {}
+		start_time = time.monotonic()
+
+		def on_delta(delta: str) -> None:
+			# nothing left to do once the first action is in
+			if parser.items or not parser.feed(delta):
+				return
+			try:
+				first_action = self.ActionModel.model_validate(parser.items[0])
+			except ValidationError:
+				return  # reported by the final validation of the whole output
+			self.logger.debug(f'⚡ First action streamed in after {time.monotonic() - start_time:.2f}s')
+
+			index = first_action.get_index()
+			if index is not None and index in selector_map and self.browser_session:
+				self.browser_session.prewarm_element(selector_map[index])
+
+		return await self.llm.ainvoke_streaming(input_messages, self.AgentOutput, on_delta)
+
 	def _log_agent_run(self) -> None:
 		"""Log the agent run"""
 		self.logger.info(f'🚀 Starting task: {self.task}')
@@ -1180,6 +1216,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			exit_on_second_int=True,
 		)
 		signal_handler.register()
+		retain_shared_clients()
 
 		try:
 			self._log_agent_run()
@@ -1361,8 +1398,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Use longer timeout to avoid deadlocks in tests with multiple agents
 			await self.eventbus.stop(timeout=10.0)
 
+			# Upload the events the cloud sync handler queued up (sent in the background with background_upload=True)
+			if hasattr(self, 'cloud_sync'):
+				await self.cloud_sync.flush(timeout=10.0)
+
 			await self.close()
 
+			# close the LLM/HTTP connection pools once no other agent in this event loop is running anymore
+			await release_shared_clients()
+
 	@observe_debug(ignore_input=True, ignore_output=True)
 	@time_execution_async('--multi_act')
 	async def multi_act(
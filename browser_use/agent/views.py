@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import traceback
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generic
 
@@ -12,6 +13,7 @@ from typing_extensions import TypeVar
 from uuid_extensions import uuid7str
 
 from browser_use.agent.message_manager.views import MessageManagerState
+from browser_use.browser.screenshot_store import ScreenshotBlob, ScreenshotFormat
 from browser_use.browser.views import BrowserStateHistory
 from browser_use.controller.registry.views import ActionModel
 from browser_use.dom.history_tree_processor.service import (
@@ -24,6 +26,10 @@ from browser_use.filesystem.file_system import FileSystemState
 from browser_use.llm.base import BaseChatModel
 from browser_use.tokens.views import UsageSummary
 
+# the action models are cached per action set by the Registry, the same one always gets the same AgentOutput model
+# (bounded, so the models of agents that are done can be garbage collected in long-running processes)
+AGENT_OUTPUT_CACHE_SIZE = 64
+
 
 class AgentSettings(BaseModel):
 	"""Configuration options for the Agent"""
@@ -52,6 +58,7 @@ class AgentSettings(BaseModel):
 		'aria-expanded',
 	]
 	max_actions_per_step: int = 10
+	stream_actions: bool = False  # Stream the LLM output and start locating the first action's element before the rest arrives
 	use_thinking: bool = True
 	flash_mode: bool = False  # If enabled, disables evaluation_previous_goal and next_goal, and sets use_thinking = False
 	max_history_items: int = 40
@@ -182,6 +189,7 @@ class AgentOutput(BaseModel):
 		)
 
 	@staticmethod
+	@lru_cache(maxsize=AGENT_OUTPUT_CACHE_SIZE)
 	def type_with_custom_actions(custom_actions: type[ActionModel]) -> type[AgentOutput]:
 		"""Extend actions with custom actions"""
 
@@ -198,6 +206,7 @@ class AgentOutput(BaseModel):
 		return model_
 
 	@staticmethod
+	@lru_cache(maxsize=AGENT_OUTPUT_CACHE_SIZE)
 	def type_with_custom_actions_no_thinking(custom_actions: type[ActionModel]) -> type[AgentOutput]:
 		"""Extend actions with custom actions and exclude thinking field"""
 
@@ -223,6 +232,7 @@ class AgentOutput(BaseModel):
 		return model
 
 	@staticmethod
+	@lru_cache(maxsize=AGENT_OUTPUT_CACHE_SIZE)
 	def type_with_custom_actions_flash_mode(custom_actions: type[ActionModel]) -> type[AgentOutput]:
 		"""Extend actions with custom actions for flash mode - memory and action fields only"""
 
@@ -274,7 +284,7 @@ class AgentHistory(BaseModel):
 				elements.append(None)
 		return elements
 
-	def model_dump(self, **kwargs) -> dict[str, Any]:
+	def model_dump(self, include_screenshot: bool = True, **kwargs) -> dict[str, Any]:
 		"""Custom serialization handling circular references"""
 
 		# Handle action serialization
@@ -294,7 +304,7 @@ class AgentHistory(BaseModel):
 		return {
 			'model_output': model_output_dump,
 			'result': [r.model_dump(exclude_none=True) for r in self.result],
-			'state': self.state.to_dict(),
+			'state': self.state.to_dict(include_screenshot=include_screenshot),
 			'metadata': self.metadata.model_dump() if self.metadata else None,
 		}
 
@@ -330,15 +340,31 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 		"""Representation of the AgentHistoryList object"""
 		return self.__str__()
 
-	def save_to_file(self, filepath: str | Path) -> None:
-		"""Save history to JSON file with proper serialization"""
-		try:
-			Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-			data = self.model_dump()
-			with open(filepath, 'w', encoding='utf-8') as f:
-				json.dump(data, f, indent=2)
-		except Exception as e:
-			raise e
+	def save_to_file(self, filepath: str | Path, screenshot_format: ScreenshotFormat = 'png') -> None:
+		"""
+		Save history to JSON file with proper serialization
+
+		Screenshots are not inlined into the JSON, they are written once per unique screenshot to a
+		`<name>_screenshots/` directory next to the file and referenced by their `screenshot_path`.
+		Pass screenshot_format='webp' or 'jpeg' to recompress them (requires Pillow).
+		"""
+		filepath = Path(filepath)
+		filepath.parent.mkdir(parents=True, exist_ok=True)
+		screenshots_dir = filepath.parent / f'{filepath.stem}_screenshots'
+
+		# write item by item instead of building one big dict of the whole history
+		with open(filepath, 'w', encoding='utf-8') as f:
+			f.write('{\n  "history": [')
+			for i, h in enumerate(self.history):
+				item = h.model_dump(include_screenshot=False)
+				blob = h.state.screenshot_blob
+				if blob is not None:
+					screenshots_dir.mkdir(exist_ok=True)
+					if (screenshot_path := blob.save(screenshots_dir, screenshot_format)) is not None:
+						item['state']['screenshot_path'] = screenshot_path.relative_to(filepath.parent).as_posix()
+				f.write(',\n    ' if i else '\n    ')
+				f.write(json.dumps(item, indent=2).replace('\n', '\n    '))
+			f.write('\n  ]\n}\n')
 
 	# def save_as_playwright_script(
 	# 	self,
@@ -380,7 +406,8 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 
 	@classmethod
 	def load_from_file(cls, filepath: str | Path, output_model: type[AgentOutput]) -> AgentHistoryList:
-		"""Load history from JSON file"""
+		"""Load history from JSON file, screenshots saved next to it are only read when they are accessed"""
+		filepath = Path(filepath)
 		with open(filepath, encoding='utf-8') as f:
 			data = json.load(f)
 		# loop through history and validate output_model actions to enrich with custom actions
@@ -393,6 +420,13 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 			if 'interacted_element' not in h['state']:
 				h['state']['interacted_element'] = None
 		history = cls.model_validate(data)
+
+		for item, h in zip(history.history, data['history']):
+			if screenshot_path := h['state'].get('screenshot_path'):
+				# a history copied without its <name>_screenshots/ dir loads without the missing screenshots
+				screenshot_file = filepath.parent / screenshot_path
+				if screenshot_file.exists():
+					item.state.screenshot = ScreenshotBlob.from_file(screenshot_file)  # type: ignore[assignment]
 		return history
 
 	def last_action(self) -> None | dict:
@@ -0,0 +1,95 @@
+import asyncio
+import weakref
+
+from browser_use.browser.types import Browser, CDPSession, Page
+
+
+class CDPSessionPool:
+	"""
+	Keeps one CDP session open per page and hands it out to all the low-level CDP helpers of a BrowserSession.
+
+	Attaching a CDP session costs a round trip to the browser, so instead of new_cdp_session() + detach() around
+	every screenshot/scroll, sessions are created on first use and kept until the page closes or crashes,
+	or until the caller discards a session that stopped working.
+	"""
+
+	def __init__(self):
+		# page -> task creating/holding its session, concurrent get() calls for the same page share one attach
+		self._sessions: weakref.WeakKeyDictionary[Page, asyncio.Task[CDPSession]] = weakref.WeakKeyDictionary()
+		# same for the browser-level session
+		self._browser_session: asyncio.Task[CDPSession] | None = None
+
+	def __len__(self) -> int:
+		return len(self._sessions)
+
+	def __contains__(self, page: Page) -> bool:
+		return page in self._sessions
+
+	async def get(self, page: Page) -> CDPSession:
+		"""Get the CDP session attached to a page, attaching a new one if there is none yet"""
+		task = self._sessions.get(page)
+		if task is None:
+			task = asyncio.ensure_future(page.context.new_cdp_session(page))  # type: ignore
+			self._sessions[page] = task
+			# drop the session together with the page, the target (and with it the session) is gone
+			page.on('close', self._on_page_gone)
+			page.on('crash', self._on_page_gone)
+
+		try:
+			return await asyncio.shield(task)
+		except Exception:
+			# failed to attach (e.g. the page closed in the meantime), let the next caller try again
+			if self._sessions.get(page) is task:
+				self._forget(page)
+			raise
+
+	async def get_browser_session(self, browser: Browser) -> CDPSession:
+		"""Get a browser-level CDP session, for Target.* commands that should not depend on any page being healthy"""
+		task = self._browser_session
+		if task is None:
+			task = self._browser_session = asyncio.ensure_future(browser.new_browser_cdp_session())  # type: ignore
+
+		try:
+			return await asyncio.shield(task)
+		except Exception:
+			if self._browser_session is task:
+				self._browser_session = None
+			raise
+
+	async def discard(self, page: Page, detach: bool = True) -> None:
+		"""Forget the session of a page, e.g. after a CDP call on it failed or before the page gets force-closed"""
+		task = self._forget(page)
+		if task is not None and detach:
+			await self._detach(task)
+
+	async def discard_browser_session(self) -> None:
+		task, self._browser_session = self._browser_session, None
+		if task is not None:
+			await self._detach(task)
+
+	async def close(self) -> None:
+		"""Detach all pooled sessions"""
+		tasks = [self._forget(page) for page in list(self._sessions.keys())]
+		await asyncio.gather(*(self._detach(task) for task in tasks if task is not None), self.discard_browser_session())
+
+	def _forget(self, page: Page) -> asyncio.Task[CDPSession] | None:
+		task = self._sessions.pop(page, None)
+		if task is not None:
+			page.remove_listener('close', self._on_page_gone)
+			page.remove_listener('crash', self._on_page_gone)
+		return task
+
+	def _on_page_gone(self, page: Page) -> None:
+		# no need to detach, the session went away together with the target
+		self._forget(page)
+
+	@staticmethod
+	async def _detach(task: asyncio.Task[CDPSession]) -> None:
+		await asyncio.wait({task}, timeout=1.0)
+		if not task.done() or task.cancelled() or task.exception() is not None:
+			return
+		try:
+			await asyncio.wait_for(task.result().detach(), timeout=1.0)
+		except Exception:
+			# already detached or the target is gone
+			pass
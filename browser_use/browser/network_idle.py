@@ -0,0 +1,233 @@
+import asyncio
+import re
+from typing import Any
+
+# Define relevant resource types and content types
+RELEVANT_RESOURCE_TYPES = frozenset(
+	{
+		'document',
+		'stylesheet',
+		'image',
+		'font',
+		'script',
+		'iframe',
+	}
+)
+
+RELEVANT_CONTENT_TYPES = (
+	'text/html',
+	'text/css',
+	'application/javascript',
+	'image/',
+	'font/',
+	'application/json',
+)
+
+STREAMING_CONTENT_TYPES = (
+	'streaming',
+	'video',
+	'audio',
+	'webm',
+	'mp4',
+	'event-stream',
+	'websocket',
+	'protobuf',
+)
+
+# Additional patterns to filter out
+IGNORED_URL_PATTERNS = (
+	# Analytics and tracking
+	'analytics',
+	'tracking',
+	'telemetry',
+	'beacon',
+	'metrics',
+	# Ad-related
+	'doubleclick',
+	'adsystem',
+	'adserver',
+	'advertising',
+	# Social media widgets
+	'facebook.com/plugins',
+	'platform.twitter',
+	'linkedin.com/embed',
+	# Live chat and support
+	'livechat',
+	'zendesk',
+	'intercom',
+	'crisp.chat',
+	'hotjar',
+	# Push notifications
+	'push-notifications',
+	'onesignal',
+	'pushwoosh',
+	# Background sync/heartbeat
+	'heartbeat',
+	'ping',
+	'alive',
+	# WebRTC and streaming
+	'webrtc',
+	'rtmp://',
+	'wss://',
+	# Common CDNs for dynamic content
+	'cloudfront.net',
+	'fastly.net',
+)
+
+
+def _compile_substring_filter(patterns: tuple[str, ...]) -> re.Pattern[str]:
+	"""
+	One regex that matches if any of the substrings occurs, instead of a python-level any() over all of them.
+
+	The alternation is built from a trie of the patterns (e.g. `ad(?:s(?:erver|ystem)|vertising)`), so the regex engine
+	only tries the patterns that share the current prefix instead of every pattern at every position.
+	"""
+	trie: dict[str, dict] = {}
+	for pattern in patterns:
+		node = trie
+		for char in pattern:
+			node = node.setdefault(char, {})
+		node[''] = {}  # end of a pattern
+
+	def to_regex(node: dict[str, dict]) -> str:
+		if '' in node:
+			# a complete pattern ends here, anything longer is redundant for a substring search
+			return ''
+		alternatives = [re.escape(char) + to_regex(child) for char, child in sorted(node.items())]
+		if len(alternatives) == 1:
+			return alternatives[0]
+		return '(?:' + '|'.join(alternatives) + ')'
+
+	return re.compile(to_regex(trie))
+
+
+IGNORED_URL_REGEX = _compile_substring_filter(IGNORED_URL_PATTERNS)
+RELEVANT_CONTENT_TYPE_REGEX = _compile_substring_filter(RELEVANT_CONTENT_TYPES)
+STREAMING_CONTENT_TYPE_REGEX = _compile_substring_filter(STREAMING_CONTENT_TYPES)
+
+
+def is_relevant_request(resource_type: str, url: str, headers: dict[str, str]) -> bool:
+	"""Whether a request is part of the page load, as opposed to tracking, streaming or background traffic"""
+	# Filter by resource type, this also drops websocket, media, eventsource, manifest and other requests
+	if resource_type not in RELEVANT_RESOURCE_TYPES:
+		return False
+
+	# Filter out data URLs and blob URLs
+	url = url.lower()
+	if url.startswith(('data:', 'blob:')):
+		return False
+
+	# Filter out by URL patterns
+	if IGNORED_URL_REGEX.search(url):
+		return False
+
+	# Filter out requests with certain headers
+	if headers.get('purpose') == 'prefetch' or headers.get('sec-fetch-dest') in ('video', 'audio'):
+		return False
+
+	return True
+
+
+def is_relevant_response(headers: dict[str, str]) -> bool:
+	"""Whether a response counts as page load activity, based on its content type and size"""
+	content_type = headers.get('content-type', '').lower()
+
+	# Skip if content type indicates streaming or real-time data
+	if STREAMING_CONTENT_TYPE_REGEX.search(content_type):
+		return False
+
+	# Only process relevant content types
+	if not RELEVANT_CONTENT_TYPE_REGEX.search(content_type):
+		return False
+
+	# Skip if response is too large (likely not essential for page load)
+	content_length = headers.get('content-length')
+	if content_length and content_length.isdigit() and int(content_length) > 5 * 1024 * 1024:  # 5MB
+		return False
+
+	return True
+
+
+class NetworkIdleDetector:
+	"""
+	Tracks the in-flight page load requests of a page and waits until the network has been quiet for `idle_time` seconds.
+
+	Instead of polling, wait() sleeps until either the last pending request finishes or the quiet window expires.
+
+	Usage:
+		detector = NetworkIdleDetector(idle_time=0.5, timeout=5)
+		detector.attach(page)
+		try:
+			is_idle = await detector.wait()
+		finally:
+			detector.detach(page)
+	"""
+
+	def __init__(self, idle_time: float, timeout: float):
+		self.idle_time = idle_time
+		self.timeout = timeout
+
+		self.pending_requests: set[Any] = set()
+		self._loop = asyncio.get_running_loop()
+		self.last_activity = self._loop.time()
+		# set whenever the last pending request finishes
+		self._drained = asyncio.Event()
+
+	def attach(self, page: Any) -> None:
+		page.on('request', self.on_request)
+		page.on('response', self.on_response)
+		page.on('requestfailed', self.on_request_failed)
+
+	def detach(self, page: Any) -> None:
+		page.remove_listener('request', self.on_request)
+		page.remove_listener('response', self.on_response)
+		page.remove_listener('requestfailed', self.on_request_failed)
+
+	def on_request(self, request: Any) -> None:
+		if not is_relevant_request(request.resource_type, request.url, request.headers):
+			return
+
+		self.pending_requests.add(request)
+		self.last_activity = self._loop.time()
+
+	def on_response(self, response: Any) -> None:
+		request = response.request
+		if request not in self.pending_requests:
+			return
+
+		if is_relevant_response(response.headers):
+			self.last_activity = self._loop.time()
+		self._finish(request)
+
+	def on_request_failed(self, request: Any) -> None:
+		# failed requests never get a response, without this they would stay pending until the timeout
+		if request in self.pending_requests:
+			self._finish(request)
+
+	def _finish(self, request: Any) -> None:
+		self.pending_requests.discard(request)
+		if not self.pending_requests:
+			self._drained.set()
+
+	async def wait(self) -> bool:
+		"""Wait for the network to become idle, returns False if the timeout was hit first"""
+		deadline = self._loop.time() + self.timeout
+
+		while True:
+			now = self._loop.time()
+			if self.pending_requests:
+				wake_at = deadline
+			else:
+				# requests that start during the quiet window are picked up when it expires
+				wake_at = self.last_activity + self.idle_time
+				if now >= wake_at:
+					return True
+
+			if now >= deadline:
+				return False
+
+			self._drained.clear()
+			try:
+				await asyncio.wait_for(self._drained.wait(), timeout=min(wake_at, deadline) - now)
+			except TimeoutError:
+				pass
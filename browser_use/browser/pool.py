@@ -0,0 +1,189 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Self
+
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0  # seconds between two health checks of the idle browsers
+
+
+class BrowserPool:
+	"""
+	Keeps size started BrowserSessions warm and hands them out to Agents, instead of launching a new browser per task.
+
+	Starting a browser (playwright, user_data_dir, chrome subprocess, waiting for CDP) takes seconds, which dominates
+	short tasks. Sessions that are given back are reset (tabs closed, cookies/storage cleared) and reused
+	instead of being killed, idle ones are health-checked in the background and replaced when they die.
+	When more than size sessions are in use at once, the extra ones are launched on demand and killed when given back.
+	With a start_url, idle browsers wait on that page already loaded, e.g. the site all tasks of a job queue start on.
+
+	Usage:
+		async with BrowserPool(browser_profile, size=4, start_url='https://example.com') as pool:
+			async with pool.session() as browser_session:
+				agent = Agent(task=..., llm=..., browser_session=browser_session)
+				await agent.run()
+	"""
+
+	def __init__(
+		self,
+		browser_profile: BrowserProfile | None = None,
+		size: int = DEFAULT_POOL_SIZE,
+		health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+		start_url: str | None = None,
+	):
+		assert size >= 0, 'size must be >= 0'
+		# each pooled browser gets its own temporary user_data_dir, several browsers can't share one profile dir
+		self.browser_profile = browser_profile or BrowserProfile(user_data_dir=None)
+		self.size = size
+		self.health_check_interval = health_check_interval
+		self.start_url = start_url
+
+		self._idle: list[BrowserSession] = []
+		# by id(), BrowserSession is unhashable and its __eq__ compares connections, not instances
+		self._in_use: dict[int, BrowserSession] = {}
+		self._launching: set[asyncio.Task[BrowserSession]] = set()
+		self._health_check_task: asyncio.Task[None] | None = None
+		self._closed = False
+
+	def __repr__(self) -> str:
+		return (
+			f'BrowserPool(size={self.size}, idle={len(self._idle)}, in_use={len(self._in_use)}, launching={len(self._launching)})'
+		)
+
+	async def __aenter__(self) -> Self:
+		return await self.start()
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.stop()
+
+	async def start(self) -> Self:
+		"""Launch the warm browsers and start the background health checks"""
+		self._closed = False
+		self._fill()
+		if self._launching:
+			await asyncio.wait(set(self._launching))
+		if self._health_check_task is None or self._health_check_task.done():
+			self._health_check_task = asyncio.create_task(self._health_check_loop())
+		return self
+
+	async def stop(self) -> None:
+		"""Kill all browsers of the pool, including the ones that are still handed out"""
+		self._closed = True
+		if self._health_check_task is not None:
+			self._health_check_task.cancel()
+			await asyncio.gather(self._health_check_task, return_exceptions=True)
+			self._health_check_task = None
+		if self._launching:
+			await asyncio.wait(set(self._launching))
+
+		browser_sessions = [*self._idle, *self._in_use.values()]
+		self._idle.clear()
+		self._in_use.clear()
+		await asyncio.gather(*(self._kill(browser_session) for browser_session in browser_sessions))
+
+	async def acquire(self) -> BrowserSession:
+		"""Get a started BrowserSession for exclusive use, launches a new one if no warm browser is available"""
+		assert not self._closed, 'BrowserPool is stopped'
+		browser_session = None
+		while browser_session is None:
+			while self._idle:
+				candidate = self._idle.pop()
+				if await candidate.is_connected(restart=False):
+					browser_session = candidate
+					break
+				logger.warning(f'💔 Pooled browser {candidate} has gone away, discarding it')
+				await self._kill(candidate)
+			if browser_session is not None or not self._launching:
+				break
+			# a browser that is already half-way launched is ready sooner than a new one
+			await asyncio.wait(set(self._launching), return_when=asyncio.FIRST_COMPLETED)
+
+		if browser_session is None:
+			browser_session = await self._launch()
+
+		self._in_use[id(browser_session)] = browser_session
+		self._fill()  # replace the dead ones that were discarded
+		return browser_session
+
+	async def release(self, browser_session: BrowserSession) -> None:
+		"""Give back a BrowserSession from acquire(), it gets reset and reused, or killed if the pool is full"""
+		self._in_use.pop(id(browser_session), None)
+		if self._closed or self._count() >= self.size:
+			await self._kill(browser_session)
+			return
+
+		try:
+			await browser_session.reset(start_url=self.start_url)
+		except Exception as e:
+			logger.warning(f'⚠️ Failed to reset pooled browser {browser_session}, discarding it: {type(e).__name__}: {e}')
+			await self._kill(browser_session)
+			self._fill()
+			return
+		self._idle.append(browser_session)
+
+	@asynccontextmanager
+	async def session(self) -> AsyncIterator[BrowserSession]:
+		"""acquire() a BrowserSession for the duration of the block and release() it afterwards"""
+		browser_session = await self.acquire()
+		try:
+			yield browser_session
+		finally:
+			await self.release(browser_session)
+
+	def _count(self) -> int:
+		return len(self._idle) + len(self._in_use) + len(self._launching)
+
+	def _fill(self) -> None:
+		"""Launch browsers in the background until the pool has size browsers again"""
+		missing = self.size - self._count()
+		for _ in range(max(missing, 0)):
+			task = asyncio.create_task(self._launch())
+			self._launching.add(task)
+			task.add_done_callback(self._on_launched)
+
+	def _on_launched(self, task: asyncio.Task[BrowserSession]) -> None:
+		self._launching.discard(task)
+		if task.cancelled():
+			return
+		if task.exception() is not None:
+			logger.warning(f'⚠️ Failed to launch a pooled browser: {type(task.exception()).__name__}: {task.exception()}')
+			return
+		self._idle.append(task.result())  # stop() waits for the launches, so it kills this one too when the pool is closed
+
+	async def _launch(self) -> BrowserSession:
+		# keep_alive=True so Agent.close() / BrowserSession.stop() leave the browser running for the next task
+		browser_session = BrowserSession(browser_profile=self.browser_profile, keep_alive=True)
+		await browser_session.start()
+		if self.start_url:
+			await browser_session.navigate(self.start_url)
+		return browser_session
+
+	async def _health_check_loop(self) -> None:
+		while True:
+			await asyncio.sleep(self.health_check_interval)
+			await self.check_health()
+
+	async def check_health(self) -> None:
+		"""Replace the idle browsers that crashed or got disconnected"""
+		for browser_session in list(self._idle):
+			if await browser_session.is_connected(restart=False):
+				continue
+			if not any(idle is browser_session for idle in self._idle):
+				continue  # handed out while we were checking the others
+			logger.warning(f'💔 Pooled browser {browser_session} has gone away, replacing it')
+			self._idle = [idle for idle in self._idle if idle is not browser_session]
+			await self._kill(browser_session)
+		self._fill()
+
+	@staticmethod
+	async def _kill(browser_session: BrowserSession) -> None:
+		try:
+			await browser_session.kill()
+		except Exception as e:
+			logger.debug(f'❌ Error killing pooled browser {browser_session}: {type(e).__name__}: {e}')
@@ -581,8 +581,28 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	include_dynamic_attributes: bool = Field(default=True, description='Include dynamic attributes in selectors.')
 	highlight_elements: bool = Field(default=True, description='Highlight interactive elements on the page.')
 	viewport_expansion: int = Field(default=500, description='Viewport expansion in pixels for LLM context.')
+	incremental_dom_snapshots: bool = Field(
+		default=False,
+		description='Keep DOM node IDs on the page between steps and only re-send the nodes that changed since the last step.',
+	)
+	compact_dom_tree: bool = Field(
+		default=False,
+		description='Store the extracted DOM tree in a columnar arena instead of one Python object per node (lower memory use).',
+	)
 
 	profile_directory: str = 'Default'  # e.g. 'Profile 1', 'Profile 2', 'Custom Profile', etc.
+	user_data_dir_template: str | Path | None = Field(
+		default=None,
+		description='Profile dir (e.g. a logged-in one) to clone into a new temporary user_data_dir for every launch, instead of using user_data_dir. Lets parallel browsers start from the same profile.',
+	)
+	keep_user_data_dir_clone: bool = Field(
+		default=False,
+		description='Keep the clone of user_data_dir_template after the browser is stopped, instead of deleting it.',
+	)
+	user_data_dir_clone_dir: str | Path | None = Field(
+		default=None,
+		description='Dir to create the clones of user_data_dir_template in, defaults to the dir the template is in. Reflinks only work within one filesystem, clones on another one are full copies.',
+	)
 
 	# these can be found in BrowserLaunchArgs, BrowserLaunchPersistentContextArgs, BrowserNewContextArgs, BrowserConnectArgs:
 	# save_recording_path: alias of record_video_dir
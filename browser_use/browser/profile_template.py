@@ -0,0 +1,106 @@
+"""
+Cloning of a template user_data_dir (e.g. a logged-in "golden" profile) into a new user_data_dir per browser.
+
+Chrome locks its user_data_dir, so parallel browsers can't share one profile. Instead each of them gets its own copy,
+made with copy-on-write reflinks where the filesystem supports them (btrfs, xfs, APFS, ...) so cloning a large
+profile takes milliseconds and no extra disk space, and with regular copies everywhere else.
+
+Hardlinks are not an option: chrome writes its sqlite and leveldb files in place, which would change the template.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import shutil
+import sys
+from functools import cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# files that belong to the running browser that used the template, not to the profile
+SKIPPED_FILES = {'SingletonLock', 'SingletonSocket', 'SingletonCookie', 'DevToolsActivePort', '.browseruse_profile_id'}
+# caches chrome rebuilds by itself, usually the bulk of a profile's size
+SKIPPED_DIRS = {'Cache', 'Code Cache', 'GPUCache', 'GrShaderCache', 'ShaderCache', 'GraphiteDawnCache', 'Crashpad'}
+
+FICLONE = 0x40049409  # linux ioctl, from <linux/fs.h>
+REFLINK_UNSUPPORTED_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS}
+
+_warned_copies: set[Path] = set()  # templates that were cloned with full copies
+
+
+def clone_user_data_dir(template_dir: str | Path, user_data_dir: str | Path) -> None:
+	"""Clone the profile in template_dir into user_data_dir (which may exist but should be empty)"""
+	template_dir = Path(template_dir).expanduser().resolve()
+	if not template_dir.is_dir():
+		raise ValueError(f'user_data_dir_template= {template_dir} is not a directory')
+	reflinks = _Reflinks()
+	shutil.copytree(
+		template_dir,
+		user_data_dir,
+		symlinks=True,
+		ignore=_ignore_browser_state,
+		copy_function=reflinks.clone,
+		dirs_exist_ok=True,
+	)
+	logger.debug(
+		f'🐑 Cloned user_data_dir_template= {template_dir} ({reflinks.reflinked} files reflinked, {reflinks.copied} copied)'
+	)
+	if reflinks.unsupported is not None and template_dir not in _warned_copies:
+		_warned_copies.add(template_dir)  # once per template, not on every launch
+		logger.warning(
+			f'⚠️ Cloned user_data_dir_template= {template_dir} to {user_data_dir} with full copies, reflinks are not '
+			f'possible there ({reflinks.unsupported.strerror}). Put the clones on the same copy-on-write filesystem '
+			'(btrfs, xfs, APFS, ...) as the template with user_data_dir_clone_dir= to make cloning instant.'
+		)
+
+
+def _ignore_browser_state(directory: str, names: list[str]) -> set[str]:
+	return {
+		name for name in names if name in SKIPPED_FILES or (name in SKIPPED_DIRS and os.path.isdir(os.path.join(directory, name)))
+	}
+
+
+class _Reflinks:
+	"""copytree copy_function that reflinks files, and copies them once the filesystem turns out not to support it"""
+
+	def __init__(self):
+		self.unsupported: OSError | None = None  # why reflinks failed
+		self.reflinked = 0
+		self.copied = 0
+
+	def clone(self, src: str, dst: str) -> str:
+		if self.unsupported is None:
+			try:
+				_reflink(src, dst)
+				shutil.copystat(src, dst)
+				self.reflinked += 1
+				return dst
+			except OSError as e:
+				if e.errno not in REFLINK_UNSUPPORTED_ERRNOS:
+					raise
+				self.unsupported = e  # all files of a profile are on the same filesystem, don't try again
+		shutil.copy2(src, dst)
+		self.copied += 1
+		return dst
+
+
+def _reflink(src: str, dst: str) -> None:
+	if sys.platform == 'linux':
+		import fcntl
+
+		with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+			fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+	elif sys.platform == 'darwin':
+		if _libc().clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+			error = ctypes.get_errno()
+			raise OSError(error, os.strerror(error), src)
+	else:
+		raise OSError(errno.EOPNOTSUPP, 'reflinks are not supported on this platform', src)
+
+
+@cache
+def _libc() -> ctypes.CDLL:
+	return ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
@@ -0,0 +1,132 @@
+"""
+Content-addressed storage for the screenshots kept in the agent history.
+
+Screenshots are held as decoded image bytes instead of base64 strings (~25% smaller), identical screenshots
+(e.g. steps that did not change the page) share a single blob, and blobs loaded from a saved history are only
+read from disk when they are actually accessed.
+"""
+
+import base64
+import hashlib
+import io
+import weakref
+from pathlib import Path
+from typing import Any, Literal
+
+ScreenshotFormat = Literal['png', 'webp', 'jpeg']
+
+
+class ScreenshotBlob:
+	"""One screenshot, identified by the sha256 of its (original PNG) bytes"""
+
+	__slots__ = ('digest', '_data', 'path', '__weakref__')
+
+	# digest -> blob, while any history item still references it
+	_interned: 'weakref.WeakValueDictionary[str, ScreenshotBlob]' = weakref.WeakValueDictionary()
+
+	def __init__(self, digest: str, data: bytes | None = None, path: Path | None = None):
+		assert data is not None or path is not None, 'ScreenshotBlob needs either data or a path to load it from'
+		self.digest = digest
+		self._data = data
+		self.path = path
+
+	def __repr__(self) -> str:
+		return f'ScreenshotBlob({self.digest[:12]}, {"in memory" if self._data is not None else self.path})'
+
+	@classmethod
+	def from_base64(cls, screenshot_b64: str) -> 'ScreenshotBlob':
+		data = base64.b64decode(screenshot_b64)
+		digest = hashlib.sha256(data).hexdigest()
+		blob = cls._interned.get(digest)
+		if blob is None:
+			blob = cls._interned[digest] = cls(digest, data=data)
+		return blob
+
+	@classmethod
+	def from_file(cls, path: Path) -> 'ScreenshotBlob':
+		"""Reference a saved blob without reading it, the file name is its digest"""
+		digest = path.stem
+		blob = cls._interned.get(digest)
+		if blob is None:
+			blob = cls._interned[digest] = cls(digest, path=path)
+		return blob
+
+	@property
+	def data(self) -> bytes | None:
+		"""The image bytes, None if the blob file was deleted since the history was loaded"""
+		if self._data is not None:
+			return self._data
+		assert self.path is not None
+		# not cached, lazily loaded histories should stay small in memory
+		try:
+			return self.path.read_bytes()
+		except FileNotFoundError:
+			return None
+
+	def to_base64(self) -> str | None:
+		data = self.data
+		return base64.b64encode(data).decode() if data is not None else None
+
+	def save(self, directory: Path, screenshot_format: ScreenshotFormat = 'png') -> Path | None:
+		"""Write the blob to directory/<digest>.<format> unless it is already there, returns the file path (None if the blob is missing)"""
+		if self.path is not None and self.path.parent == directory and self.path.exists():
+			return self.path
+
+		# blobs loaded from a history saved as webp/jpeg can't go back to png, keep them as they are
+		source_format = self.path.suffix[1:] if self._data is None and self.path is not None else 'png'
+		if source_format != 'png':
+			screenshot_format = source_format  # type: ignore[assignment]
+
+		path = directory / f'{self.digest}.{screenshot_format}'
+		if not path.exists():
+			data = self.data
+			if data is None:
+				return None
+			if screenshot_format != source_format:
+				data = _recompress(data, screenshot_format)
+			tmp_path = path.with_suffix('.tmp')
+			tmp_path.write_bytes(data)
+			tmp_path.replace(path)
+		return path
+
+
+def _recompress(png_data: bytes, screenshot_format: ScreenshotFormat) -> bytes:
+	try:
+		from PIL import Image
+	except ImportError as e:
+		raise ImportError(f'Saving screenshots as {screenshot_format} requires Pillow: pip install pillow') from e
+
+	image = Image.open(io.BytesIO(png_data))
+	if screenshot_format == 'jpeg':
+		image = image.convert('RGB')
+	output = io.BytesIO()
+	image.save(output, format=screenshot_format.upper(), quality=80)
+	return output.getvalue()
+
+
+class ScreenshotField:
+	"""
+	Dataclass field descriptor that keeps a base64 screenshot as a ScreenshotBlob.
+
+	Reading the field still returns the base64 string (or None), assigning accepts a base64 string, a ScreenshotBlob
+	or None. Values written straight into __dict__ (as pydantic does when validating dataclasses) are converted on
+	first access.
+	"""
+
+	def __set_name__(self, owner: type, name: str) -> None:
+		self.name = name
+
+	def __get__(self, obj: Any, objtype: type | None = None) -> str | None:
+		if obj is None:
+			return None  # the dataclass default
+		blob = self.get_blob(obj)
+		return blob.to_base64() if blob is not None else None  # also None when the blob file is missing
+
+	def __set__(self, obj: Any, value: 'str | ScreenshotBlob | None') -> None:
+		obj.__dict__[self.name] = ScreenshotBlob.from_base64(value) if isinstance(value, str) else value
+
+	def get_blob(self, obj: Any) -> ScreenshotBlob | None:
+		value = obj.__dict__.get(self.name)
+		if isinstance(value, str):
+			value = obj.__dict__[self.name] = ScreenshotBlob.from_base64(value)
+		return value
@@ -9,10 +9,12 @@ import re
 import shutil
 import tempfile
 import time
+import weakref
+from collections.abc import Awaitable, Collection
 from dataclasses import dataclass
 from functools import wraps
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Self, TypeVar
 from urllib.parse import urlparse
 
 import anyio
@@ -22,7 +24,7 @@ from browser_use.config import CONFIG
 from browser_use.observability import observe_debug
 from browser_use.utils import _log_pretty_path, _log_pretty_url
 
-from .utils import normalize_url
+from .utils import DEVTOOLS_ACTIVE_PORT_FILE, normalize_url, read_devtools_active_port
 
 os.environ['PW_TEST_SCREENSHOT_NO_FONTS_READY'] = '1'  # https://github.com/microsoft/playwright/issues/35972
 
@@ -32,18 +34,24 @@ from playwright._impl._api_structures import ViewportSize
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, InstanceOf, PrivateAttr, model_validator
 from uuid_extensions import uuid7str
 
+from browser_use.browser.cdp_pool import CDPSessionPool
+from browser_use.browser.network_idle import NetworkIdleDetector
 from browser_use.browser.profile import BROWSERUSE_DEFAULT_CHANNEL, BrowserChannel, BrowserProfile
+from browser_use.browser.profile_template import clone_user_data_dir
 from browser_use.browser.types import (
 	Browser,
 	BrowserContext,
+	Download,
 	ElementHandle,
 	FrameLocator,
 	Page,
 	Patchright,
 	PlaywrightOrPatchright,
+	Request,
 	async_patchright,
 	async_playwright,
 )
+from browser_use.browser.user_data_dirs import USER_DATA_DIR_INDEX
 from browser_use.browser.views import (
 	BrowserError,
 	BrowserStateSummary,
@@ -53,7 +61,7 @@ from browser_use.browser.views import (
 )
 from browser_use.dom.clickable_element_processor.service import ClickableElementProcessor
 from browser_use.dom.service import DomService
-from browser_use.dom.views import DOMElementNode, SelectorMap
+from browser_use.dom.views import DOMElementNode, DOMState, SelectorMap
 from browser_use.utils import (
 	is_new_tab_page,
 	match_url_with_domain_pattern,
@@ -72,6 +80,14 @@ GLOBAL_PATCHRIGHT_EVENT_LOOP = None  # track which event loop the global objects
 MAX_SCREENSHOT_HEIGHT = 2000
 MAX_SCREENSHOT_WIDTH = 1920
 
+CDP_READY_TIMEOUT = 30  # seconds to wait for the CDP port of a browser to become available
+CDP_READY_FILE_POLL_INTERVAL = 0.02  # seconds between two checks for the DevToolsActivePort file of a browser we spawned
+CDP_READY_HTTP_POLL_INTERVAL = 0.25  # seconds between two GET /json/version to the CDP port
+
+DOWNLOADS_FINISH_TIMEOUT = 30  # seconds stop() waits for the downloads that are still being saved
+
+T = TypeVar('T')
+
 
 def _log_glob_warning(domain: str, glob: str, logger: logging.Logger):
 	global _GLOB_WARNING_SHOWN
@@ -286,10 +302,24 @@ class BrowserSession(BaseModel):
 	_tab_visibility_callback: Any = PrivateAttr(default=None)
 	_logger: logging.Logger | None = PrivateAttr(default=None)
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)
+	_download_tasks: list[asyncio.Task[str | None]] = PrivateAttr(
+		default_factory=list
+	)  # one per download, saved in the background
+	_pending_download_paths: set[str] = PrivateAttr(default_factory=set)  # where the downloads being saved right now will end up
+	_download_listeners_context: BrowserContext | None = PrivateAttr(default=None)  # context whose pages _on_download listens to
+	_visited_origins: set[str] = PrivateAttr(default_factory=set)  # origins of all frames loaded since the last reset()
+	_visited_origins_context: BrowserContext | None = PrivateAttr(default=None)  # context _on_request listens to
 	_original_browser_session: Any = PrivateAttr(default=None)  # Reference to prevent GC of the original session when copied
 	_owns_browser_resources: bool = PrivateAttr(default=True)  # True if this instance owns and should clean up browser resources
 	_auto_download_pdfs: bool = PrivateAttr(default=True)  # Auto-download PDFs when detected
 	_subprocess: Any = PrivateAttr(default=None)  # Chrome subprocess reference for error handling
+	_dom_services: weakref.WeakKeyDictionary[Page, DomService] = PrivateAttr(
+		default_factory=weakref.WeakKeyDictionary
+	)  # one DomService per page, keeps the previous snapshot for incremental_dom_snapshots
+	_cdp_sessions: CDPSessionPool = PrivateAttr(default_factory=CDPSessionPool)  # CDP sessions reused by all CDP-based helpers
+	_prewarmed_elements: dict[int, tuple[DOMElementNode, asyncio.Task[ElementHandle | None]]] = PrivateAttr(
+		default_factory=dict
+	)  # id(element node) -> lookup started by prewarm_element(), consumed by get_locate_element()
 
 	@model_validator(mode='after')
 	def apply_session_overrides_to_profile(self) -> Self:
@@ -387,6 +417,8 @@ class BrowserSession(BaseModel):
 			# Configure browser
 			await self._setup_viewports()
 			await self._setup_current_page_change_listeners()
+			self._setup_download_listeners()
+			self._setup_visited_origins_listener()
 			await self._start_context_tracing()
 
 			self.initialized = True
@@ -436,13 +468,17 @@ class BrowserSession(BaseModel):
 		# Only the owner can actually stop the browser
 		if not self._owns_browser_resources:
 			self.logger.debug(f'🔗 BrowserSession.stop() called on a copy, not closing shared browser resources {_hint}')
-			# Still reset our references though
+			# Still reset our references though, the browser stays up so detach our CDP sessions from its pages
+			await self._cdp_sessions.close()
 			self._reset_connection_state()
 			return
 
 		if self.browser_context or self.browser:
 			self.logger.info(f'🛑 Closing {self._connection_str} browser context {_hint} {self.browser or self.browser_context}')
 
+			# Downloads can only be saved while the browser is still running
+			await self._wait_for_downloads(timeout=DOWNLOADS_FINISH_TIMEOUT)
+
 			# Save trace recording if configured
 			if self.browser_profile.traces_dir and self.browser_context:
 				try:
@@ -477,6 +513,7 @@ class BrowserSession(BaseModel):
 
 		# Kill the chrome subprocess if we started it
 		if self.browser_pid:
+			USER_DATA_DIR_INDEX.unregister(self.browser_pid)
 			try:
 				await self._terminate_browser_process(_hint='(stop() called)')
 			except psutil.NoSuchProcess:
@@ -516,6 +553,63 @@ class BrowserSession(BaseModel):
 		# do not stop self.playwright here as its likely used by other parallel browser_sessions
 		# let it be cleaned up by the garbage collector when no refs use it anymore
 
+	async def reset(self, start_url: str | None = None) -> None:
+		"""
+		Reset the running browser to a blank state for the next task, without restarting it (used by BrowserPool).
+		Replaces all tabs with a new one (without the history of the last task), clears cookies, permissions, the HTTP
+		cache and the storage of every site loaded since the last reset, forgets the downloads, and opens start_url
+		(if given) so the next task starts on a loaded page.
+		"""
+		assert self.browser_context is not None, 'BrowserContext is not set up, call start() first'
+		await self._forget_downloads()
+
+		old_pages = list(self.browser_context.pages)
+		# all pages and iframes the context loaded, plus the sites of the session before the listener was set up
+		origins = set(self._visited_origins)
+		storage_state = await self.browser_context.storage_state()
+		origins.update(origin['origin'] for origin in storage_state.get('origins', []))
+		for old_page in old_pages:
+			parsed = urlparse(old_page.url)
+			if parsed.scheme in ('http', 'https'):
+				origins.add(f'{parsed.scheme}://{parsed.netloc}')
+
+		# a new tab, the old ones keep the last task's history (and back-forward cache) reachable with go_back
+		page = await self.browser_context.new_page()
+		for old_page in old_pages:
+			await self._cdp_sessions.discard(old_page, detach=False)
+			await old_page.close()
+
+		# one call per origin clears localStorage, IndexedDB, service workers, cache storage, etc.
+		cdp_session = await self._cdp_sessions.get(page)
+		for origin in origins:
+			await cdp_session.send('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+		await cdp_session.send('Network.clearBrowserCache')
+		await self.browser_context.clear_cookies()
+		await self.browser_context.clear_permissions()
+		self._visited_origins.clear()
+
+		self.agent_current_page = page
+		self.human_current_page = page
+		self._cached_browser_state_summary = None
+		self._cached_clickable_element_hashes = None
+		self._clear_prewarmed_elements()
+		self.logger.debug(f'🧹 Reset browser for reuse, cleared the data of {len(origins)} origins')
+
+		if start_url:
+			await self.navigate(start_url)
+
+	async def _forget_downloads(self) -> None:
+		"""Let the downloads being saved finish, cancel the ones that take too long, and forget all of them"""
+		await self._wait_for_downloads(timeout=DOWNLOADS_FINISH_TIMEOUT)
+		# a download that finishes later would still show up in downloaded_files of the next task
+		pending = [task for task in self._download_tasks if not task.done()]
+		for task in pending:
+			task.cancel()
+		await asyncio.gather(*pending, return_exceptions=True)
+		self._download_tasks = []
+		self._pending_download_paths.clear()
+		self._downloaded_files = []
+
 	async def new_context(self, **kwargs):
 		"""Deprecated: Provides backwards-compatibility with old class method Browser().new_context()."""
 		# TODO: remove this after >=0.3.0
@@ -566,6 +660,8 @@ class BrowserSession(BaseModel):
 		copy.agent_current_page = self.agent_current_page
 		copy.human_current_page = self.human_current_page
 		copy.browser_pid = self.browser_pid
+		# the pool is detached when a session stops, the copy must not detach the sessions of the original
+		copy._cdp_sessions = CDPSessionPool()
 
 		return copy
 
@@ -922,11 +1018,24 @@ class BrowserSession(BaseModel):
 		# Wait for CDP port to become available (Chrome might still be starting)
 		import httpx
 
-		# Add initial delay to give Chrome time to start up before first check
-		await asyncio.sleep(2)
+		# a chrome we just spawned writes DevToolsActivePort to its user_data_dir as soon as the CDP server listens,
+		# watching that file notices it way sooner than polling the port over HTTP (which is still done as a fallback)
+		launched_by_us = bool(self._subprocess and self._subprocess.pid == self.browser_pid)
+		watched_user_data_dir = (
+			next((arg.split('=', 1)[1] for arg in args if arg.startswith('--user-data-dir=')), None) if launched_by_us else None
+		)
+		wait_start = time.monotonic()
+		last_http_check = None
 
 		async with httpx.AsyncClient() as client:
-			for i in range(30):  # 30 second timeout
+			while True:
+				if time.monotonic() - wait_start > CDP_READY_TIMEOUT:
+					self.logger.error(
+						f'❌ Chrome CDP port {debug_port} did not become available after {CDP_READY_TIMEOUT} seconds'
+					)
+					self.browser_pid = None
+					return
+
 				# First check if the Chrome process has exited
 				try:
 					chrome_process = psutil.Process(pid=self.browser_pid)
@@ -980,19 +1089,26 @@ class BrowserSession(BaseModel):
 					self.browser_pid = None
 					return
 
-				try:
-					response = await client.get(f'{self.cdp_url}json/version', timeout=1.0)
-					if response.status_code == 200:
-						# self.logger.debug(f'✅ Chrome CDP port {debug_port} is ready')
-						break
-				except (httpx.ConnectError, httpx.TimeoutException):
-					if i == 0:
+				if watched_user_data_dir and read_devtools_active_port(watched_user_data_dir) == int(debug_port):
+					break
+
+				if (
+					not watched_user_data_dir
+					or last_http_check is None
+					or (time.monotonic() - last_http_check > CDP_READY_HTTP_POLL_INTERVAL)
+				):
+					if last_http_check is None:
 						self.logger.debug(f'⏳ Waiting for Chrome CDP port {debug_port} to become available...')
-					await asyncio.sleep(1)
-			else:
-				self.logger.error(f'❌ Chrome CDP port {debug_port} did not become available after 30 seconds')
-				self.browser_pid = None
-				return
+					last_http_check = time.monotonic()
+					try:
+						response = await client.get(f'{self.cdp_url}json/version', timeout=1.0)
+						if response.status_code == 200:
+							break
+					except (httpx.ConnectError, httpx.TimeoutException):
+						pass
+				await asyncio.sleep(CDP_READY_FILE_POLL_INTERVAL if watched_user_data_dir else CDP_READY_HTTP_POLL_INTERVAL)
+
+		self.logger.debug(f'✅ Chrome CDP port {debug_port} is ready after {time.monotonic() - wait_start:.2f}s')
 
 		# Determine if this is a newly spawned subprocess or an existing process
 		if hasattr(self, '_subprocess') and self._subprocess and self._subprocess.pid == self.browser_pid:
@@ -1107,8 +1223,11 @@ class BrowserSession(BaseModel):
 				f'user_data_dir= {_log_pretty_path(self.browser_profile.user_data_dir) or "<incognito>"}'
 			)
 
+			# every launch gets its own fresh clone of the template profile, so parallel browsers don't fight over one user_data_dir
+			if self.browser_profile.user_data_dir_template:
+				await self._clone_user_data_dir_template()
 			# if no user_data_dir is provided, generate a unique one for this temporary browser_context (will be used to uniquely identify the browser_pid later)
-			if not self.browser_profile.user_data_dir:
+			elif not self.browser_profile.user_data_dir:
 				# self.logger.debug('🌎 Launching local browser in incognito mode')
 				# if no user_data_dir is provided, generate a unique one for this temporary browser_context (will be used to uniquely identify the browser_pid later)
 				self.browser_profile.user_data_dir = self.browser_profile.user_data_dir or Path(
@@ -1167,6 +1286,9 @@ class BrowserSession(BaseModel):
 						# Build final command
 						chrome_launch_cmd = [chromium_path] + final_args
 
+						# a leftover from the last browser would look like this one is ready right away
+						(Path(self.browser_profile.user_data_dir) / DEVTOOLS_ACTIVE_PORT_FILE).unlink(missing_ok=True)
+
 						# Launch chrome as subprocess
 						self.logger.info(
 							f' ↳ Spawning Chrome subprocess listening on CDP http://127.0.0.1:{debug_port}/ with user_data_dir= {_log_pretty_path(self.browser_profile.user_data_dir)}'
@@ -1182,6 +1304,8 @@ class BrowserSession(BaseModel):
 
 						# Store the browser PID
 						self.browser_pid = process.pid
+						# the next sessions of this process see that it holds the user_data_dir without scanning all processes
+						USER_DATA_DIR_INDEX.register(self.browser_profile.user_data_dir, process.pid)
 						self._set_browser_keep_alive(False)  # We launched it, so we should close it
 						# self.logger.debug(f'👶 Chrome subprocess launched with browser_pid={process.pid}')
 
@@ -1643,7 +1767,7 @@ class BrowserSession(BaseModel):
 
 			# cdp api: https://chromedevtools.github.io/devtools-protocol/tot/Browser/#method-setWindowBounds
 			try:
-				cdp_session = await page.context.new_cdp_session(page)  # type: ignore
+				cdp_session = await self._cdp_sessions.get(page)
 				window_id_result = await cdp_session.send('Browser.getWindowForTarget')
 				await cdp_session.send(
 					'Browser.setWindowBounds',
@@ -1655,11 +1779,8 @@ class BrowserSession(BaseModel):
 						},
 					},
 				)
-				try:
-					await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
-				except (TimeoutError, Exception):
-					pass
 			except Exception as e:
+				await self._cdp_sessions.discard(page)
 				_log_size = lambda size: f'{size["width"]}x{size["height"]}px'
 				try:
 					# fallback to javascript resize if cdp setWindowBounds fails
@@ -1749,10 +1870,15 @@ class BrowserSession(BaseModel):
 		self.agent_current_page = None
 		self.human_current_page = None
 		self._cached_clickable_element_hashes = None
+		self._dom_services = weakref.WeakKeyDictionary()
+		self._cdp_sessions = CDPSessionPool()
 		# Reset CDP connection info when browser is stopped
 		self.cdp_url = None
 		self.browser_pid = None
 		self._cached_browser_state_summary = None
+		self._download_listeners_context = None
+		self._visited_origins_context = None
+		self._clear_prewarmed_elements()
 		# Don't clear self.playwright here - it should be cleared explicitly in kill()
 
 		if self.browser_pid:
@@ -1781,51 +1907,13 @@ class BrowserSession(BaseModel):
 		if not self.browser_profile.user_data_dir:
 			return False
 
-		# Normalize the path for comparison
-		target_dir = str(Path(self.browser_profile.user_data_dir).expanduser().resolve())
-
-		# Check for running processes using this user data dir
-		for proc in psutil.process_iter(['pid', 'cmdline']):
-			# Skip our own browser process
-			if hasattr(self, 'browser_pid') and self.browser_pid and proc.info['pid'] == self.browser_pid:
-				continue
-
-			cmdline = proc.info['cmdline'] or []
-
-			# Check both formats: --user-data-dir=/path and --user-data-dir /path
-			for i, arg in enumerate(cmdline):
-				# Combined format: --user-data-dir=/path
-				if arg.startswith('--user-data-dir='):
-					try:
-						cmd_path = str(Path(arg.split('=', 1)[1]).expanduser().resolve())
-						if cmd_path == target_dir:
-							self.logger.debug(
-								f'🔍 Found conflicting Chrome process PID {proc.info["pid"]} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
-							)
-							return True
-					except Exception:
-						# Fallback to string comparison if path resolution fails
-						if arg.split('=', 1)[1] == str(self.browser_profile.user_data_dir):
-							self.logger.debug(
-								f'🔍 Found conflicting Chrome process PID {proc.info["pid"]} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
-							)
-							return True
-				# Separate format: --user-data-dir /path
-				elif arg == '--user-data-dir' and i + 1 < len(cmdline):
-					try:
-						cmd_path = str(Path(cmdline[i + 1]).expanduser().resolve())
-						if cmd_path == target_dir:
-							self.logger.debug(
-								f'🔍 Found conflicting Chrome process PID {proc.info["pid"]} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
-							)
-							return True
-					except Exception:
-						# Fallback to string comparison if path resolution fails
-						if cmdline[i + 1] == str(self.browser_profile.user_data_dir):
-							self.logger.debug(
-								f'🔍 Found conflicting Chrome process PID {proc.info["pid"]} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
-							)
-							return True
+		# Check for running processes using this user data dir (skipping our own browser process)
+		conflicting_pids = USER_DATA_DIR_INDEX.pids_using(self.browser_profile.user_data_dir, exclude_pid=self.browser_pid)
+		if conflicting_pids:
+			self.logger.debug(
+				f'🔍 Found conflicting Chrome process PID {min(conflicting_pids)} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
+			)
+			return True
 
 		# Note: We don't consider a SingletonLock file alone as a conflict
 		# because it might be stale. Only actual running processes count as conflicts.
@@ -1844,6 +1932,46 @@ class BrowserSession(BaseModel):
 			f'Using temporary profile instead: {_log_pretty_path(self.browser_profile.user_data_dir)}'
 		)
 
+	async def _clone_user_data_dir_template(self) -> None:
+		"""Point user_data_dir at a new clone of user_data_dir_template"""
+		assert self.browser_profile.user_data_dir_template, 'user_data_dir_template is not set'
+		old_dir = self.browser_profile.user_data_dir
+
+		start = time.monotonic()
+		clone_dir = await asyncio.to_thread(self._make_user_data_dir_clone, old_dir)
+		self.browser_profile.user_data_dir = clone_dir
+		self.logger.info(
+			f'🐑 Cloned user_data_dir_template= {_log_pretty_path(self.browser_profile.user_data_dir_template)} to user_data_dir= {_log_pretty_path(clone_dir)} in {time.monotonic() - start:.2f}s'
+		)
+
+	def _make_user_data_dir_clone(self, old_dir: str | Path | None) -> Path:
+		"""Clone user_data_dir_template into a new dir and delete the clone of the last launch (blocking, run in a thread)"""
+		assert self.browser_profile.user_data_dir_template, 'user_data_dir_template is not set'
+		# browseruse-tmp-* dirs are deleted again by stop()
+		prefix = 'browseruse-clone-' if self.browser_profile.keep_user_data_dir_clone else 'browseruse-tmp-clone-'
+		# next to the template by default, so the clone is on the same filesystem and can use reflinks instead of copies
+		parent_dir = Path(
+			self.browser_profile.user_data_dir_clone_dir or Path(self.browser_profile.user_data_dir_template).expanduser().parent
+		).expanduser()
+		try:
+			parent_dir.mkdir(parents=True, exist_ok=True)
+			clone_dir = Path(tempfile.mkdtemp(prefix=prefix, dir=parent_dir))
+		except OSError as e:
+			self.logger.warning(
+				f'⚠️ Could not create the clone of user_data_dir_template in {_log_pretty_path(parent_dir)} ({type(e).__name__}: {e}), using the temp dir instead'
+			)
+			clone_dir = Path(tempfile.mkdtemp(prefix=prefix))
+		try:
+			clone_user_data_dir(self.browser_profile.user_data_dir_template, clone_dir)
+		except BaseException:
+			shutil.rmtree(clone_dir, ignore_errors=True)
+			raise
+
+		# the clone used by the last launch of this session
+		if old_dir and Path(old_dir).name.startswith('browseruse-tmp-'):
+			shutil.rmtree(old_dir, ignore_errors=True)
+		return clone_dir
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='prepare_user_data_dir')
 	def prepare_user_data_dir(self, check_conflicts: bool = True) -> None:
 		"""Create and prepare the user data dir, handling conflicts if needed.
@@ -1865,37 +1993,11 @@ class BrowserSession(BaseModel):
 			# This must happen BEFORE checking for conflicts to avoid false positives
 			singleton_lock = self.browser_profile.user_data_dir / 'SingletonLock'
 			if singleton_lock.exists():
-				# Check if any process is actually using this user_data_dir
-				has_active_process = False
-				target_dir = str(self.browser_profile.user_data_dir)
-				for proc in psutil.process_iter(['pid', 'cmdline']):
-					# Skip our own browser process
-					if hasattr(self, 'browser_pid') and self.browser_pid and proc.info['pid'] == self.browser_pid:
-						continue
-
-					cmdline = proc.info['cmdline'] or []
-					# Check both formats: --user-data-dir=/path and --user-data-dir /path
-					for i, arg in enumerate(cmdline):
-						if arg.startswith('--user-data-dir='):
-							try:
-								if str(Path(arg.split('=', 1)[1]).expanduser().resolve()) == target_dir:
-									has_active_process = True
-									break
-							except Exception:
-								if arg.split('=', 1)[1] == str(self.browser_profile.user_data_dir):
-									has_active_process = True
-									break
-						elif arg == '--user-data-dir' and i + 1 < len(cmdline):
-							try:
-								if str(Path(cmdline[i + 1]).expanduser().resolve()) == target_dir:
-									has_active_process = True
-									break
-							except Exception:
-								if cmdline[i + 1] == str(self.browser_profile.user_data_dir):
-									has_active_process = True
-									break
-					if has_active_process:
-						break
+				# Check if any process is actually using this user_data_dir (skipping our own browser process),
+				# with a new scan: a browser started since the last one would lose its lock
+				has_active_process = bool(
+					USER_DATA_DIR_INDEX.pids_using(self.browser_profile.user_data_dir, exclude_pid=self.browser_pid, fresh=True)
+				)
 
 				if not has_active_process:
 					# No active process, safe to remove stale lock
@@ -2074,47 +2176,25 @@ class BrowserSession(BaseModel):
 			async def perform_click(click_func):
 				"""Performs the actual click, handling both download and navigation scenarios."""
 
-				# only wait the 5s extra for potential downloads if they are enabled
-				# TODO: instead of blocking for 5s, we should register a non-block page.on('download') event
-				# and then check if the download has been triggered within the event handler
-				if self.browser_profile.downloads_path:
-					try:
-						# Try short-timeout expect_download to detect a file download has been been triggered
-						async with page.expect_download(timeout=5_000) as download_info:
-							await click_func()
-						download = await download_info.value
-						# Determine file path
-						suggested_filename = download.suggested_filename
-						unique_filename = await self._get_unique_filename(self.browser_profile.downloads_path, suggested_filename)
-						download_path = os.path.join(self.browser_profile.downloads_path, unique_filename)
-						await download.save_as(download_path)
-						self.logger.info(f'⬇️ Downloaded file to: {download_path}')
-
-						# Track the downloaded file in the session
-						self._downloaded_files.append(download_path)
-						self.logger.info(f'📁 Added download to session tracking (total: {len(self._downloaded_files)} files)')
+				# downloads are picked up by the page.on('download') listener from _setup_download_listeners(),
+				# so a click that doesn't download anything doesn't have to wait for one
+				downloads_before = len(self._download_tasks)
+				await click_func()
+				try:
+					await page.wait_for_load_state()
+				except Exception as e:
+					self.logger.warning(
+						f'⚠️ Page {_log_pretty_url(page.url)} failed to finish loading after click: {type(e).__name__}: {e}'
+					)
+				await self._check_and_handle_navigation(page)
 
+				# a download that started by now was triggered by the click, report where it was saved.
+				# downloads that start later are still saved and show up in downloaded_files
+				for download_task in self._download_tasks[downloads_before:]:
+					download_path = await asyncio.shield(download_task)
+					if download_path:
 						return download_path
-					except Exception:
-						# If no download is triggered, treat as normal click
-						self.logger.debug('No download triggered within timeout. Checking navigation...')
-						try:
-							await page.wait_for_load_state()
-						except Exception as e:
-							self.logger.warning(
-								f'⚠️ Page {_log_pretty_url(page.url)} failed to finish loading after click: {type(e).__name__}: {e}'
-							)
-						await self._check_and_handle_navigation(page)
-				else:
-					# If downloads are disabled, just perform the click
-					await click_func()
-					try:
-						await page.wait_for_load_state()
-					except Exception as e:
-						self.logger.warning(
-							f'⚠️ Page {_log_pretty_url(page.url)} failed to finish loading after click: {type(e).__name__}: {e}'
-						)
-					await self._check_and_handle_navigation(page)
+				return None
 
 			try:
 				return await perform_click(lambda: element_handle and element_handle.click(timeout=1_500))
@@ -2580,6 +2660,74 @@ class BrowserSession(BaseModel):
 		"""
 		await self.load_storage_state(*args, **kwargs)
 
+	def _setup_download_listeners(self) -> None:
+		"""Save the downloads of all pages in the background as soon as they start, instead of waiting for one on every click"""
+		if not self.browser_profile.downloads_path:
+			return
+		assert self.browser_context is not None, 'BrowserContext object is not set'
+		if self._download_listeners_context is self.browser_context:
+			return  # already listening to this context, don't save every download twice
+		self._download_listeners_context = self.browser_context
+
+		for page in self.browser_context.pages:
+			page.on('download', self._on_download)
+		self.browser_context.on('page', lambda page: page.on('download', self._on_download))
+
+	def _setup_visited_origins_listener(self) -> None:
+		"""Record the origin of every page and iframe the context loads, reset() clears the data of all of them"""
+		assert self.browser_context is not None, 'BrowserContext object is not set'
+		if self._visited_origins_context is self.browser_context:
+			return
+		self._visited_origins_context = self.browser_context
+		self.browser_context.on('request', self._on_request)
+
+	def _on_request(self, request: Request) -> None:
+		if request.is_navigation_request():
+			parsed = urlparse(request.url)
+			if parsed.scheme in ('http', 'https'):
+				self._visited_origins.add(f'{parsed.scheme}://{parsed.netloc}')
+
+	def _on_download(self, download: Download) -> None:
+		"""page.on('download') handler, playwright emits it from the CDP Browser.downloadWillBegin/downloadProgress events"""
+		self._download_tasks.append(asyncio.create_task(self._save_download(download)))
+
+	async def _save_download(self, download: Download) -> str | None:
+		"""Save a started download to the downloads_path and track it in downloaded_files"""
+		assert self.browser_profile.downloads_path, 'downloads_path is not set'
+		try:
+			# the names of the downloads that are still being saved are taken as well, even though they're not on disk yet
+			unique_filename = await self._get_unique_filename(
+				self.browser_profile.downloads_path,
+				download.suggested_filename,
+				taken={os.path.basename(path) for path in self._pending_download_paths},
+			)
+			download_path = os.path.join(self.browser_profile.downloads_path, unique_filename)
+			self._pending_download_paths.add(download_path)
+			try:
+				await download.save_as(download_path)
+			finally:
+				self._pending_download_paths.discard(download_path)
+		except Exception as e:
+			self.logger.warning(f'⚠️ Failed to save download {download.suggested_filename}: {type(e).__name__}: {e}')
+			return None
+
+		self.logger.info(f'⬇️ Downloaded file to: {download_path}')
+
+		# Track the downloaded file in the session
+		self._downloaded_files.append(download_path)
+		self.logger.info(f'📁 Added download to session tracking (total: {len(self._downloaded_files)} files)')
+		return download_path
+
+	async def _wait_for_downloads(self, timeout: float) -> None:
+		"""Wait for the downloads that are still being saved to finish"""
+		pending = [task for task in self._download_tasks if not task.done()]
+		if not pending:
+			return
+		self.logger.debug(f'⬇️ Waiting for {len(pending)} downloads to finish saving...')
+		_, still_pending = await asyncio.wait(pending, timeout=timeout)
+		if still_pending:
+			self.logger.warning(f'⚠️ {len(still_pending)} downloads did not finish saving within {timeout}s')
+
 	@property
 	def downloaded_files(self) -> list[str]:
 		"""
@@ -2620,179 +2768,31 @@ class BrowserSession(BaseModel):
 	# 	return list(Path(self.browser_profile.downloads_path).glob('*'))
 
 	async def _wait_for_stable_network(self):
-		pending_requests = set()
-		last_activity = asyncio.get_event_loop().time()
-
 		page = await self.get_current_page()
 
-		# Define relevant resource types and content types
-		RELEVANT_RESOURCE_TYPES = {
-			'document',
-			'stylesheet',
-			'image',
-			'font',
-			'script',
-			'iframe',
-		}
-
-		RELEVANT_CONTENT_TYPES = {
-			'text/html',
-			'text/css',
-			'application/javascript',
-			'image/',
-			'font/',
-			'application/json',
-		}
-
-		# Additional patterns to filter out
-		IGNORED_URL_PATTERNS = {
-			# Analytics and tracking
-			'analytics',
-			'tracking',
-			'telemetry',
-			'beacon',
-			'metrics',
-			# Ad-related
-			'doubleclick',
-			'adsystem',
-			'adserver',
-			'advertising',
-			# Social media widgets
-			'facebook.com/plugins',
-			'platform.twitter',
-			'linkedin.com/embed',
-			# Live chat and support
-			'livechat',
-			'zendesk',
-			'intercom',
-			'crisp.chat',
-			'hotjar',
-			# Push notifications
-			'push-notifications',
-			'onesignal',
-			'pushwoosh',
-			# Background sync/heartbeat
-			'heartbeat',
-			'ping',
-			'alive',
-			# WebRTC and streaming
-			'webrtc',
-			'rtmp://',
-			'wss://',
-			# Common CDNs for dynamic content
-			'cloudfront.net',
-			'fastly.net',
-		}
-
-		async def on_request(request):
-			# Filter by resource type
-			if request.resource_type not in RELEVANT_RESOURCE_TYPES:
-				return
-
-			# Filter out streaming, websocket, and other real-time requests
-			if request.resource_type in {
-				'websocket',
-				'media',
-				'eventsource',
-				'manifest',
-				'other',
-			}:
-				return
-
-			# Filter out by URL patterns
-			url = request.url.lower()
-			if any(pattern in url for pattern in IGNORED_URL_PATTERNS):
-				return
-
-			# Filter out data URLs and blob URLs
-			if url.startswith(('data:', 'blob:')):
-				return
-
-			# Filter out requests with certain headers
-			headers = request.headers
-			if headers.get('purpose') == 'prefetch' or headers.get('sec-fetch-dest') in [
-				'video',
-				'audio',
-			]:
-				return
-
-			nonlocal last_activity
-			pending_requests.add(request)
-			last_activity = asyncio.get_event_loop().time()
-			# self.logger.debug(f'Request started: {request.url} ({request.resource_type})')
-
-		async def on_response(response):
-			request = response.request
-			if request not in pending_requests:
-				return
-
-			# Filter by content type if available
-			content_type = response.headers.get('content-type', '').lower()
-
-			# Skip if content type indicates streaming or real-time data
-			if any(
-				t in content_type
-				for t in [
-					'streaming',
-					'video',
-					'audio',
-					'webm',
-					'mp4',
-					'event-stream',
-					'websocket',
-					'protobuf',
-				]
-			):
-				pending_requests.remove(request)
-				return
-
-			# Only process relevant content types
-			if not any(ct in content_type for ct in RELEVANT_CONTENT_TYPES):
-				pending_requests.remove(request)
-				return
-
-			# Skip if response is too large (likely not essential for page load)
-			content_length = response.headers.get('content-length')
-			if content_length and int(content_length) > 5 * 1024 * 1024:  # 5MB
-				pending_requests.remove(request)
-				return
-
-			nonlocal last_activity
-			pending_requests.remove(request)
-			last_activity = asyncio.get_event_loop().time()
-			# self.logger.debug(f'Request resolved: {request.url} ({content_type})')
+		start_time = asyncio.get_event_loop().time()
+		detector = NetworkIdleDetector(
+			idle_time=self.browser_profile.wait_for_network_idle_page_load_time,
+			timeout=self.browser_profile.maximum_wait_page_load_time,
+		)
 
 		# Attach event listeners
-		page.on('request', on_request)
-		page.on('response', on_response)
-
-		now = asyncio.get_event_loop().time()
+		detector.attach(page)
 		try:
 			# Wait for idle time
-			start_time = asyncio.get_event_loop().time()
-			while True:
-				await asyncio.sleep(0.1)
-				now = asyncio.get_event_loop().time()
-				if (
-					len(pending_requests) == 0
-					and (now - last_activity) >= self.browser_profile.wait_for_network_idle_page_load_time
-				):
-					break
-				if now - start_time > self.browser_profile.maximum_wait_page_load_time:
-					self.logger.debug(
-						f'{self} Network timeout after {self.browser_profile.maximum_wait_page_load_time}s with {len(pending_requests)} '
-						f'pending requests: {[r.url for r in pending_requests]}'
-					)
-					break
-
+			is_idle = await detector.wait()
+			if not is_idle:
+				self.logger.debug(
+					f'{self} Network timeout after {self.browser_profile.maximum_wait_page_load_time}s with {len(detector.pending_requests)} '
+					f'pending requests: {[r.url for r in detector.pending_requests]}'
+				)
 		finally:
 			# Clean up event listeners
-			page.remove_listener('request', on_request)
-			page.remove_listener('response', on_response)
+			detector.detach(page)
 
-		elapsed = now - start_time
+		elapsed = asyncio.get_event_loop().time() - start_time
 		if elapsed > 1:
-			self.logger.debug(f'💤 Page network traffic calmed down after {now - start_time:.2f} seconds')
+			self.logger.debug(f'💤 Page network traffic calmed down after {elapsed:.2f} seconds')
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='wait_for_page_and_frames_load')
 	async def _wait_for_page_and_frames_load(self, timeout_overwrite: float | None = None):
@@ -3066,26 +3066,31 @@ class BrowserSession(BaseModel):
 			This is used to calculate which elements are new to the LLM since the last message,
 			which helps reduce token usage.
 		"""
+		# element lookups prewarmed for the previous state refer to the old DOM tree
+		self._clear_prewarmed_elements()
 		await self._wait_for_page_and_frames_load()
 		updated_state = await self._get_updated_state()
 
 		# Find out which elements are new
 		# Do this only if url has not changed
 		if cache_clickable_elements_hashes:
+			# Pointers, feel free to edit in place
+			updated_state_clickable_elements = ClickableElementProcessor.get_clickable_elements(updated_state.element_tree)
+			updated_state_hashes = [
+				ClickableElementProcessor.hash_dom_element(dom_element) for dom_element in updated_state_clickable_elements
+			]
+
 			# if we are on the same url as the last state, we can use the cached hashes
 			if self._cached_clickable_element_hashes and self._cached_clickable_element_hashes.url == updated_state.url:
-				# Pointers, feel free to edit in place
-				updated_state_clickable_elements = ClickableElementProcessor.get_clickable_elements(updated_state.element_tree)
-
-				for dom_element in updated_state_clickable_elements:
+				for dom_element, element_hash in zip(updated_state_clickable_elements, updated_state_hashes):
 					dom_element.is_new = (
-						ClickableElementProcessor.hash_dom_element(dom_element)
+						element_hash
 						not in self._cached_clickable_element_hashes.hashes  # see which elements are new from the last state where we cached the hashes
 					)
 			# in any case, we need to cache the new hashes
 			self._cached_clickable_element_hashes = CachedClickableElementHashes(
 				url=updated_state.url,
-				hashes=ClickableElementProcessor.get_clickable_elements_hashes(updated_state.element_tree),
+				hashes=set(updated_state_hashes),
 			)
 
 		assert updated_state
@@ -3157,55 +3162,57 @@ class BrowserSession(BaseModel):
 			raise BrowserError('Page is not accessible')
 
 		try:
-			self.logger.debug('🧹 Removing highlights...')
-			try:
-				await self.remove_highlights()
-			except TimeoutError:
-				self.logger.debug('Timeout to remove highlights')
-
-			# Check for PDF and auto-download if needed
-			try:
-				pdf_path = await self._auto_download_pdf_if_needed(page)
-				if pdf_path:
-					self.logger.info(f'📄 PDF auto-downloaded: {pdf_path}')
-			except Exception as e:
-				self.logger.debug(f'PDF auto-download check failed: {type(e).__name__}: {e}')
-
-			self.logger.debug('🌳 Starting DOM processing...')
-			dom_service = DomService(page, logger=self.logger)
-			try:
-				content = await asyncio.wait_for(
+			# the probes below are mostly independent round trips to the browser, so they run concurrently.
+			# only the DOM chain is ordered: old highlights are removed before the DOM is highlighted again,
+			# and the screenshot is taken after that so it shows the new highlights.
+			probe_timings: dict[str, float] = {}
+
+			dom_service = self._dom_services.get(page)
+			if dom_service is None:
+				dom_service = self._dom_services[page] = DomService(page, logger=self.logger)
+
+			async def capture_dom_and_screenshot() -> tuple[DOMState | None, str | None]:
+				self.logger.debug('🧹 Removing highlights...')
+				await self._run_state_probe('remove_highlights', self.remove_highlights(), 5.0, None, probe_timings)
+
+				self.logger.debug('🌳 Starting DOM processing...')
+				content = await self._run_state_probe(
+					'dom',
 					dom_service.get_clickable_elements(
 						focus_element=focus_element,
 						viewport_expansion=self.browser_profile.viewport_expansion,
 						highlight_elements=self.browser_profile.highlight_elements,
+						incremental=self.browser_profile.incremental_dom_snapshots,
+						compact=self.browser_profile.compact_dom_tree,
 					),
-					timeout=45.0,  # 45 second timeout for DOM processing - generous for complex pages
+					45.0,  # 45 second timeout for DOM processing - generous for complex pages
+					None,
+					probe_timings,
+					log_level=logging.WARNING,
+					fallback_on=(TimeoutError,),  # only a slow page gets the minimal DOM state, real errors are raised
 				)
-				self.logger.debug('✅ DOM processing completed')
-			except TimeoutError:
-				self.logger.warning(f'DOM processing timed out after 45 seconds for {page.url}')
-				self.logger.warning('🔄 Falling back to minimal DOM state to allow basic navigation...')
-
-				# Create minimal DOM state for basic navigation
-				from browser_use.dom.views import DOMElementNode
 
-				minimal_element_tree = DOMElementNode(
-					tag_name='body',
-					xpath='/body',
-					attributes={},
-					children=[],
-					is_visible=True,
-					parent=None,
+				self.logger.debug('📸 Capturing screenshot...')
+				# take_screenshot() has its own timeout and retries
+				screenshot_b64 = await self._run_state_probe(
+					'screenshot', self.take_screenshot(), None, None, probe_timings, log_level=logging.WARNING
 				)
-
-				from browser_use.dom.views import DOMState
-
-				content = DOMState(element_tree=minimal_element_tree, selector_map={})
-
-			self.logger.debug('📋 Getting tabs info...')
-			tabs_info = await self.get_tabs_info()
-			self.logger.debug('✅ Tabs info completed')
+				return content, screenshot_b64
+
+			(content, screenshot_b64), pdf_path, tabs_info, page_info, (pixels_above, pixels_below), title = await asyncio.gather(
+				capture_dom_and_screenshot(),
+				# Check for PDF and auto-download if needed
+				self._run_state_probe('pdf_download', self._auto_download_pdf_if_needed(page), None, None, probe_timings),
+				self._run_state_probe('tabs', self.get_tabs_info(), 10.0, [], probe_timings, log_level=logging.WARNING),
+				# Get comprehensive page information
+				self._run_state_probe('page_info', self.get_page_info(page), 5.0, None, probe_timings, log_level=logging.WARNING),
+				self._run_state_probe(
+					'scroll_info', self.get_scroll_info(page), 5.0, (0, 0), probe_timings, log_level=logging.WARNING
+				),
+				self._run_state_probe('title', page.title(), 3.0, 'Title unavailable', probe_timings),
+			)
+			if pdf_path:
+				self.logger.info(f'📄 PDF auto-downloaded: {pdf_path}')
 
 			# Get all cross-origin iframes within the page and open them in new tabs
 			# mark the titles of the new tabs so the LLM knows to check them for additional content
@@ -3228,29 +3235,19 @@ class BrowserSession(BaseModel):
 			# 		)
 			# 	)
 
-			try:
-				self.logger.debug('📸 Capturing screenshot...')
-				# Reasonable timeout for screenshot
-				screenshot_b64 = await self.take_screenshot()
-				# self.logger.debug('✅ Screenshot completed')
-			except Exception as e:
-				self.logger.warning(f'❌ Screenshot failed for {_log_pretty_url(page.url)}: {type(e).__name__} {e}')
-				screenshot_b64 = None
-
-			# Get comprehensive page information
-			page_info = await self.get_page_info(page)
-			try:
-				self.logger.debug('📏 Getting scroll info...')
-				pixels_above, pixels_below = await asyncio.wait_for(self.get_scroll_info(page), timeout=5.0)
-				self.logger.debug('✅ Scroll info completed')
-			except Exception as e:
-				self.logger.warning(f'Failed to get scroll info: {type(e).__name__}')
-				pixels_above, pixels_below = 0, 0
+			if content is None:
+				self.logger.warning('🔄 Falling back to minimal DOM state to allow basic navigation...')
 
-			try:
-				title = await asyncio.wait_for(page.title(), timeout=3.0)
-			except Exception:
-				title = 'Title unavailable'
+				# Create minimal DOM state for basic navigation
+				minimal_element_tree = DOMElementNode(
+					tag_name='body',
+					xpath='/body',
+					attributes={},
+					children=[],
+					is_visible=True,
+					parent=None,
+				)
+				content = DOMState(element_tree=minimal_element_tree, selector_map={})
 
 			# Check if this is a minimal fallback state
 			browser_errors = []
@@ -3259,6 +3256,9 @@ class BrowserSession(BaseModel):
 					f'DOM processing timed out for {page.url} - using minimal state. Basic navigation still available via go_to_url, scroll, and search actions.'
 				)
 
+			self.logger.debug(
+				'⏱️ State probes took: ' + ', '.join(f'{name}={duration:.2f}s' for name, duration in probe_timings.items())
+			)
 			self.browser_state_summary = BrowserStateSummary(
 				element_tree=content.element_tree,
 				selector_map=content.selector_map,
@@ -3270,6 +3270,7 @@ class BrowserSession(BaseModel):
 				pixels_above=pixels_above,
 				pixels_below=pixels_below,
 				browser_errors=browser_errors,
+				probe_timings=probe_timings,
 			)
 
 			self.logger.debug('✅ get_state_summary completed successfully')
@@ -3281,6 +3282,27 @@ class BrowserSession(BaseModel):
 				return self.browser_state_summary
 			raise
 
+	async def _run_state_probe(
+		self,
+		name: str,
+		probe: Awaitable[T],
+		timeout: float | None,
+		fallback: T,
+		timings: dict[str, float],
+		log_level: int = logging.DEBUG,
+		fallback_on: tuple[type[Exception], ...] = (Exception,),
+	) -> T:
+		"""Run one probe of the state capture pipeline, a probe failing with one of fallback_on (a timeout is a TimeoutError) is logged and replaced by its fallback, other errors are raised."""
+		start = time.perf_counter()
+		try:
+			return await asyncio.wait_for(probe, timeout=timeout)
+		except fallback_on as e:
+			reason = f'timed out after {timeout}s' if isinstance(e, TimeoutError) else f'failed: {type(e).__name__}: {e}'
+			self.logger.log(log_level, f'❌ State probe {name} {reason}')
+			return fallback
+		finally:
+			timings[name] = time.perf_counter() - start
+
 	# region - Page Health Check Helpers
 	@observe_debug(ignore_input=True)
 	async def _is_page_responsive(self, page: Page, timeout: float = 5.0) -> bool:
@@ -3311,56 +3333,62 @@ class BrowserSession(BaseModel):
 					pass
 
 	async def _force_close_page_via_cdp(self, page_url: str) -> bool:
-		"""Force close a crashed page using CDP from a clean temporary page."""
+		"""Force close a crashed page using CDP from a browser-level session (or a clean temporary page)."""
+		temp_page = None
 		try:
-			# self.logger.info('🔨 Creating temporary page for CDP force-close...')
-
-			# Create a clean page for CDP operations
 			assert self.browser_context, 'Browser context is not set up yet'
-			temp_page = await asyncio.wait_for(self.browser_context.new_page(), timeout=5.0)
-			await asyncio.wait_for(temp_page.goto('about:blank'), timeout=2.0)
+			if self.browser:
+				# Target.* commands are handled by the browser itself, no need for a healthy page to send them from
+				cdp_session = await asyncio.wait_for(self._cdp_sessions.get_browser_session(self.browser), timeout=5.0)
+			else:
+				# self.logger.info('🔨 Creating temporary page for CDP force-close...')
 
-			# Create CDP session from the clean page
-			cdp_session = await asyncio.wait_for(self.browser_context.new_cdp_session(temp_page), timeout=5.0)  # type: ignore
+				# Create a clean page for CDP operations
+				temp_page = await asyncio.wait_for(self.browser_context.new_page(), timeout=5.0)
+				await asyncio.wait_for(temp_page.goto('about:blank'), timeout=2.0)
 
-			try:
-				# Get all browser targets
-				targets = await asyncio.wait_for(cdp_session.send('Target.getTargets'), timeout=2.0)
-
-				# Find the crashed page target
-				blocked_target_id = None
-				for target in targets.get('targetInfos', []):
-					if target.get('type') == 'page' and target.get('url') == page_url:
-						blocked_target_id = target.get('targetId')
-						# self.logger.debug(f'Found target to close: {page_url}')
-						break
-
-				if blocked_target_id:
-					# Force close the target
-					self.logger.warning(
-						f'🪓 Force-closing crashed page target_id={blocked_target_id} via CDP: {_log_pretty_url(page_url)}...'
-					)
-					await asyncio.wait_for(cdp_session.send('Target.closeTarget', {'targetId': blocked_target_id}), timeout=2.0)
-					# self.logger.debug(f'☠️ Successfully force-closed crashed page target_id={blocked_target_id} via CDP: {_log_pretty_url(page_url)}')
-					return True
-				else:
-					self.logger.debug(
-						f'❌ Could not find CDP page target_id to force-close: {_log_pretty_url(page_url)} (concurrency issues?)'
-					)
-					return False
+				# Create CDP session from the clean page
+				cdp_session = await asyncio.wait_for(self._cdp_sessions.get(temp_page), timeout=5.0)
 
-			finally:
-				# Clean up
-				try:
-					await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
-				except Exception:
-					pass
-				await temp_page.close()
+			# Get all browser targets
+			targets = await asyncio.wait_for(cdp_session.send('Target.getTargets'), timeout=2.0)
+
+			# Find the crashed page target
+			blocked_target_id = None
+			for target in targets.get('targetInfos', []):
+				if target.get('type') == 'page' and target.get('url') == page_url:
+					blocked_target_id = target.get('targetId')
+					# self.logger.debug(f'Found target to close: {page_url}')
+					break
+
+			if blocked_target_id:
+				# Force close the target
+				self.logger.warning(
+					f'🪓 Force-closing crashed page target_id={blocked_target_id} via CDP: {_log_pretty_url(page_url)}...'
+				)
+				await asyncio.wait_for(cdp_session.send('Target.closeTarget', {'targetId': blocked_target_id}), timeout=2.0)
+				# self.logger.debug(f'☠️ Successfully force-closed crashed page target_id={blocked_target_id} via CDP: {_log_pretty_url(page_url)}')
+				return True
+			else:
+				self.logger.debug(
+					f'❌ Could not find CDP page target_id to force-close: {_log_pretty_url(page_url)} (concurrency issues?)'
+				)
+				return False
 
 		except Exception as e:
 			self.logger.error(f'❌ Using raw CDP to force-close crashed page failed: {type(e).__name__}: {e}')
+			# the browser-level session may be the broken part, attach a new one next time
+			await self._cdp_sessions.discard_browser_session()
 			return False
 
+		finally:
+			# Clean up, closing the page also drops its pooled CDP session
+			if temp_page is not None:
+				try:
+					await temp_page.close()
+				except Exception:
+					pass
+
 	async def _try_reopen_url(self, url: str, timeout_ms: int | None = None) -> bool:
 		"""Try to reopen a URL in a new page and check if it's responsive."""
 		if not url or is_new_tab_page(url):
@@ -3496,6 +3524,7 @@ class BrowserSession(BaseModel):
 
 			# Force-close the crashed page via CDP
 			self.logger.debug('🪓 Page Recovery Step 1/3: Force-closing crashed page via CDP...')
+			await self._cdp_sessions.discard(blocked_page, detach=False)  # its target is about to be closed anyway
 			await self._force_close_page_via_cdp(current_url)
 
 			# Remove the closed page from browser_context.pages by forcing a refresh
@@ -3576,13 +3605,12 @@ class BrowserSession(BaseModel):
 			pass
 
 		# Take screenshot using CDP to get around playwright's unnecessary slowness and weird behavior
-		cdp_session = None
 		try:
-			# Create CDP session for the screenshot
+			# Reuse the CDP session of the page, attaching a new one costs a round trip on every step
 			self.logger.debug(
-				f'📸 Taking viewport-only PNG screenshot of page via fresh CDP session: {_log_pretty_url(page.url)}'
+				f'📸 Taking viewport-only PNG screenshot of page via pooled CDP session: {_log_pretty_url(page.url)}'
 			)
-			cdp_session = await self.browser_context.new_cdp_session(page)  # type: ignore
+			cdp_session = await self._cdp_sessions.get(page)
 
 			# Capture screenshot via CDP
 			screenshot_response = await cdp_session.send(
@@ -3608,23 +3636,19 @@ class BrowserSession(BaseModel):
 				self.logger.warning(f'⏱️ Screenshot timed out on page {_log_pretty_url(page.url)} (possibly crashed): {error_str}')
 			else:
 				self.logger.error(f'❌ Screenshot failed on page {_log_pretty_url(page.url)} (possibly crashed): {error_str}')
+			# don't hand out a possibly broken session again, the retry attaches a fresh one
+			await self._cdp_sessions.discard(page)
 			raise
-		finally:
-			if cdp_session:
-				try:
-					await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
-				except Exception:
-					pass
 
 	# region - User Actions
 
 	@staticmethod
-	async def _get_unique_filename(directory: str | Path, filename: str) -> str:
-		"""Generate a unique filename for downloads by appending (1), (2), etc., if a file already exists."""
+	async def _get_unique_filename(directory: str | Path, filename: str, taken: Collection[str] = ()) -> str:
+		"""Generate a unique filename for downloads by appending (1), (2), etc., if a file already exists (or the name is taken)."""
 		base, ext = os.path.splitext(filename)
 		counter = 1
 		new_filename = filename
-		while os.path.exists(os.path.join(directory, new_filename)):
+		while new_filename in taken or os.path.exists(os.path.join(directory, new_filename)):
 			new_filename = f'{base} ({counter}){ext}'
 			counter += 1
 		return new_filename
@@ -3829,6 +3853,19 @@ class BrowserSession(BaseModel):
 	@require_healthy_browser(usable_page=True, reopen_page=True)
 	@time_execution_async('--get_locate_element')
 	async def get_locate_element(self, element: DOMElementNode) -> ElementHandle | None:
+		prewarmed = self._prewarmed_elements.pop(id(element), None)
+		if prewarmed is not None and prewarmed[0] is element:
+			try:
+				element_handle = await prewarmed[1]
+				if element_handle:
+					if await self._is_visible(element_handle):
+						await element_handle.scroll_into_view_if_needed()
+					return element_handle
+			except Exception as e:
+				self.logger.debug(
+					f'Prewarmed element handle for {element.xpath} is unusable, locating it again: {type(e).__name__}: {e}'
+				)
+
 		page = await self.get_current_page()
 		current_frame = page
 
@@ -3910,6 +3947,39 @@ class BrowserSession(BaseModel):
 				)
 				return None
 
+	def prewarm_element(self, element: DOMElementNode) -> None:
+		"""
+		Start locating an element in the background, e.g. while the LLM is still streaming the action that uses it.
+
+		The lookup doesn't scroll or otherwise touch the page, the next get_locate_element() call for the same
+		element node picks up its result. Elements inside iframes are located on demand as usual.
+		"""
+		if id(element) in self._prewarmed_elements:
+			return
+		parent = element.parent
+		while parent is not None:
+			if parent.tag_name == 'iframe':
+				return
+			parent = parent.parent
+		task = asyncio.create_task(self._query_element_handle(element))
+		self._prewarmed_elements[id(element)] = (element, task)
+
+	async def _query_element_handle(self, element: DOMElementNode) -> ElementHandle | None:
+		try:
+			page = await self.get_current_page()
+			css_selector = self._enhanced_css_selector_for_element(
+				element, include_dynamic_attributes=self.browser_profile.include_dynamic_attributes
+			)
+			return await page.query_selector(css_selector or f'xpath={element.xpath}')
+		except Exception:
+			# get_locate_element() falls back to its own lookup and reports any errors
+			return None
+
+	def _clear_prewarmed_elements(self) -> None:
+		for _, task in self._prewarmed_elements.values():
+			task.cancel()
+		self._prewarmed_elements.clear()
+
 	@require_healthy_browser(usable_page=True, reopen_page=True)
 	@time_execution_async('--get_locate_element_by_xpath')
 	async def get_locate_element_by_xpath(self, xpath: str) -> ElementHandle | None:
@@ -4207,9 +4277,10 @@ class BrowserSession(BaseModel):
 	@require_healthy_browser(usable_page=True, reopen_page=True)
 	async def get_scroll_info(self, page: Page) -> tuple[int, int]:
 		"""Get scroll position information for the current page."""
-		scroll_y = await page.evaluate('window.scrollY')
-		viewport_height = await page.evaluate('window.innerHeight')
-		total_height = await page.evaluate('document.documentElement.scrollHeight')
+		# one round trip instead of three
+		scroll_y, viewport_height, total_height = await page.evaluate(
+			'[window.scrollY, window.innerHeight, document.documentElement.scrollHeight]'
+		)
 		# Convert to int to handle fractional pixels
 		pixels_above = int(scroll_y)
 		pixels_below = int(max(0, total_height - (scroll_y + viewport_height)))
@@ -4284,7 +4355,7 @@ class BrowserSession(BaseModel):
 		"""
 		try:
 			# Use CDP to synthesize scroll gesture - works in all contexts including PDFs
-			cdp_session = await page.context.new_cdp_session(page)  # type: ignore
+			cdp_session = await self._cdp_sessions.get(page)
 
 			# Get viewport center for scroll origin
 			viewport = await page.evaluate("""
@@ -4309,14 +4380,11 @@ class BrowserSession(BaseModel):
 				},
 			)
 
-			try:
-				await asyncio.wait_for(cdp_session.detach(), timeout=1.0)
-			except (TimeoutError, Exception):
-				pass
 			self.logger.debug(f'📄 Scrolled via CDP Input.synthesizeScrollGesture: {pixels}px')
 			return True
 
 		except Exception as e:
+			await self._cdp_sessions.discard(page)
 			self.logger.warning(f'❌ Scrolling via CDP Input.synthesizeScrollGesture failed: {type(e).__name__}: {e}')
 			return False
 
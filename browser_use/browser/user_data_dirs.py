@@ -0,0 +1,102 @@
+"""
+Which processes on this machine are using which chrome user_data_dir, for the SingletonLock checks of BrowserSession.
+
+Finding out means reading the command line of every process on the host, which takes hundreds of milliseconds on
+machines with hundreds of chrome processes. The index is built in one pass, shared by all BrowserSessions and reused
+for a short time. Browsers launched by this python process are registered directly, so conflicts between
+sessions of the same process are found without scanning, and stopping them removes them from the last scan too.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+USER_DATA_DIR_INDEX_TTL = 2.0  # seconds a scan of the running processes is reused
+
+
+class UserDataDirIndex:
+	"""user_data_dir -> pids of the processes running with it"""
+
+	def __init__(self, ttl: float = USER_DATA_DIR_INDEX_TTL):
+		self.ttl = ttl
+		self._lock = threading.Lock()
+		self._scanned: dict[str, set[int]] = {}
+		self._scanned_at: float | None = None
+		self._registered: dict[str, set[int]] = {}  # browsers launched by this process
+
+	def pids_using(self, user_data_dir: str | Path, exclude_pid: int | None = None, fresh: bool = False) -> set[int]:
+		"""
+		The pids of the running processes with --user-data-dir=user_data_dir, except exclude_pid (e.g. our own browser).
+
+		fresh=True scans the processes again instead of reusing a recent scan, for decisions that can't be undone like
+		deleting the SingletonLock of a browser that may have been started since.
+		"""
+		key = _normalize(user_data_dir)
+		with self._lock:
+			registered = {pid for pid in self._registered.get(key, ()) if pid != exclude_pid and _is_running(pid)}
+			if registered:
+				return registered  # held by a browser of this process, no need to look at the others
+
+			if fresh or self._scanned_at is None or time.monotonic() - self._scanned_at > self.ttl:
+				self._scan()
+			return {pid for pid in self._scanned.get(key, ()) if pid != exclude_pid}
+
+	def register(self, user_data_dir: str | Path, pid: int) -> None:
+		"""Record a browser this process launched, no need to scan again to find it"""
+		with self._lock:
+			self._registered.setdefault(_normalize(user_data_dir), set()).add(pid)
+
+	def unregister(self, pid: int) -> None:
+		"""Forget a browser this process launched when it gets stopped, the last scan may have seen it as well"""
+		with self._lock:
+			for index in (self._registered, self._scanned):
+				for pids in index.values():
+					pids.discard(pid)
+			self._registered = {key: pids for key, pids in self._registered.items() if pids}
+
+	def _scan(self) -> None:
+		start = time.monotonic()
+		scanned: dict[str, set[int]] = {}
+		normalized: dict[str, str] = {}  # most chrome processes share a handful of dirs, resolve each path once
+		for proc in psutil.process_iter(['pid', 'cmdline']):
+			for user_data_dir in _user_data_dir_args(proc.info['cmdline'] or ()):
+				if user_data_dir not in normalized:
+					normalized[user_data_dir] = _normalize(user_data_dir)
+				scanned.setdefault(normalized[user_data_dir], set()).add(proc.info['pid'])
+		self._scanned = scanned
+		self._scanned_at = time.monotonic()
+		logger.debug(f'🔍 Indexed {len(scanned)} user_data_dirs of running processes in {self._scanned_at - start:.3f}s')
+
+
+def _user_data_dir_args(cmdline: Iterable[str]) -> Iterable[str]:
+	"""The values of --user-data-dir=/path and --user-data-dir /path"""
+	args = list(cmdline)
+	for i, arg in enumerate(args):
+		if arg.startswith('--user-data-dir='):
+			yield arg.split('=', 1)[1]
+		elif arg == '--user-data-dir' and i + 1 < len(args):
+			yield args[i + 1]
+
+
+def _normalize(user_data_dir: str | Path) -> str:
+	try:
+		return str(Path(user_data_dir).expanduser().resolve())
+	except Exception:
+		# Fallback to string comparison if path resolution fails
+		return str(user_data_dir)
+
+
+def _is_running(pid: int) -> bool:
+	try:
+		return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+	except psutil.Error:
+		return False
+
+
+USER_DATA_DIR_INDEX = UserDataDirIndex()
@@ -1,3 +1,6 @@
+from pathlib import Path
+
+
 def normalize_url(url: str) -> str:
 	"""
 	Normalize a URL by adding https:// protocol if needed, while preserving special URLs.
@@ -36,3 +39,28 @@ def normalize_url(url: str) -> str:
 
 	# For everything else, add https://
 	return f'https://{normalized_url}'
+
+
+DEVTOOLS_ACTIVE_PORT_FILE = 'DevToolsActivePort'
+
+
+def read_devtools_active_port(user_data_dir: str | Path) -> int | None:
+	"""
+	Read the CDP port from the DevToolsActivePort file that chrome writes to its user_data_dir once the CDP server is listening.
+
+	The file contains the port on the first line and the browser websocket path on the second one, e.g.:
+	    9222
+	    /devtools/browser/387adf4c-243f-4051-a181-46798f4a46f4
+
+	Returns:
+	    int | None: The port, or None if the file does not exist (yet) or is incomplete
+	"""
+	try:
+		content = (Path(user_data_dir) / DEVTOOLS_ACTIVE_PORT_FILE).read_text()
+	except OSError:
+		return None
+	lines = content.splitlines()
+	# chrome may not be done writing it, only trust it once both lines are there
+	if len(lines) < 2 or not lines[0].strip().isdigit():
+		return None
+	return int(lines[0])
@@ -3,6 +3,7 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from browser_use.browser.screenshot_store import ScreenshotBlob, ScreenshotField
 from browser_use.dom.history_tree_processor.service import DOMHistoryElement
 from browser_use.dom.views import DOMState
 
@@ -60,6 +61,9 @@ class BrowserStateSummary(DOMState):
 	pixels_below: int = 0
 	browser_errors: list[str] = field(default_factory=list)
 
+	# seconds each probe of the state capture took (dom, screenshot, tabs, ...), for finding slow steps
+	probe_timings: dict[str, float] = field(default_factory=dict)
+
 
 @dataclass
 class BrowserStateHistory:
@@ -69,12 +73,17 @@ class BrowserStateHistory:
 	title: str
 	tabs: list[TabInfo]
 	interacted_element: list[DOMHistoryElement | None] | list[None]
-	screenshot: str | None = None
+	# base64 PNG, stored as a deduplicated ScreenshotBlob that may only be loaded from disk when accessed
+	screenshot: str | None = ScreenshotField()  # type: ignore[assignment]
+
+	@property
+	def screenshot_blob(self) -> ScreenshotBlob | None:
+		return BrowserStateHistory.__dict__['screenshot'].get_blob(self)
 
-	def to_dict(self) -> dict[str, Any]:
+	def to_dict(self, include_screenshot: bool = True) -> dict[str, Any]:
 		data = {}
 		data['tabs'] = [tab.model_dump() for tab in self.tabs]
-		data['screenshot'] = self.screenshot
+		data['screenshot'] = self.screenshot if include_screenshot else None
 		data['interacted_element'] = [el.to_dict() if el else None for el in self.interacted_element]
 		data['url'] = self.url
 		data['title'] = self.title
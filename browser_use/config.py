@@ -152,6 +152,28 @@ class OldConfig:
 	def SKIP_LLM_API_KEY_VERIFICATION(self) -> bool:
 		return os.getenv('SKIP_LLM_API_KEY_VERIFICATION', 'false').lower()[:1] in 'ty1'
 
+	# HTTP connection pool shared by the LLM providers and cloud sync
+	@property
+	def BROWSER_USE_HTTP_MAX_CONNECTIONS(self) -> int:
+		return int(os.getenv('BROWSER_USE_HTTP_MAX_CONNECTIONS', '1000'))
+
+	@property
+	def BROWSER_USE_HTTP_MAX_KEEPALIVE_CONNECTIONS(self) -> int:
+		return int(os.getenv('BROWSER_USE_HTTP_MAX_KEEPALIVE_CONNECTIONS', '100'))
+
+	@property
+	def BROWSER_USE_HTTP_KEEPALIVE_EXPIRY(self) -> float:
+		return float(os.getenv('BROWSER_USE_HTTP_KEEPALIVE_EXPIRY', '60'))
+
+	@property
+	def BROWSER_USE_HTTP2(self) -> bool:
+		return os.getenv('BROWSER_USE_HTTP2', 'true').lower()[:1] in 'ty1'
+
+	# Token cost pricing index, set to false in air-gapped environments to only use the bundled prices
+	@property
+	def BROWSER_USE_PRICING_REFRESH(self) -> bool:
+		return os.getenv('BROWSER_USE_PRICING_REFRESH', 'true').lower()[:1] in 'ty1'
+
 	# Runtime hints
 	@property
 	def IN_DOCKER(self) -> bool:
@@ -194,6 +216,13 @@ class FlatEnvConfig(BaseSettings):
 	AZURE_OPENAI_KEY: str = Field(default='')
 	SKIP_LLM_API_KEY_VERIFICATION: bool = Field(default=False)
 
+	# HTTP connection pool
+	BROWSER_USE_HTTP_MAX_CONNECTIONS: int = Field(default=1000)
+	BROWSER_USE_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=100)
+	BROWSER_USE_HTTP_KEEPALIVE_EXPIRY: float = Field(default=60)
+	BROWSER_USE_HTTP2: bool = Field(default=True)
+	BROWSER_USE_PRICING_REFRESH: bool = Field(default=True)
+
 	# Runtime hints
 	IN_DOCKER: bool | None = Field(default=None)
 	IS_IN_EVALS: bool = Field(default=False)
@@ -2,7 +2,6 @@ import asyncio
 import functools
 import inspect
 import logging
-import re
 from collections.abc import Callable
 from inspect import Parameter, iscoroutinefunction, signature
 from types import UnionType
@@ -21,8 +20,9 @@ from browser_use.controller.registry.views import (
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
 from browser_use.observability import observe_debug
+from browser_use.sensitive_data import SensitiveDataIndex, get_sensitive_data_index, replace_placeholders
 from browser_use.telemetry.service import ProductTelemetry
-from browser_use.utils import is_new_tab_page, match_url_with_domain_pattern, time_execution_async
+from browser_use.utils import is_new_tab_page, time_execution_async
 
 Context = TypeVar('Context')
 
@@ -36,6 +36,10 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# action set (ids of the RegisteredActions) -> (the actions, to keep their ids valid, the model class for them)
+		self._action_model_cache: dict[tuple[int, ...], tuple[list[RegisteredAction], type[ActionModel]]] = {}
+		# lookups for the sensitive_data passed to execute_action, rebuilt when the secrets change
+		self._sensitive_data_index: SensitiveDataIndex | None = None
 
 	def _get_special_param_types(self) -> dict[str, type | UnionType | None]:
 		"""Get the expected types for special parameters from SpecialActionParameters"""
@@ -413,45 +417,20 @@ class Registry(Generic[Context]):
 		Returns:
 			BaseModel: The parameter object with placeholders replaced by actual values
 		"""
-		secret_pattern = re.compile(r'<secret>(.*?)</secret>')
+		index = self._sensitive_data_index = get_sensitive_data_index(sensitive_data, self._sensitive_data_index)
+		# only the secrets for the current domain (domain-specific ones are not exposed on other pages or without a url)
+		applicable_secrets = index.secrets_for_url(current_url)
 
 		# Set to track all missing placeholders across the full object
-		all_missing_placeholders = set()
+		all_missing_placeholders: set[str] = set()
 		# Set to track successfully replaced placeholders
-		replaced_placeholders = set()
-
-		# Process sensitive data based on format and current URL
-		applicable_secrets = {}
-
-		for domain_or_key, content in sensitive_data.items():
-			if isinstance(content, dict):
-				# New format: {domain_pattern: {key: value}}
-				# Only include secrets for domains that match the current URL
-				if current_url and not is_new_tab_page(current_url):
-					# it's a real url, check it using our custom allowed_domains scheme://*.example.com glob matching
-					if match_url_with_domain_pattern(current_url, domain_or_key):
-						applicable_secrets.update(content)
-			else:
-				# Old format: {key: value}, expose to all domains (only allowed for legacy reasons)
-				applicable_secrets[domain_or_key] = content
-
-		# Filter out empty values
-		applicable_secrets = {k: v for k, v in applicable_secrets.items() if v}
+		replaced_placeholders: set[str] = set()
 
 		def recursively_replace_secrets(value: str | dict | list) -> str | dict | list:
 			if isinstance(value, str):
-				matches = secret_pattern.findall(value)
-
-				for placeholder in matches:
-					if placeholder in applicable_secrets:
-						value = value.replace(f'<secret>{placeholder}</secret>', applicable_secrets[placeholder])
-						replaced_placeholders.add(placeholder)
-					else:
-						# Keep track of missing placeholders
-						all_missing_placeholders.add(placeholder)
-						# Don't replace the tag, keep it as is
-
-				return value
+				if '<secret>' not in value:
+					return value
+				return replace_placeholders(value, applicable_secrets, replaced_placeholders, all_missing_placeholders)
 			elif isinstance(value, dict):
 				return {k: recursively_replace_secrets(v) for k, v in value.items()}
 			elif isinstance(value, list):
@@ -480,28 +459,13 @@ class Registry(Generic[Context]):
 		"""
 		from typing import Union
 
-		# Filter actions based on page if provided:
-		#   if page is None, only include actions with no filters
-		#   if page is provided, only include actions that match the page
-
-		available_actions: dict[str, RegisteredAction] = {}
-		for name, action in self.registry.actions.items():
-			if include_actions is not None and name not in include_actions:
-				continue
+		available_actions = self._get_available_actions(include_actions, page)
 
-			# If no page provided, only include actions with no filters
-			if page is None:
-				if action.page_filter is None and action.domains is None:
-					available_actions[name] = action
-				continue
-
-			# Check page_filter if present
-			domain_is_allowed = self.registry._match_domains(action.domains, page.url)
-			page_is_allowed = self.registry._match_page_filter(action.page_filter, page)
-
-			# Include action if both filters match (or if either is not present)
-			if domain_is_allowed and page_is_allowed:
-				available_actions[name] = action
+		# pages with the same filtered set of actions share the model class (and with it the JSON schema, which
+		# LLM providers can cache), instead of building new classes every step
+		cache_key = tuple(id(action) for action in available_actions.values())
+		if cache_key in self._action_model_cache:
+			return self._action_model_cache[cache_key][1]
 
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
@@ -522,10 +486,10 @@ class Registry(Generic[Context]):
 
 		# If no actions available, return empty ActionModel
 		if not individual_action_models:
-			return create_model('EmptyActionModel', __base__=ActionModel)
+			result_model = create_model('EmptyActionModel', __base__=ActionModel)
 
 		# Create proper Union type that maintains ActionModel interface
-		if len(individual_action_models) == 1:
+		elif len(individual_action_models) == 1:
 			# If only one action, return it directly (no Union needed)
 			result_model = individual_action_models[0]
 
@@ -560,8 +524,36 @@ class Registry(Generic[Context]):
 
 			result_model = ActionModelUnion
 
+		self._action_model_cache[cache_key] = (list(available_actions.values()), result_model)  # type: ignore
 		return result_model  # type:ignore
 
+	def _get_available_actions(self, include_actions: list[str] | None = None, page=None) -> dict[str, RegisteredAction]:
+		"""Registered actions that are available on the page, see create_action_model"""
+		# Filter actions based on page if provided:
+		#   if page is None, only include actions with no filters
+		#   if page is provided, only include actions that match the page
+
+		available_actions: dict[str, RegisteredAction] = {}
+		for name, action in self.registry.actions.items():
+			if include_actions is not None and name not in include_actions:
+				continue
+
+			# If no page provided, only include actions with no filters
+			if page is None:
+				if action.page_filter is None and action.domains is None:
+					available_actions[name] = action
+				continue
+
+			# Check page_filter if present
+			domain_is_allowed = self.registry._match_domains(action.domains, page.url)
+			page_is_allowed = self.registry._match_page_filter(action.page_filter, page)
+
+			# Include action if both filters match (or if either is not present)
+			if domain_is_allowed and page_is_allowed:
+				available_actions[name] = action
+
+		return available_actions
+
 	def get_prompt_description(self, page=None) -> str:
 		"""Get a description of all actions for the prompt
 
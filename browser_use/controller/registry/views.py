@@ -1,7 +1,7 @@
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.types import Page
@@ -26,8 +26,16 @@ class RegisteredAction(BaseModel):
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	# the JSON schema of the param model doesn't change, the description is built once instead of every step
+	_prompt_description: str | None = PrivateAttr(default=None)
+
 	def prompt_description(self) -> str:
 		"""Get a description of the action for the prompt"""
+		if self._prompt_description is None:
+			self._prompt_description = self._build_prompt_description()
+		return self._prompt_description
+
+	def _build_prompt_description(self) -> str:
 		skip_keys = ['title']
 		s = f'{self.description}: \n'
 		s += '{' + str(self.name) + ': '
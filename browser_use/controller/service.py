@@ -3,7 +3,6 @@ import enum
 import json
 import logging
 import os
-import re
 from typing import Generic, TypeVar, cast
 
 try:
@@ -32,6 +31,7 @@ from browser_use.controller.views import (
 	SwitchTabAction,
 	UploadFileAction,
 )
+from browser_use.dom.markdown_extractor.service import MarkdownExtractor
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.messages import UserMessage
@@ -55,6 +55,7 @@ class Controller(Generic[Context]):
 	):
 		self.registry = Registry[Context](exclude_actions)
 		self.display_files_in_done_text = display_files_in_done_text
+		self.markdown_extractor = MarkdownExtractor()
 
 		"""Register all default browser actions"""
 
@@ -327,70 +328,7 @@ Only use this for specific queries for information retrieval from the page. Don'
 			page_extraction_llm: BaseChatModel,
 			file_system: FileSystem,
 		):
-			from functools import partial
-
-			import markdownify
-
-			strip = []
-
-			if not extract_links:
-				strip = ['a', 'img']
-
-			# Run markdownify in a thread pool to avoid blocking the event loop
-			loop = asyncio.get_event_loop()
-
-			# Aggressive timeout for page content
-			try:
-				page_html_result = await asyncio.wait_for(page.content(), timeout=10.0)  # 5 second aggressive timeout
-			except TimeoutError:
-				raise RuntimeError('Page content extraction timed out after 5 seconds')
-			except Exception as e:
-				raise RuntimeError(f"Couldn't extract page content: {e}")
-
-			page_html = page_html_result
-
-			markdownify_func = partial(markdownify.markdownify, strip=strip)
-
-			try:
-				content = await asyncio.wait_for(
-					loop.run_in_executor(None, markdownify_func, page_html), timeout=5.0
-				)  # 5 second aggressive timeout
-			except Exception as e:
-				logger.warning(f'Markdownify failed: {type(e).__name__}')
-				raise RuntimeError(f'Could not convert html to markdown: {type(e).__name__}')
-
-			# manually append iframe text into the content so it's readable by the LLM (includes cross-origin iframes)
-			for iframe in page.frames:
-				try:
-					await iframe.wait_for_load_state(timeout=1000)  # 1 second aggressive timeout for iframe load
-				except Exception:
-					pass
-
-				if iframe.url != page.url and not iframe.url.startswith('data:') and not iframe.url.startswith('about:'):
-					content += f'\n\nIFRAME {iframe.url}:\n'
-					# Run markdownify in a thread pool for iframe content as well
-					try:
-						# Aggressive timeouts for iframe content
-						iframe_html = await asyncio.wait_for(iframe.content(), timeout=2.0)  # 2 second aggressive timeout
-						iframe_markdown = await asyncio.wait_for(
-							loop.run_in_executor(None, markdownify_func, iframe_html),
-							timeout=2.0,  # 2 second aggressive timeout for iframe markdownify
-						)
-					except Exception:
-						iframe_markdown = ''  # Skip failed iframes
-					content += iframe_markdown
-			# replace multiple sequential \n with a single \n
-			content = re.sub(r'\n+', '\n', content)
-
-			# limit to 30000 characters - remove text in the middle (≈15000 tokens)
-			max_chars = 30000
-			if len(content) > max_chars:
-				logger.info(f'Content is too long, removing middle {len(content) - max_chars} characters')
-				content = (
-					content[: max_chars // 2]
-					+ '\n... left out the middle because it was too long ...\n'
-					+ content[-max_chars // 2 :]
-				)
+			content = await self.markdown_extractor.extract(page, extract_links=extract_links, query=query)
 
 			prompt = """You convert websites into structured information. Extract information from this webpage based on the query. Focus only on content relevant to the query. If 
 1. The query is vague
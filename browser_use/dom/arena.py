@@ -0,0 +1,445 @@
+from array import array
+from typing import Any
+
+from browser_use.dom.history_tree_processor.view import ViewportInfo
+from browser_use.dom.views import (
+	DEFAULT_INCLUDE_ATTRIBUTES,
+	DOMBaseNode,
+	DOMElementNode,
+	DOMTextNode,
+	SelectorMap,
+	format_clickable_element_line,
+)
+from browser_use.utils import time_execution_sync
+
+# bit flags stored per node in DOMTreeArena.flags
+FLAG_TEXT = 1 << 0
+FLAG_VISIBLE = 1 << 1
+FLAG_INTERACTIVE = 1 << 2
+FLAG_TOP_ELEMENT = 1 << 3
+FLAG_IN_VIEWPORT = 1 << 4
+FLAG_SHADOW_ROOT = 1 << 5
+
+
+class DOMTreeArena:
+	"""
+	Columnar storage for a DOM tree, as an alternative to one DOMElementNode/DOMTextNode object per node.
+
+	Nodes are stored in pre-order (a parent always comes before its children, and the subtree of node i
+	is the index range [i, subtree_end[i])) across parallel arrays, with all strings interned in a single
+	string table. Children and attributes are stored as ranges into flat arrays (CSR layout).
+
+	Lightweight views (DOMElementNodeView / DOMTextNodeView) expose the regular DOMElementNode / DOMTextNode
+	API on top of the arena, and are only created for the nodes that are actually accessed.
+	"""
+
+	def __init__(self) -> None:
+		self.strings: list[Any] = []
+		self._string_ids: dict[Any, int] = {}
+
+		self.flags = bytearray()
+		self.tag = array('i')  # string id of the tag name (elements) or of the text (text nodes)
+		self.xpath = array('i')  # string id, -1 for text nodes
+		self.highlight_index = array('i')  # -1 if the node has no highlight index
+		self.parent = array('i')  # -1 for the root
+		self.depth = array('i')  # depth in the tree, 0 for the root
+		self.subtree_end = array('i')
+		self.child_start = array('i')
+		self.child_end = array('i')
+		self.children = array('i')
+		self.attr_start = array('i')
+		self.attr_end = array('i')
+		self.attr_keys = array('i')
+		self.attr_values = array('i')
+
+		# rare or mutable per-node state, kept sparse
+		self.viewport_info: dict[int, ViewportInfo] = {}
+		self.is_new: dict[int, bool | None] = {}
+
+		self._views: list[DOMBaseNode | None] = []
+
+	def __len__(self) -> int:
+		return len(self.flags)
+
+	def _intern(self, value: Any) -> int:
+		string_id = self._string_ids.get(value)
+		if string_id is None:
+			string_id = len(self.strings)
+			self.strings.append(value)
+			self._string_ids[value] = string_id
+		return string_id
+
+	def _append_node(
+		self,
+		parent: int,
+		depth: int,
+		flags: int,
+		tag_or_text: str,
+		xpath: str | None = None,
+		attributes: dict[str, str] | None = None,
+		highlight_index: int | None = None,
+	) -> int:
+		index = len(self.flags)
+		self.flags.append(flags)
+		self.tag.append(self._intern(tag_or_text))
+		self.xpath.append(self._intern(xpath) if xpath is not None else -1)
+		self.highlight_index.append(highlight_index if highlight_index is not None else -1)
+		self.parent.append(parent)
+		self.depth.append(depth)
+		self.subtree_end.append(index + 1)
+
+		self.attr_start.append(len(self.attr_keys))
+		for key, value in (attributes or {}).items():
+			self.attr_keys.append(self._intern(key))
+			self.attr_values.append(self._intern(value))
+		self.attr_end.append(len(self.attr_keys))
+		return index
+
+	def _finalize(self) -> None:
+		"""Compute subtree ranges and child ranges once all nodes have been appended in pre-order."""
+		size = len(self.flags)
+		parent = self.parent
+
+		# every node's subtree ends where the subtree of its last descendant ends
+		subtree_end = self.subtree_end
+		for index in range(size - 1, 0, -1):
+			parent_index = parent[index]
+			if subtree_end[index] > subtree_end[parent_index]:
+				subtree_end[parent_index] = subtree_end[index]
+
+		child_count = array('i', bytes(4 * size))
+		for index in range(1, size):
+			child_count[parent[index]] += 1
+
+		offset = 0
+		for index in range(size):
+			self.child_start.append(offset)
+			offset += child_count[index]
+			self.child_end.append(self.child_start[index])
+
+		self.children = array('i', bytes(4 * offset))
+		for index in range(1, size):
+			parent_index = parent[index]
+			self.children[self.child_end[parent_index]] = index
+			self.child_end[parent_index] += 1
+
+		self._views = [None] * size
+
+	@classmethod
+	def from_eval_page(cls, eval_page: dict) -> 'DOMTreeArena':
+		"""Build an arena directly from the result of dom_tree/index.js, without creating per-node objects."""
+		js_node_map: dict[str, dict] = eval_page['map']
+		arena = cls()
+
+		stack: list[tuple[str, int, int]] = [(str(eval_page['rootId']), -1, 0)]
+		while stack:
+			js_id, parent, depth = stack.pop()
+			node_data = js_node_map.get(js_id)
+			if not node_data:
+				continue
+
+			if node_data.get('type') == 'TEXT_NODE':
+				flags = FLAG_TEXT | (FLAG_VISIBLE if node_data['isVisible'] else 0)
+				arena._append_node(parent, depth, flags, node_data['text'])
+				continue
+
+			flags = (
+				(FLAG_VISIBLE if node_data.get('isVisible', False) else 0)
+				| (FLAG_INTERACTIVE if node_data.get('isInteractive', False) else 0)
+				| (FLAG_TOP_ELEMENT if node_data.get('isTopElement', False) else 0)
+				| (FLAG_IN_VIEWPORT if node_data.get('isInViewport', False) else 0)
+				| (FLAG_SHADOW_ROOT if node_data.get('shadowRoot', False) else 0)
+			)
+			index = arena._append_node(
+				parent,
+				depth,
+				flags,
+				node_data['tagName'],
+				xpath=node_data['xpath'],
+				attributes=node_data.get('attributes', {}),
+				highlight_index=node_data.get('highlightIndex'),
+			)
+			if 'viewport' in node_data:
+				arena.viewport_info[index] = ViewportInfo(
+					width=node_data['viewport']['width'],
+					height=node_data['viewport']['height'],
+				)
+
+			# push in reverse so the first child is popped (and numbered) first
+			for child_id in reversed(node_data.get('children', [])):
+				stack.append((str(child_id), index, depth + 1))
+
+		if not arena.flags or arena.flags[0] & FLAG_TEXT:
+			raise ValueError('Failed to parse HTML to dictionary')
+
+		arena._finalize()
+		return arena
+
+	@classmethod
+	def from_element_tree(cls, root: DOMElementNode) -> 'DOMTreeArena':
+		"""Build an arena from an existing DOMElementNode tree."""
+		arena = cls()
+
+		stack: list[tuple[DOMBaseNode, int, int]] = [(root, -1, 0)]
+		while stack:
+			node, parent, depth = stack.pop()
+			if isinstance(node, DOMTextNode):
+				arena._append_node(parent, depth, FLAG_TEXT | (FLAG_VISIBLE if node.is_visible else 0), node.text)
+				continue
+
+			assert isinstance(node, DOMElementNode)
+			flags = (
+				(FLAG_VISIBLE if node.is_visible else 0)
+				| (FLAG_INTERACTIVE if node.is_interactive else 0)
+				| (FLAG_TOP_ELEMENT if node.is_top_element else 0)
+				| (FLAG_IN_VIEWPORT if node.is_in_viewport else 0)
+				| (FLAG_SHADOW_ROOT if node.shadow_root else 0)
+			)
+			index = arena._append_node(
+				parent,
+				depth,
+				flags,
+				node.tag_name,
+				xpath=node.xpath,
+				attributes=node.attributes,
+				highlight_index=node.highlight_index,
+			)
+			if node.viewport_info is not None:
+				arena.viewport_info[index] = node.viewport_info
+			if node.is_new is not None:
+				arena.is_new[index] = node.is_new
+
+			for child in reversed(node.children):
+				stack.append((child, index, depth + 1))
+
+		arena._finalize()
+		return arena
+
+	# --- node views ---
+
+	def node(self, index: int) -> DOMBaseNode:
+		"""Get the (cached) view for the node at `index`."""
+		view = self._views[index]
+		if view is None:
+			if self.flags[index] & FLAG_TEXT:
+				view = DOMTextNodeView(self, index)
+			else:
+				view = DOMElementNodeView(self, index)
+			self._views[index] = view
+		return view
+
+	@property
+	def root(self) -> 'DOMElementNodeView':
+		root = self.node(0)
+		assert isinstance(root, DOMElementNodeView)
+		return root
+
+	def selector_map(self) -> SelectorMap:
+		"""Map of highlight index -> element view, in document order."""
+		return {
+			self.highlight_index[index]: self.node(index)  # type: ignore[misc]
+			for index in range(len(self.flags))
+			if self.highlight_index[index] != -1
+		}
+
+	def get_attributes(self, index: int) -> dict[str, str]:
+		strings = self.strings
+		return {
+			strings[self.attr_keys[position]]: strings[self.attr_values[position]]
+			for position in range(self.attr_start[index], self.attr_end[index])
+		}
+
+	# --- serialization ---
+
+	def get_all_text_till_next_clickable_element(self, index: int, max_depth: int = -1) -> str:
+		"""Same as DOMElementNode.get_all_text_till_next_clickable_element(), as a scan over the node's subtree."""
+		text_parts = []
+		flags = self.flags
+		base_depth = self.depth[index]
+
+		position = index + 1
+		end = self.subtree_end[index]
+		while position < end:
+			if max_depth != -1 and self.depth[position] - base_depth > max_depth:
+				position = self.subtree_end[position]
+				continue
+
+			if flags[position] & FLAG_TEXT:
+				text_parts.append(self.strings[self.tag[position]])
+			elif self.highlight_index[position] != -1:
+				# skip the whole subtree of nested clickable elements
+				position = self.subtree_end[position]
+				continue
+			position += 1
+
+		return '\n'.join(text_parts).strip()
+
+	@time_execution_sync('--clickable_elements_to_string (arena)')
+	def clickable_elements_to_string(self, include_attributes: list[str] | None = None, root: int = 0) -> str:
+		"""Same output as DOMElementNode.clickable_elements_to_string(), computed with two linear scans instead of recursion."""
+		if not include_attributes:
+			include_attributes = DEFAULT_INCLUDE_ATTRIBUTES
+
+		flags = self.flags
+		parent = self.parent
+		highlight_index = self.highlight_index
+		strings = self.strings
+		end = self.subtree_end[root]
+
+		# first pass: output depth of every node, and which clickable element owns each text node
+		# (both are indexed relative to root, a parent always comes before its children)
+		output_depth = array('i', bytes(4 * (end - root)))
+		owner = array('i', [-1]) * (end - root)
+		owned_text: dict[int, list[str]] = {}
+		for index in range(root + 1, end):
+			parent_index = parent[index]
+			parent_highlighted = highlight_index[parent_index] != -1
+			output_depth[index - root] = output_depth[parent_index - root] + (1 if parent_highlighted else 0)
+			owner[index - root] = parent_index if parent_highlighted else owner[parent_index - root]
+			if flags[index] & FLAG_TEXT and owner[index - root] != -1:
+				owned_text.setdefault(owner[index - root], []).append(strings[self.tag[index]])
+
+		# second pass: emit lines in document order
+		formatted_text = []
+		for index in range(root, end):
+			depth_str = output_depth[index - root] * '\t'
+			if flags[index] & FLAG_TEXT:
+				# Add text only if it doesn't have a highlighted parent
+				if owner[index - root] != -1:
+					continue
+				parent_flags = flags[parent[index]] if parent[index] != -1 else 0
+				if parent_flags & FLAG_VISIBLE and parent_flags & FLAG_TOP_ELEMENT:
+					formatted_text.append(f'{depth_str}{strings[self.tag[index]]}')
+			elif highlight_index[index] != -1:
+				formatted_text.append(
+					format_clickable_element_line(
+						tag_name=strings[self.tag[index]],
+						attributes=self.get_attributes(index),
+						highlight_index=highlight_index[index],
+						is_new=self.is_new.get(index),
+						text='\n'.join(owned_text.get(index, [])).strip(),
+						include_attributes=include_attributes,
+						depth_str=depth_str,
+					)
+				)
+
+		return '\n'.join(formatted_text)
+
+
+class DOMElementNodeView(DOMElementNode):
+	"""
+	Read-only DOMElementNode backed by a DOMTreeArena row instead of its own fields.
+
+	Only is_new can be set, assigning the other fields raises AttributeError and children is a tuple,
+	build a regular DOMElementNode tree (compact_dom_tree=False) to modify it.
+	"""
+
+	def __init__(self, arena: DOMTreeArena, index: int):
+		self._arena = arena
+		self._index = index
+
+	@property
+	def tag_name(self) -> str:  # type: ignore[override]
+		return self._arena.strings[self._arena.tag[self._index]]
+
+	@property
+	def xpath(self) -> str:  # type: ignore[override]
+		return self._arena.strings[self._arena.xpath[self._index]]
+
+	@property
+	def attributes(self) -> dict[str, str]:  # type: ignore[override]
+		return self._arena.get_attributes(self._index)
+
+	@property
+	def children(self) -> tuple[DOMBaseNode, ...]:  # type: ignore[override]
+		arena = self._arena
+		return tuple(arena.node(arena.children[i]) for i in range(arena.child_start[self._index], arena.child_end[self._index]))
+
+	@property
+	def parent(self) -> DOMElementNode | None:  # type: ignore[override]
+		parent_index = self._arena.parent[self._index]
+		return self._arena.node(parent_index) if parent_index != -1 else None  # type: ignore[return-value]
+
+	@property
+	def is_visible(self) -> bool:  # type: ignore[override]
+		return bool(self._arena.flags[self._index] & FLAG_VISIBLE)
+
+	@property
+	def is_interactive(self) -> bool:  # type: ignore[override]
+		return bool(self._arena.flags[self._index] & FLAG_INTERACTIVE)
+
+	@property
+	def is_top_element(self) -> bool:  # type: ignore[override]
+		return bool(self._arena.flags[self._index] & FLAG_TOP_ELEMENT)
+
+	@property
+	def is_in_viewport(self) -> bool:  # type: ignore[override]
+		return bool(self._arena.flags[self._index] & FLAG_IN_VIEWPORT)
+
+	@property
+	def shadow_root(self) -> bool:  # type: ignore[override]
+		return bool(self._arena.flags[self._index] & FLAG_SHADOW_ROOT)
+
+	@property
+	def highlight_index(self) -> int | None:  # type: ignore[override]
+		highlight_index = self._arena.highlight_index[self._index]
+		return highlight_index if highlight_index != -1 else None
+
+	@property
+	def viewport_info(self) -> ViewportInfo | None:  # type: ignore[override]
+		return self._arena.viewport_info.get(self._index)
+
+	@property
+	def viewport_coordinates(self) -> None:  # type: ignore[override]
+		return None
+
+	@property
+	def page_coordinates(self) -> None:  # type: ignore[override]
+		return None
+
+	@property
+	def is_new(self) -> bool | None:  # type: ignore[override]
+		return self._arena.is_new.get(self._index)
+
+	@is_new.setter
+	def is_new(self, value: bool | None) -> None:
+		self._arena.is_new[self._index] = value
+
+	def __eq__(self, other: object) -> bool:
+		return self is other
+
+	def __hash__(self) -> int:
+		return id(self)
+
+	def get_all_text_till_next_clickable_element(self, max_depth: int = -1) -> str:
+		return self._arena.get_all_text_till_next_clickable_element(self._index, max_depth)
+
+	def clickable_elements_to_string(self, include_attributes: list[str] | None = None) -> str:
+		return self._arena.clickable_elements_to_string(include_attributes, root=self._index)
+
+
+class DOMTextNodeView(DOMTextNode):
+	"""Read-only DOMTextNode backed by a DOMTreeArena row instead of its own fields."""
+
+	def __init__(self, arena: DOMTreeArena, index: int):
+		self._arena = arena
+		self._index = index
+
+	@property
+	def text(self) -> str:  # type: ignore[override]
+		return self._arena.strings[self._arena.tag[self._index]]
+
+	@property
+	def is_visible(self) -> bool:  # type: ignore[override]
+		return bool(self._arena.flags[self._index] & FLAG_VISIBLE)
+
+	@property
+	def parent(self) -> DOMElementNode | None:  # type: ignore[override]
+		parent_index = self._arena.parent[self._index]
+		return self._arena.node(parent_index) if parent_index != -1 else None  # type: ignore[return-value]
+
+	def __eq__(self, other: object) -> bool:
+		return self is other
+
+	def __hash__(self) -> int:
+		return id(self)
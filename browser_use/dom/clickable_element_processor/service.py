@@ -4,6 +4,13 @@ from browser_use.dom.views import DOMElementNode
 
 
 class ClickableElementProcessor:
+	"""
+	Fingerprints of the clickable elements, used to tell which elements are new since the last state.
+
+	@dev these hashes are only compared within a session and never stored, so they use a fast short
+	blake2b digest of the cached branch path instead of the SHA-256 HashedDomElement used for histories
+	"""
+
 	@staticmethod
 	def get_clickable_elements_hashes(dom_element: DOMElementNode) -> set[str]:
 		"""Get all clickable elements in the DOM tree"""
@@ -25,39 +32,16 @@ class ClickableElementProcessor:
 
 	@staticmethod
 	def hash_dom_element(dom_element: DOMElementNode) -> str:
-		parent_branch_path = ClickableElementProcessor._get_parent_branch_path(dom_element)
-		branch_path_hash = ClickableElementProcessor._parent_branch_path_hash(parent_branch_path)
-		attributes_hash = ClickableElementProcessor._attributes_hash(dom_element.attributes)
-		xpath_hash = ClickableElementProcessor._xpath_hash(dom_element.xpath)
+		attributes_string = ''.join(f'{key}={value}' for key, value in dom_element.attributes.items())
 		# text_hash = DomTreeProcessor._text_hash(dom_element)
 
-		return ClickableElementProcessor._hash_string(f'{branch_path_hash}-{attributes_hash}-{xpath_hash}')
+		# a single digest over the NUL-separated parts instead of hashing every part and then the concatenation
+		return ClickableElementProcessor._hash_string(f'{dom_element.branch_path}\0{attributes_string}\0{dom_element.xpath}')
 
 	@staticmethod
 	def _get_parent_branch_path(dom_element: DOMElementNode) -> list[str]:
-		parents: list[DOMElementNode] = []
-		current_element: DOMElementNode = dom_element
-		while current_element.parent is not None:
-			parents.append(current_element)
-			current_element = current_element.parent
-
-		parents.reverse()
-
-		return [parent.tag_name for parent in parents]
-
-	@staticmethod
-	def _parent_branch_path_hash(parent_branch_path: list[str]) -> str:
-		parent_branch_path_string = '/'.join(parent_branch_path)
-		return hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
-
-	@staticmethod
-	def _attributes_hash(attributes: dict[str, str]) -> str:
-		attributes_string = ''.join(f'{key}={value}' for key, value in attributes.items())
-		return ClickableElementProcessor._hash_string(attributes_string)
-
-	@staticmethod
-	def _xpath_hash(xpath: str) -> str:
-		return ClickableElementProcessor._hash_string(xpath)
+		branch_path = dom_element.branch_path
+		return branch_path.split('/') if branch_path else []
 
 	@staticmethod
 	def _text_hash(dom_element: DOMElementNode) -> str:
@@ -67,4 +51,4 @@ class ClickableElementProcessor:
 
 	@staticmethod
 	def _hash_string(string: str) -> str:
-		return hashlib.sha256(string.encode()).hexdigest()
+		return hashlib.blake2b(string.encode(), digest_size=16).hexdigest()
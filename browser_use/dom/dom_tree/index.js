@@ -4,9 +4,18 @@
     focusHighlightIndex: -1,
     viewportExpansion: 0,
     debugMode: false,
+    incremental: false,
+    previousSnapshotId: null,
   }
 ) => {
-  const { doHighlightElements, focusHighlightIndex, viewportExpansion, debugMode } = args;
+  const {
+    doHighlightElements,
+    focusHighlightIndex,
+    viewportExpansion,
+    debugMode,
+    incremental = false,
+    previousSnapshotId = null,
+  } = args;
   let highlightIndex = 0; // Reset highlight index
 
   // Add caching mechanisms at the top level
@@ -95,6 +104,108 @@
 
   const HIGHLIGHT_CONTAINER_ID = "playwright-highlight-container";
 
+  /**
+   * Incremental snapshot state, kept on the window between calls.
+   *
+   * Node IDs stay stable across calls (WeakMap from DOM node to ID), and a MutationObserver plus
+   * scroll/resize/load listeners flag the page as dirty whenever the previous snapshot may be stale.
+   * Only used when `incremental` is true, otherwise IDs are assigned from a fresh counter on every call.
+   */
+  const SNAPSHOT_STATE_KEY = "__browserUseDomSnapshotState";
+  const snapshotArgsKey = JSON.stringify([doHighlightElements, focusHighlightIndex, viewportExpansion]);
+  let snapshotState = null;
+  let canDiffSnapshot = false;
+
+  /**
+   * Returns true if a mutation record was caused by our own highlight overlays.
+   *
+   * @param {MutationRecord} record - The mutation record to check.
+   * @returns {boolean} Whether the mutation only touched the highlight container.
+   */
+  function isOwnMutation(record) {
+    const target = record.target.nodeType === Node.ELEMENT_NODE ? record.target : record.target.parentElement;
+    if (target && target.closest && target.closest(`#${HIGHLIGHT_CONTAINER_ID}`)) return true;
+    if (record.type !== "childList") return false;
+
+    const changedNodes = [...record.addedNodes, ...record.removedNodes];
+    return changedNodes.length > 0 && changedNodes.every(node => node.id === HIGHLIGHT_CONTAINER_ID);
+  }
+
+  /**
+   * Starts observing a document or shadow root for mutations (once per root).
+   *
+   * @param {Document | ShadowRoot} root - The root to observe.
+   */
+  function observeSnapshotRoot(root) {
+    if (!snapshotState || snapshotState.observedRoots.has(root)) return;
+    try {
+      snapshotState.observer.observe(root, { subtree: true, childList: true, attributes: true, characterData: true });
+      snapshotState.observedRoots.add(root);
+    } catch (e) {
+      // Roots we cannot observe (e.g. detached documents) force a full walk every time
+      snapshotState.dirty = true;
+    }
+  }
+
+  /**
+   * Returns the ID to use for a node in the returned map.
+   *
+   * @param {Node} node - The DOM node.
+   * @returns {string} A per-call counter ID, or a stable ID in incremental mode.
+   */
+  function getNodeId(node) {
+    if (!snapshotState) return `${ID.current++}`;
+
+    let id = snapshotState.nodeIds.get(node);
+    if (id === undefined) {
+      id = `${snapshotState.nextId++}`;
+      snapshotState.nodeIds.set(node, id);
+    }
+    return id;
+  }
+
+  if (incremental) {
+    snapshotState = window[SNAPSHOT_STATE_KEY];
+    if (!snapshotState) {
+      snapshotState = {
+        sessionKey: Math.random().toString(36).slice(2),
+        generation: 0,
+        snapshotId: null,
+        argsKey: null,
+        rootId: null,
+        nextId: 0,
+        nodeIds: new WeakMap(),
+        fingerprints: new Map(),
+        highlighted: [],
+        dirty: true,
+        observer: null,
+        observedRoots: new WeakSet(),
+      };
+      const state = snapshotState;
+      const markDirty = () => { state.dirty = true; };
+      state.observer = new MutationObserver((records) => {
+        if (records.some(record => !isOwnMutation(record))) markDirty();
+      });
+      // Layout can change without DOM mutations (scrolling, resizing, images finishing loading)
+      window.addEventListener("scroll", markDirty, { capture: true, passive: true });
+      window.addEventListener("resize", markDirty, { passive: true });
+      window.addEventListener("load", markDirty, { capture: true, passive: true });
+      Object.defineProperty(window, SNAPSHOT_STATE_KEY, { value: state, configurable: true, enumerable: false });
+    }
+
+    observeSnapshotRoot(document);
+    // Flush records queued since the last call (e.g. remove_highlights() removing our container)
+    if (snapshotState.observer.takeRecords().some(record => !isOwnMutation(record))) {
+      snapshotState.dirty = true;
+    }
+
+    canDiffSnapshot = (
+      previousSnapshotId !== null &&
+      snapshotState.snapshotId === previousSnapshotId &&
+      snapshotState.argsKey === snapshotArgsKey
+    );
+  }
+
   // Add a WeakMap cache for XPath strings
   const xpathCache = new WeakMap();
 
@@ -1145,6 +1256,15 @@
       if (nodeData.isInViewport || viewportExpansion === -1) {
         nodeData.highlightIndex = highlightIndex++;
 
+        if (snapshotState) {
+          // Remember highlighted elements so an unchanged snapshot can redraw them without a new walk
+          snapshotState.highlighted.push({
+            index: nodeData.highlightIndex,
+            element: new WeakRef(node),
+            parentIframe: parentIframe ? new WeakRef(parentIframe) : null,
+          });
+        }
+
         if (doHighlightElements) {
           if (focusHighlightIndex >= 0) {
             if (focusHighlightIndex === nodeData.highlightIndex) {
@@ -1197,7 +1317,7 @@
         if (domElement) nodeData.children.push(domElement);
       }
 
-      const id = `${ID.current++}`;
+      const id = getNodeId(node);
       DOM_HASH_MAP[id] = nodeData;
       return id;
     }
@@ -1220,7 +1340,7 @@
         return null;
       }
 
-      const id = `${ID.current++}`;
+      const id = getNodeId(node);
       DOM_HASH_MAP[id] = {
         type: "TEXT_NODE",
         text: textContent,
@@ -1314,6 +1434,7 @@
         try {
           const iframeDoc = node.contentDocument || node.contentWindow?.document;
           if (iframeDoc) {
+            observeSnapshotRoot(iframeDoc);
             for (const child of iframeDoc.childNodes) {
               const domElement = buildDomTree(child, node, false);
               if (domElement) nodeData.children.push(domElement);
@@ -1341,6 +1462,7 @@
         // Handle shadow DOM
         if (node.shadowRoot) {
           nodeData.shadowRoot = true;
+          observeSnapshotRoot(node.shadowRoot);
           for (const child of node.shadowRoot.childNodes) {
             const domElement = buildDomTree(child, parentIframe, nodeWasHighlighted);
             if (domElement) nodeData.children.push(domElement);
@@ -1367,15 +1489,71 @@
       }
     }
 
-    const id = `${ID.current++}`;
+    const id = getNodeId(node);
     DOM_HASH_MAP[id] = nodeData;
     return id;
   }
 
+  if (snapshotState && canDiffSnapshot && !snapshotState.dirty) {
+    // Nothing changed since the previous snapshot: skip the walk, just redraw the highlights
+    if (doHighlightElements) {
+      for (const { index, element, parentIframe } of snapshotState.highlighted) {
+        const highlightedNode = element.deref();
+        if (highlightedNode && (focusHighlightIndex < 0 || focusHighlightIndex === index)) {
+          highlightElement(highlightedNode, index, parentIframe?.deref() ?? null);
+        }
+      }
+      snapshotState.observer.takeRecords();
+    }
+    return {
+      rootId: snapshotState.rootId,
+      snapshotId: snapshotState.snapshotId,
+      baseSnapshotId: previousSnapshotId,
+      unchanged: true,
+      map: {},
+      removed: [],
+    };
+  }
+
+  if (snapshotState) {
+    snapshotState.highlighted = [];
+  }
+
   const rootId = buildDomTree(document.body);
 
   // Clear the cache before starting
   DOM_CACHE.clearCache();
 
+  if (snapshotState) {
+    // Only send the nodes whose serialized data changed since the previous snapshot
+    const fingerprints = new Map();
+    const changedNodes = {};
+    for (const [id, nodeData] of Object.entries(DOM_HASH_MAP)) {
+      const fingerprint = JSON.stringify(nodeData);
+      fingerprints.set(id, fingerprint);
+      if (!canDiffSnapshot || snapshotState.fingerprints.get(id) !== fingerprint) {
+        changedNodes[id] = nodeData;
+      }
+    }
+    const removed = canDiffSnapshot ? [...snapshotState.fingerprints.keys()].filter(id => !fingerprints.has(id)) : [];
+
+    snapshotState.fingerprints = fingerprints;
+    snapshotState.snapshotId = `${snapshotState.sessionKey}:${++snapshotState.generation}`;
+    snapshotState.argsKey = snapshotArgsKey;
+    snapshotState.rootId = rootId;
+    snapshotState.dirty = false;
+    // Discard the records produced by our own highlighting during this call
+    snapshotState.observer.takeRecords();
+
+    return {
+      rootId,
+      snapshotId: snapshotState.snapshotId,
+      baseSnapshotId: canDiffSnapshot ? previousSnapshotId : null,
+      unchanged: false,
+      map: changedNodes,
+      removed,
+    };
+  }
+
   return { rootId, map: DOM_HASH_MAP };
 };
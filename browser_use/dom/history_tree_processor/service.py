@@ -1,4 +1,5 @@
 import hashlib
+from functools import lru_cache
 
 from browser_use.dom.history_tree_processor.view import DOMHistoryElement, HashedDomElement
 from browser_use.dom.views import DOMElementNode
@@ -36,7 +37,7 @@ class HistoryTreeProcessor:
 
 		def process_node(node: DOMElementNode):
 			if node.highlight_index is not None:
-				hashed_node = HistoryTreeProcessor._hash_dom_element(node)
+				hashed_node = node.hash
 				if hashed_node == hashed_dom_history_element:
 					return node
 			for child in node.children:
@@ -65,8 +66,8 @@ class HistoryTreeProcessor:
 
 	@staticmethod
 	def _hash_dom_element(dom_element: DOMElementNode) -> HashedDomElement:
-		parent_branch_path = HistoryTreeProcessor._get_parent_branch_path(dom_element)
-		branch_path_hash = HistoryTreeProcessor._parent_branch_path_hash(parent_branch_path)
+		# same digest as _parent_branch_path_hash(_get_parent_branch_path()), from the branch path cached on the tree
+		branch_path_hash = HistoryTreeProcessor._branch_path_string_hash(dom_element.branch_path)
 		attributes_hash = HistoryTreeProcessor._attributes_hash(dom_element.attributes)
 		xpath_hash = HistoryTreeProcessor._xpath_hash(dom_element.xpath)
 		# text_hash = DomTreeProcessor._text_hash(dom_element)
@@ -75,19 +76,17 @@ class HistoryTreeProcessor:
 
 	@staticmethod
 	def _get_parent_branch_path(dom_element: DOMElementNode) -> list[str]:
-		parents: list[DOMElementNode] = []
-		current_element: DOMElementNode = dom_element
-		while current_element.parent is not None:
-			parents.append(current_element)
-			current_element = current_element.parent
-
-		parents.reverse()
-
-		return [parent.tag_name for parent in parents]
+		branch_path = dom_element.branch_path
+		return branch_path.split('/') if branch_path else []
 
 	@staticmethod
 	def _parent_branch_path_hash(parent_branch_path: list[str]) -> str:
-		parent_branch_path_string = '/'.join(parent_branch_path)
+		return HistoryTreeProcessor._branch_path_string_hash('/'.join(parent_branch_path))
+
+	@staticmethod
+	@lru_cache(maxsize=4096)
+	def _branch_path_string_hash(parent_branch_path_string: str) -> str:
+		# siblings with the same tag share a branch path, so most of these are cache hits
 		return hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
 
 	@staticmethod
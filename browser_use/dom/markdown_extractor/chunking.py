@@ -0,0 +1,114 @@
+"""
+Query-aware selection of page markdown that doesn't fit into the extraction prompt.
+
+The markdown is split into sections (at headings, long sections at line boundaries) which are ranked against the
+extraction query with BM25. The best sections are kept within the character budget, in page order.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+DEFAULT_CHUNK_CHARS = 2000
+CHUNK_SEPARATOR = '\n...\n'
+
+_TOKEN_RE = re.compile(r'\w+')
+_HEADING_RE = re.compile(r'^#{1,6} ')
+
+# BM25 parameters, the usual defaults
+K1 = 1.5
+B = 0.75
+
+
+@dataclass
+class MarkdownChunk:
+	index: int  # position in the page
+	text: str
+	score: float = 0.0
+
+
+def tokenize(text: str) -> list[str]:
+	return _TOKEN_RE.findall(text.lower())
+
+
+def split_markdown(markdown: str, chunk_chars: int = DEFAULT_CHUNK_CHARS) -> list[MarkdownChunk]:
+	"""Split markdown into chunks of at most chunk_chars, starting a new chunk at every heading"""
+	chunks: list[MarkdownChunk] = []
+	lines: list[str] = []
+	length = 0
+
+	def flush() -> None:
+		nonlocal lines, length
+		if lines:
+			chunks.append(MarkdownChunk(index=len(chunks), text='\n'.join(lines)))
+		lines, length = [], 0
+
+	for line in markdown.split('\n'):
+		if _HEADING_RE.match(line) or length + len(line) > chunk_chars:
+			flush()
+		# single lines longer than a chunk (e.g. minified text) are split as well
+		while len(line) > chunk_chars:
+			lines.append(line[:chunk_chars])
+			flush()
+			line = line[chunk_chars:]
+		lines.append(line)
+		length += len(line) + 1
+	flush()
+	return chunks
+
+
+def score_chunks(chunks: list[MarkdownChunk], query: str) -> None:
+	"""Set the BM25 score of every chunk for the query"""
+	query_terms = set(tokenize(query))
+	if not chunks or not query_terms:
+		return
+
+	term_counts = [Counter(tokenize(chunk.text)) for chunk in chunks]
+	lengths = [sum(counts.values()) for counts in term_counts]
+	average_length = sum(lengths) / len(lengths) or 1
+
+	document_frequency = Counter(term for counts in term_counts for term in query_terms if term in counts)
+	idf = {
+		term: math.log((len(chunks) - frequency + 0.5) / (frequency + 0.5) + 1) for term, frequency in document_frequency.items()
+	}
+
+	for chunk, counts, length in zip(chunks, term_counts, lengths):
+		score = 0.0
+		for term, term_idf in idf.items():
+			frequency = counts.get(term, 0)
+			if frequency:
+				score += term_idf * frequency * (K1 + 1) / (frequency + K1 * (1 - B + B * length / average_length))
+		chunk.score = score
+
+
+def select_relevant_markdown(markdown: str, query: str, max_chars: int, chunk_chars: int = DEFAULT_CHUNK_CHARS) -> str:
+	"""
+	Keep the parts of markdown most relevant to query, at most max_chars in total.
+
+	The start of the page is always kept for context, the rest is filled with the best-ranked chunks. Chunks are
+	returned in page order, gaps are marked with CHUNK_SEPARATOR.
+	"""
+	# small enough chunks that a few different sections fit into the budget
+	chunks = split_markdown(markdown, chunk_chars=max(min(chunk_chars, max_chars // 4), 1))
+	score_chunks(chunks, query)
+
+	# the first chunk first, then by score, with the page order as tie-breaker (no matches = start of the page)
+	ranked = [chunks[0], *sorted(chunks[1:], key=lambda chunk: (-chunk.score, chunk.index))]
+	selected: list[MarkdownChunk] = []
+	used = 0
+	for chunk in ranked:
+		cost = len(chunk.text) + len(CHUNK_SEPARATOR)
+		if used + cost <= max_chars:
+			selected.append(chunk)
+			used += cost
+		elif not chunk.score:
+			break  # the remaining chunks are irrelevant, continue the page where it was cut instead of picking leftovers
+
+	selected.sort(key=lambda chunk: chunk.index)
+	parts: list[str] = []
+	for previous, chunk in zip([None, *selected], selected):
+		if previous is not None:
+			parts.append(CHUNK_SEPARATOR if chunk.index != previous.index + 1 else '\n')
+		parts.append(chunk.text)
+	return ''.join(parts)
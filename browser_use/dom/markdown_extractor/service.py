@@ -0,0 +1,322 @@
+"""
+Converts page HTML into the markdown that extract_structured_data sends to the page extraction LLM.
+
+The HTML is converted in a single streaming pass (stdlib HTMLParser, no document tree is built) that stops as soon
+as the character budget is used up, so huge pages don't spend seconds converting content that would be cut anyway.
+"""
+
+import asyncio
+import logging
+import re
+from collections import OrderedDict
+from html.parser import HTMLParser
+
+from browser_use.browser.types import Frame, Page
+from browser_use.dom.markdown_extractor.chunking import select_relevant_markdown
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CHARS = 30000  # ≈15000 tokens
+DEFAULT_MAX_SOURCE_CHARS = 300000  # how much of the page is converted to pick the relevant parts from
+TRUNCATION_NOTE = '\n... left out the rest of the page because it was too long ...'
+SELECTION_NOTE = '\n... left out the parts of the page least relevant to the query because it was too long ...'
+
+# content of these tags is never shown to the LLM
+SKIPPED_TAGS = frozenset({'head', 'script', 'style', 'noscript', 'template', 'svg', 'canvas', 'iframe', 'object'})
+BLOCK_TAGS = frozenset(
+	{
+		'address',
+		'article',
+		'aside',
+		'blockquote',
+		'dd',
+		'details',
+		'div',
+		'dl',
+		'dt',
+		'fieldset',
+		'figcaption',
+		'figure',
+		'footer',
+		'form',
+		'header',
+		'main',
+		'nav',
+		'ol',
+		'p',
+		'section',
+		'summary',
+		'table',
+		'ul',
+	}
+)
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+INLINE_MARKERS = {'b': '**', 'strong': '**', 'i': '*', 'em': '*', 'code': '`'}
+
+# how much HTML is parsed between two checks of the budget
+FEED_CHUNK_SIZE = 64 * 1024
+
+# installs a MutationObserver that counts DOM changes, the random id changes with every new document
+DOM_VERSION_JS = """() => {
+	let state = window.__browserUseDomVersion;
+	if (!state) {
+		state = window.__browserUseDomVersion = { id: Math.random().toString(36).slice(2), version: 0 };
+		new MutationObserver(() => { state.version++; }).observe(document, {
+			subtree: true, childList: true, attributes: true, characterData: true,
+		});
+	}
+	return [state.id, state.version];
+}"""
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_SPACE_RE = re.compile(r'[ \t]+\n')
+_NEWLINES_RE = re.compile(r'\n+')
+
+
+class _BudgetExhausted(Exception):
+	pass
+
+
+class _MarkdownConverter(HTMLParser):
+	"""Writes markdown while the HTML is being parsed, raises _BudgetExhausted once max_chars have been written"""
+
+	def __init__(self, extract_links: bool, max_chars: int):
+		super().__init__(convert_charrefs=True)
+		self.extract_links = extract_links
+		self.max_chars = max_chars
+		self.parts: list[str] = []
+		self.length = 0
+		self.truncated = False
+
+		self._skip_depth = 0
+		self._pre_depth = 0
+		self._last_char = '\n'
+		self._links: list[str | None] = []
+		self._lists: list[int | None] = []  # None for <ul>, the next item number for <ol>
+
+	def _write(self, text: str) -> None:
+		if not text:
+			return
+		self.parts.append(text)
+		self.length += len(text)
+		self._last_char = text[-1]
+		if self.length >= self.max_chars:
+			self.truncated = True
+			raise _BudgetExhausted
+
+	def _newline(self) -> None:
+		if self._last_char != '\n':
+			self._write('\n')
+
+	def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+		if self._skip_depth:
+			if tag in SKIPPED_TAGS:
+				self._skip_depth += 1
+			return
+		if tag in SKIPPED_TAGS:
+			self._skip_depth = 1
+			return
+
+		if tag in HEADING_TAGS:
+			self._newline()
+			self._write('#' * HEADING_TAGS[tag] + ' ')
+		elif tag == 'li':
+			self._newline()
+			indent = '  ' * max(len(self._lists) - 1, 0)
+			if self._lists and self._lists[-1] is not None:
+				number = self._lists[-1]
+				self._lists[-1] = number + 1
+				self._write(f'{indent}{number}. ')
+			else:
+				self._write(f'{indent}- ')
+		elif tag in ('ul', 'ol'):
+			self._lists.append(1 if tag == 'ol' else None)
+			self._newline()
+		elif tag in BLOCK_TAGS:
+			self._newline()
+		elif tag == 'tr':
+			self._newline()
+		elif tag in ('td', 'th'):
+			self._write('| ')
+		elif tag == 'br':
+			self._write('\n')
+		elif tag == 'hr':
+			self._newline()
+			self._write('---\n')
+		elif tag == 'pre':
+			self._pre_depth += 1
+			self._newline()
+			self._write('```\n')
+		elif tag in INLINE_MARKERS and not self._pre_depth:
+			self._write(INLINE_MARKERS[tag])
+		elif tag == 'a':
+			href = dict(attrs).get('href') if self.extract_links else None
+			self._links.append(href)
+			if href:
+				self._write('[')
+		elif tag == 'img' and self.extract_links:
+			attributes = dict(attrs)
+			if attributes.get('src'):
+				self._write(f'![{attributes.get("alt") or ""}]({attributes["src"]})')
+
+	def handle_endtag(self, tag: str) -> None:
+		if self._skip_depth:
+			if tag in SKIPPED_TAGS:
+				self._skip_depth -= 1
+			return
+
+		if tag in HEADING_TAGS or tag in BLOCK_TAGS or tag == 'li':
+			if tag in ('ul', 'ol') and self._lists:
+				self._lists.pop()
+			self._newline()
+		elif tag in ('td', 'th'):
+			self._write(' ')
+		elif tag == 'tr':
+			self._write('|\n')
+		elif tag == 'pre' and self._pre_depth:
+			self._pre_depth -= 1
+			self._newline()
+			self._write('```\n')
+		elif tag in INLINE_MARKERS and not self._pre_depth:
+			self._write(INLINE_MARKERS[tag])
+		elif tag == 'a' and self._links:
+			href = self._links.pop()
+			if href:
+				self._write(f']({href})')
+
+	def handle_data(self, data: str) -> None:
+		if self._skip_depth:
+			return
+		if self._pre_depth:
+			self._write(data)
+			return
+		text = _WHITESPACE_RE.sub(' ', data)
+		if self._last_char in '\n ':
+			text = text.lstrip(' ')
+		self._write(text)
+
+
+def html_to_markdown(html: str, extract_links: bool = False, max_chars: int = DEFAULT_MAX_CHARS) -> tuple[str, bool]:
+	"""
+	Convert HTML to markdown, stopping once max_chars have been produced.
+
+	Returns the markdown and whether it was truncated. Links and images are only kept with extract_links=True.
+	"""
+	converter = _MarkdownConverter(extract_links=extract_links, max_chars=max_chars)
+	try:
+		for start in range(0, len(html), FEED_CHUNK_SIZE):
+			converter.feed(html[start : start + FEED_CHUNK_SIZE])
+		converter.close()
+	except _BudgetExhausted:
+		pass
+
+	markdown = ''.join(converter.parts)
+	markdown = _NEWLINES_RE.sub('\n', _TRAILING_SPACE_RE.sub('\n', markdown)).strip()
+	return markdown[:max_chars], converter.truncated
+
+
+class MarkdownExtractor:
+	"""
+	Extracts the markdown of a page and its iframes for extract_structured_data.
+
+	The page and all iframes are fetched and converted concurrently, and the result is cached per URL and DOM
+	version (a counter of DOM mutations kept in the page), so repeated extractions from an unchanged page are free.
+
+	Pages longer than max_chars are reduced to the chunks most relevant to the extraction query (up to
+	max_source_chars of the page are considered), or cut after max_chars when there is no query.
+	"""
+
+	def __init__(
+		self, max_chars: int = DEFAULT_MAX_CHARS, cache_size: int = 16, max_source_chars: int = DEFAULT_MAX_SOURCE_CHARS
+	):
+		self.max_chars = max_chars
+		self.cache_size = cache_size
+		self.max_source_chars = max(max_source_chars, max_chars)
+		self._cache: OrderedDict[tuple, tuple[str, bool]] = OrderedDict()
+
+	async def extract(self, page: Page, extract_links: bool = False, query: str | None = None) -> str:
+		content, truncated = await self._get_markdown(page, extract_links)
+		if not truncated and len(content) <= self.max_chars:
+			return content
+
+		if query:
+			logger.info(f'Content is too long, only keeping the {self.max_chars} characters most relevant to the query')
+			return select_relevant_markdown(content, query, self.max_chars) + SELECTION_NOTE
+
+		logger.info(f'Content is too long, only keeping the first {self.max_chars} characters')
+		return content[: self.max_chars] + TRUNCATION_NOTE
+
+	async def _get_markdown(self, page: Page, extract_links: bool) -> tuple[str, bool]:
+		"""The markdown of the page and its iframes (at most max_source_chars each), and whether the page was cut"""
+		cache_key = await self._get_cache_key(page, extract_links)
+		if cache_key is not None and cache_key in self._cache:
+			self._cache.move_to_end(cache_key)
+			logger.debug(f'Using cached markdown for {page.url}')
+			return self._cache[cache_key]
+
+		try:
+			page_html = await asyncio.wait_for(page.content(), timeout=10.0)
+		except TimeoutError:
+			raise RuntimeError('Page content extraction timed out after 10 seconds')
+		except Exception as e:
+			raise RuntimeError(f"Couldn't extract page content: {e}")
+
+		iframes = [
+			frame
+			for frame in page.frames
+			if frame.url != page.url and not frame.url.startswith('data:') and not frame.url.startswith('about:')
+		]
+		loop = asyncio.get_running_loop()
+		try:
+			(content, truncated), *iframe_contents = await asyncio.gather(
+				asyncio.wait_for(
+					loop.run_in_executor(None, html_to_markdown, page_html, extract_links, self.max_source_chars), timeout=5.0
+				),
+				*(self._extract_iframe(iframe, extract_links) for iframe in iframes),
+			)
+		except Exception as e:
+			logger.warning(f'HTML to markdown conversion failed: {type(e).__name__}')
+			raise RuntimeError(f'Could not convert html to markdown: {type(e).__name__}')
+
+		# manually append iframe text into the content so it's readable by the LLM (includes cross-origin iframes)
+		for iframe, iframe_content in zip(iframes, iframe_contents):
+			content += f'\nIFRAME {iframe.url}:\n{iframe_content}'
+
+		if cache_key is not None:
+			self._cache[cache_key] = (content, truncated)
+			if len(self._cache) > self.cache_size:
+				self._cache.popitem(last=False)
+		return content, truncated
+
+	async def _extract_iframe(self, iframe: Frame, extract_links: bool) -> str:
+		try:
+			await iframe.wait_for_load_state(timeout=1000)  # 1 second aggressive timeout for iframe load
+		except Exception:
+			pass
+
+		try:
+			# Aggressive timeouts for iframe content
+			iframe_html = await asyncio.wait_for(iframe.content(), timeout=2.0)
+			loop = asyncio.get_running_loop()
+			markdown, _ = await asyncio.wait_for(
+				loop.run_in_executor(None, html_to_markdown, iframe_html, extract_links, self.max_source_chars), timeout=2.0
+			)
+			return markdown
+		except Exception:
+			return ''  # Skip failed iframes
+
+	@staticmethod
+	async def _get_cache_key(page: Page, extract_links: bool) -> tuple | None:
+		# an observer only sees its own document, every frame gets one so changes inside iframes invalidate the cache too
+		frames = page.frames
+		try:
+			frame_versions = await asyncio.wait_for(
+				asyncio.gather(*(frame.evaluate(DOM_VERSION_JS) for frame in frames)), timeout=1.0
+			)
+		except Exception:
+			return None  # e.g. the page or one of its frames is navigating, just don't cache
+		return (
+			page.url,
+			extract_links,
+			tuple((frame.url, *frame_version) for frame, frame_version in zip(frames, frame_versions)),
+		)
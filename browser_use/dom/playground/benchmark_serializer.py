@@ -0,0 +1,76 @@
+"""
+Benchmark clickable_elements_to_string() on synthetic DOM trees of growing size.
+
+Both serializers should scale linearly: the time per node must stay roughly flat from 5k to 50k nodes,
+for wide pages (many siblings) as well as deeply nested ones (where the old recursive serializer was
+O(n * depth) and hit the recursion limit).
+
+	python -m browser_use.dom.playground.benchmark_serializer
+"""
+
+import random
+import time
+
+from browser_use.dom.arena import DOMTreeArena
+from browser_use.dom.views import DOMElementNode, DOMTextNode
+
+SIZES = [5_000, 10_000, 25_000, 50_000]
+
+
+def build_synthetic_tree(num_nodes: int, max_depth: int, seed: int = 0) -> DOMElementNode:
+	"""Random tree where ~25% of the elements are clickable and ~35% of the nodes are text."""
+	rnd = random.Random(seed)
+	root = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	open_elements: list[tuple[DOMElementNode, int]] = [(root, 0)]
+	highlight_index = 0
+
+	for i in range(1, num_nodes):
+		# mostly attach to recently created elements so the tree actually gets deep
+		parent, depth = rnd.choice(open_elements[-4:]) if rnd.random() < 0.9 else rnd.choice(open_elements)
+		if rnd.random() < 0.35 or depth >= max_depth:
+			parent.children.append(DOMTextNode(text=f'text {i}', is_visible=True, parent=parent))
+			continue
+
+		is_clickable = rnd.random() < 0.25
+		element = DOMElementNode(
+			tag_name=rnd.choice(['div', 'span', 'a', 'button', 'li']),
+			xpath=f'{parent.xpath}/div[{i}]',
+			attributes={'role': 'button', 'aria-label': f'label {i}'} if is_clickable else {},
+			children=[],
+			is_visible=True,
+			is_top_element=True,
+			is_interactive=is_clickable,
+			highlight_index=highlight_index if is_clickable else None,
+			parent=parent,
+		)
+		highlight_index += is_clickable
+		parent.children.append(element)
+		open_elements.append((element, depth + 1))
+
+	return root
+
+
+def _time(func) -> float:
+	start = time.perf_counter()
+	func()
+	return time.perf_counter() - start
+
+
+def main():
+	for shape, max_depth in (('wide', 8), ('deep', 2_000)):
+		print(f'\n{shape} trees (max depth {max_depth}):')
+		print(f'{"nodes":>8} {"tree":>10} {"µs/node":>8} {"arena":>10} {"µs/node":>8}')
+		for size in SIZES:
+			tree = build_synthetic_tree(size, max_depth)
+			arena = DOMTreeArena.from_element_tree(tree)
+
+			tree_time = _time(tree.clickable_elements_to_string)
+			arena_time = _time(arena.clickable_elements_to_string)
+			print(
+				f'{size:>8} {tree_time * 1000:>8.1f}ms {tree_time / size * 1e6:>8.2f} '
+				f'{arena_time * 1000:>8.1f}ms {arena_time / size * 1e6:>8.2f}'
+			)
+
+
+if __name__ == '__main__':
+	main()
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
 	from browser_use.browser.types import Page
 
 
+from browser_use.dom.arena import DOMTreeArena
 from browser_use.dom.views import (
 	DOMBaseNode,
 	DOMElementNode,
@@ -33,6 +34,13 @@ class DomService:
 
 		self.js_code = resources.files('browser_use.dom.dom_tree').joinpath('index.js').read_text()
 
+		# state kept between incremental snapshots, see _apply_dom_snapshot()
+		self._snapshot_id: str | None = None
+		self._snapshot_node_map: dict[str, DOMBaseNode] = {}
+		self._snapshot_children_ids: dict[str, list[str]] = {}
+		self._snapshot_parent_ids: dict[str, str] = {}
+		self._snapshot_selector_map: SelectorMap = {}
+
 	# region - Clickable elements
 	@time_execution_async('--get_clickable_elements')
 	async def get_clickable_elements(
@@ -40,8 +48,21 @@ class DomService:
 		highlight_elements: bool = True,
 		focus_element: int = -1,
 		viewport_expansion: int = 0,
+		incremental: bool = False,
+		compact: bool = False,
 	) -> DOMState:
-		element_tree, selector_map = await self._build_dom_tree(highlight_elements, focus_element, viewport_expansion)
+		"""Extract the DOM tree and the map of interactive elements from the page.
+
+		With incremental=True the page keeps stable node IDs and a MutationObserver between calls,
+		and only the nodes that changed since the previous call on this DomService are sent back and
+		patched into the previously returned tree.
+
+		With compact=True (ignored when incremental=True) the tree is stored in a DOMTreeArena and
+		the returned nodes are lightweight views over it instead of one dataclass per node.
+		"""
+		element_tree, selector_map = await self._build_dom_tree(
+			highlight_elements, focus_element, viewport_expansion, incremental, compact
+		)
 		return DOMState(element_tree=element_tree, selector_map=selector_map)
 
 	@time_execution_async('--get_cross_origin_iframes')
@@ -68,11 +89,14 @@ class DomService:
 		highlight_elements: bool,
 		focus_element: int,
 		viewport_expansion: int,
+		incremental: bool = False,
+		compact: bool = False,
 	) -> tuple[DOMElementNode, SelectorMap]:
 		if await self.page.evaluate('1+1') != 2:
 			raise ValueError('The page cannot evaluate javascript code properly')
 
 		if is_new_tab_page(self.page.url):
+			self._reset_dom_snapshot()
 			# short-circuit if the page is a new empty tab for speed, no need to inject buildDomTree.js
 			return (
 				DOMElementNode(
@@ -95,6 +119,8 @@ class DomService:
 			'focusHighlightIndex': focus_element,
 			'viewportExpansion': viewport_expansion,
 			'debugMode': debug_mode,
+			'incremental': incremental,
+			'previousSnapshotId': self._snapshot_id if incremental else None,
 		}
 
 		try:
@@ -131,7 +157,13 @@ class DomService:
 			)
 
 		self.logger.debug('🔄 Starting Python DOM tree construction...')
-		result = await self._construct_dom_tree(eval_page)
+		if incremental:
+			result = await self._apply_dom_snapshot(eval_page)
+		elif compact:
+			arena = DOMTreeArena.from_eval_page(eval_page)
+			result = arena.root, arena.selector_map()
+		else:
+			result = await self._construct_dom_tree(eval_page)
 		self.logger.debug('✅ Python DOM tree construction completed')
 		return result
 
@@ -179,6 +211,100 @@ class DomService:
 
 		return html_to_dict, selector_map
 
+	@time_execution_async('--apply_dom_snapshot')
+	async def _apply_dom_snapshot(
+		self,
+		eval_page: dict,
+	) -> tuple[DOMElementNode, SelectorMap]:
+		"""Patch the tree from the previous incremental snapshot with the nodes that changed since then.
+
+		Changed nodes are replaced by freshly parsed ones, unchanged nodes are kept as-is, and only the
+		parents whose children changed are relinked. When the page sent a full snapshot instead of a diff
+		(first call, page reload, or a previous call that never reached us) the tree is rebuilt from scratch.
+		"""
+		if eval_page.get('baseSnapshotId') is None or eval_page['baseSnapshotId'] != self._snapshot_id:
+			self._reset_dom_snapshot()
+
+		node_map = self._snapshot_node_map
+		children_ids = self._snapshot_children_ids
+		parent_ids = self._snapshot_parent_ids
+		selector_map = self._snapshot_selector_map
+
+		changed_nodes: dict[str, dict] = eval_page.get('map', {})
+		removed_ids: list[str] = eval_page.get('removed', [])
+
+		# drop the selector map entries of every node that is about to be replaced or removed
+		for id in [*removed_ids, *changed_nodes.keys()]:
+			old_node = node_map.get(id)
+			if isinstance(old_node, DOMElementNode) and old_node.highlight_index is not None:
+				if selector_map.get(old_node.highlight_index) is old_node:
+					del selector_map[old_node.highlight_index]
+
+		for id in removed_ids:
+			node_map.pop(id, None)
+			children_ids.pop(id, None)
+			parent_ids.pop(id, None)
+
+		parents_to_relink: set[str] = set()
+		for id, node_data in changed_nodes.items():
+			node, node_children_ids = self._parse_node(node_data)
+			if node is None:
+				node_map.pop(id, None)
+				children_ids.pop(id, None)
+				continue
+
+			node_map[id] = node
+			children_ids[id] = [str(child_id) for child_id in node_children_ids]
+			parents_to_relink.add(id)
+			if id in parent_ids:
+				# the parent itself may be unchanged, but it has to point at the new child object
+				parents_to_relink.add(parent_ids[id])
+
+			if isinstance(node, DOMElementNode) and node.highlight_index is not None:
+				selector_map[node.highlight_index] = node
+
+		# NOTE: unlike _construct_dom_tree() we cannot rely on children being listed before their parents,
+		#       stable IDs are assigned in first-seen order, so link in a second pass once all nodes exist.
+		for parent_id in parents_to_relink:
+			parent_node = node_map.get(parent_id)
+			if not isinstance(parent_node, DOMElementNode):
+				continue
+
+			parent_node.children = []
+			for child_id in children_ids.get(parent_id, []):
+				child_node = node_map.get(child_id)
+				if child_node is None:
+					continue
+
+				if child_node.parent is not parent_node and isinstance(child_node, DOMElementNode):
+					# cached branch paths/hashes of a reused subtree were computed for its previous parent
+					child_node.invalidate_fingerprints()
+				child_node.parent = parent_node
+				parent_node.children.append(child_node)
+				parent_ids[child_id] = parent_id
+
+		root_node = node_map.get(str(eval_page['rootId']))
+		if root_node is None or not isinstance(root_node, DOMElementNode):
+			self._reset_dom_snapshot()
+			raise ValueError('Failed to parse HTML to dictionary')
+
+		self._snapshot_id = eval_page['snapshotId']
+
+		# is_new is recomputed by the browser session for every state, don't leak the previous value
+		for node in selector_map.values():
+			node.is_new = None
+
+		# hand out a copy so selector maps of previous states are not affected by the next patch
+		return root_node, dict(selector_map)
+
+	def _reset_dom_snapshot(self) -> None:
+		"""Forget the previous incremental snapshot so the next call requests a full one."""
+		self._snapshot_id = None
+		self._snapshot_node_map = {}
+		self._snapshot_children_ids = {}
+		self._snapshot_parent_ids = {}
+		self._snapshot_selector_map = {}
+
 	def _parse_node(
 		self,
 		node_data: dict,
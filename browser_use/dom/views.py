@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING, Optional
@@ -70,6 +71,89 @@ DEFAULT_INCLUDE_ATTRIBUTES = [
 ]
 
 
+def format_clickable_element_line(
+	tag_name: str,
+	attributes: dict[str, str],
+	highlight_index: int,
+	is_new: bool | None,
+	text: str,
+	include_attributes: list[str],
+	depth_str: str,
+) -> str:
+	"""Format one highlighted element as a line of the clickable elements string sent to the LLM."""
+	attributes_html_str = None
+	if include_attributes:
+		attributes_to_include = {
+			key: str(value).strip() for key, value in attributes.items() if key in include_attributes and str(value).strip() != ''
+		}
+
+		# If value of any of the attributes is the same as ANY other value attribute only include the one that appears first in include_attributes
+		# WARNING: heavy vibes, but it seems good enough for saving tokens (it kicks in hard when it's long text)
+
+		# Pre-compute ordered keys that exist in both lists (faster than repeated lookups)
+		ordered_keys = [key for key in include_attributes if key in attributes_to_include]
+
+		if len(ordered_keys) > 1:  # Only process if we have multiple attributes
+			keys_to_remove = set()  # Use set for O(1) lookups
+			seen_values = {}  # value -> first_key_with_this_value
+
+			for key in ordered_keys:
+				value = attributes_to_include[key]
+				if len(value) > 5:  # to not remove false, true, etc
+					if value in seen_values:
+						# This value was already seen with an earlier key, so remove this key
+						keys_to_remove.add(key)
+					else:
+						# First time seeing this value, record it
+						seen_values[value] = key
+
+			# Remove duplicate keys (no need to check existence since we know they exist)
+			for key in keys_to_remove:
+				del attributes_to_include[key]
+
+		# Easy LLM optimizations
+		# if tag == role attribute, don't include it
+		if tag_name == attributes_to_include.get('role'):
+			del attributes_to_include['role']
+
+		# Remove attributes that duplicate the node's text content
+		attrs_to_remove_if_text_matches = ['aria-label', 'placeholder', 'title']
+		for attr in attrs_to_remove_if_text_matches:
+			if attributes_to_include.get(attr) and attributes_to_include.get(attr, '').strip().lower() == text.strip().lower():
+				del attributes_to_include[attr]
+
+		if attributes_to_include.items():
+			# Format as key1='value1' key2='value2'
+			attributes_html_str = ' '.join(f'{key}={cap_text_length(value, 15)}' for key, value in attributes_to_include.items())
+
+	# Build the line
+	if is_new:
+		highlight_indicator = f'*[{highlight_index}]'
+
+	else:
+		highlight_indicator = f'[{highlight_index}]'
+
+	line = f'{depth_str}{highlight_indicator}<{tag_name}'
+
+	if attributes_html_str:
+		line += f' {attributes_html_str}'
+
+	if text:
+		# Add space before >text only if there were NO attributes added before
+		text = text.strip()
+		if not attributes_html_str:
+			line += ' '
+		line += f'>{text}'
+
+	# Add space before /> only if neither attributes NOR text were added
+	elif not attributes_html_str:
+		line += ' '
+
+	# makes sense to have if the website has lots of text -> so the LLM knows which things are part of the same clickable element and which are not
+	line += ' />'  # 1 token
+	return line
+
+
 @dataclass(frozen=False)
 class DOMElementNode(DOMBaseNode):
 	"""
@@ -147,137 +231,131 @@ class DOMElementNode(DOMBaseNode):
 
 		return HistoryTreeProcessor._hash_dom_element(self)
 
+	@property
+	def branch_path(self) -> str:
+		"""Tag names from below the root down to this element joined by '/', shared by all element fingerprints.
+
+		Cached on the nodes and computed top-down from the closest cached ancestor, instead of walking up to the root
+		for every element.
+		"""
+		cached = self.__dict__.get('_branch_path')
+		if cached is not None:
+			return cached
+
+		uncached: list[DOMElementNode] = []
+		node: DOMElementNode | None = self
+		while node is not None and '_branch_path' not in node.__dict__:
+			uncached.append(node)
+			node = node.parent
+
+		path = node.__dict__['_branch_path'] if node is not None else ''
+		for element in reversed(uncached):
+			if element.parent is None:
+				path = ''
+			elif element.parent.parent is None:
+				path = element.tag_name
+			else:
+				path = f'{path}/{element.tag_name}'
+			element.__dict__['_branch_path'] = path
+		return path
+
+	def invalidate_fingerprints(self) -> None:
+		"""Drop the cached branch_path/hash of this subtree, needed when it gets attached to a different parent."""
+		stack: list[DOMElementNode] = [self]
+		while stack:
+			node = stack.pop()
+			# descendants can only have a cached branch path if their ancestors have one
+			if node.__dict__.pop('_branch_path', None) is None:
+				continue
+			node.__dict__.pop('hash', None)
+			stack.extend(child for child in node.children if isinstance(child, DOMElementNode))
+
 	def get_all_text_till_next_clickable_element(self, max_depth: int = -1) -> str:
 		text_parts = []
 
-		def collect_text(node: DOMBaseNode, current_depth: int) -> None:
+		# iterative pre-order walk, children are pushed in reverse to keep document order
+		stack: list[tuple[DOMBaseNode, int]] = [(self, 0)]
+		while stack:
+			node, current_depth = stack.pop()
 			if max_depth != -1 and current_depth > max_depth:
-				return
-
-			# Skip this branch if we hit a highlighted element (except for the current node)
-			if isinstance(node, DOMElementNode) and node != self and node.highlight_index is not None:
-				return
+				continue
 
 			if isinstance(node, DOMTextNode):
 				text_parts.append(node.text)
 			elif isinstance(node, DOMElementNode):
-				for child in node.children:
-					collect_text(child, current_depth + 1)
+				# Skip this branch if we hit a highlighted element (except for the current node)
+				if node is not self and node.highlight_index is not None:
+					continue
+				stack.extend((child, current_depth + 1) for child in reversed(node.children))
 
-		collect_text(self, 0)
 		return '\n'.join(text_parts).strip()
 
-	@time_execution_sync('--clickable_elements_to_string')
-	def clickable_elements_to_string(self, include_attributes: list[str] | None = None) -> str:
-		"""Convert the processed DOM content to HTML."""
-		formatted_text = []
+	def iter_clickable_elements_lines(self, include_attributes: list[str] | None = None) -> Iterator[str]:
+		"""Stream the lines of clickable_elements_to_string() from a single iterative walk over the tree.
 
+		Text ownership (which clickable element a text node belongs to), output depth and attribute dedup
+		are all computed during the same walk. A clickable element's line needs the text of its whole subtree,
+		so lines inside a clickable element are held back until that element is finished, everything else is
+		yielded as soon as it is known.
+		"""
 		if not include_attributes:
 			include_attributes = DEFAULT_INCLUDE_ATTRIBUTES
 
-		def process_node(node: DOMBaseNode, depth: int) -> None:
-			next_depth = int(depth)
-			depth_str = depth * '\t'
-
-			if isinstance(node, DOMElementNode):
-				# Add element with highlight_index
+		# text below a highlighted ancestor of the starting node is never printed
+		has_highlighted_ancestor = False
+		ancestor = self.parent
+		while ancestor is not None:
+			if ancestor.highlight_index is not None:
+				has_highlighted_ancestor = True
+				break
+			ancestor = ancestor.parent
+
+		# output slots, the slot of a clickable element is filled in once its subtree has been walked
+		pending_lines: list[str | None] = []
+		# clickable elements currently being walked: (node, depth_str, slot, text_parts)
+		open_elements: list[tuple[DOMElementNode, str, int, list[str]]] = []
+
+		_EXIT = None  # marker pushed after the children of a clickable element
+		stack: list[tuple[DOMBaseNode | None, int]] = [(self, 0)]
+		while stack:
+			node, depth = stack.pop()
+
+			if node is _EXIT:
+				element, depth_str, slot, text_parts = open_elements.pop()
+				assert element.highlight_index is not None
+				pending_lines[slot] = format_clickable_element_line(
+					tag_name=element.tag_name,
+					attributes=element.attributes,
+					highlight_index=element.highlight_index,
+					is_new=element.is_new,
+					text='\n'.join(text_parts).strip(),
+					include_attributes=include_attributes,
+					depth_str=depth_str,
+				)
+			elif isinstance(node, DOMElementNode):
+				next_depth = depth
 				if node.highlight_index is not None:
 					next_depth += 1
-
-					text = node.get_all_text_till_next_clickable_element()
-					attributes_html_str = None
-					if include_attributes:
-						attributes_to_include = {
-							key: str(value).strip()
-							for key, value in node.attributes.items()
-							if key in include_attributes and str(value).strip() != ''
-						}
-
-						# If value of any of the attributes is the same as ANY other value attribute only include the one that appears first in include_attributes
-						# WARNING: heavy vibes, but it seems good enough for saving tokens (it kicks in hard when it's long text)
-
-						# Pre-compute ordered keys that exist in both lists (faster than repeated lookups)
-						ordered_keys = [key for key in include_attributes if key in attributes_to_include]
-
-						if len(ordered_keys) > 1:  # Only process if we have multiple attributes
-							keys_to_remove = set()  # Use set for O(1) lookups
-							seen_values = {}  # value -> first_key_with_this_value
-
-							for key in ordered_keys:
-								value = attributes_to_include[key]
-								if len(value) > 5:  # to not remove false, true, etc
-									if value in seen_values:
-										# This value was already seen with an earlier key, so remove this key
-										keys_to_remove.add(key)
-									else:
-										# First time seeing this value, record it
-										seen_values[value] = key
-
-							# Remove duplicate keys (no need to check existence since we know they exist)
-							for key in keys_to_remove:
-								del attributes_to_include[key]
-
-						# Easy LLM optimizations
-						# if tag == role attribute, don't include it
-						if node.tag_name == attributes_to_include.get('role'):
-							del attributes_to_include['role']
-
-						# Remove attributes that duplicate the node's text content
-						attrs_to_remove_if_text_matches = ['aria-label', 'placeholder', 'title']
-						for attr in attrs_to_remove_if_text_matches:
-							if (
-								attributes_to_include.get(attr)
-								and attributes_to_include.get(attr, '').strip().lower() == text.strip().lower()
-							):
-								del attributes_to_include[attr]
-
-						if attributes_to_include.items():
-							# Format as key1='value1' key2='value2'
-							attributes_html_str = ' '.join(
-								f'{key}={cap_text_length(value, 15)}' for key, value in attributes_to_include.items()
-							)
-
-					# Build the line
-					if node.is_new:
-						highlight_indicator = f'*[{node.highlight_index}]'
-
-					else:
-						highlight_indicator = f'[{node.highlight_index}]'
-
-					line = f'{depth_str}{highlight_indicator}<{node.tag_name}'
-
-					if attributes_html_str:
-						line += f' {attributes_html_str}'
-
-					if text:
-						# Add space before >text only if there were NO attributes added before
-						text = text.strip()
-						if not attributes_html_str:
-							line += ' '
-						line += f'>{text}'
-
-					# Add space before /> only if neither attributes NOR text were added
-					elif not attributes_html_str:
-						line += ' '
-
-					# makes sense to have if the website has lots of text -> so the LLM knows which things are part of the same clickable element and which are not
-					line += ' />'  # 1 token
-					formatted_text.append(line)
-
+					open_elements.append((node, depth * '\t', len(pending_lines), []))
+					pending_lines.append(None)
+					stack.append((_EXIT, depth))
 				# Process children regardless
-				for child in node.children:
-					process_node(child, next_depth)
-
+				stack.extend((child, next_depth) for child in reversed(node.children))
 			elif isinstance(node, DOMTextNode):
-				# Add text only if it doesn't have a highlighted parent
-				if node.has_parent_with_highlight_index():
-					return
+				if open_elements:
+					# text belongs to the closest highlighted ancestor
+					open_elements[-1][3].append(node.text)
+				elif not has_highlighted_ancestor and node.parent and node.parent.is_visible and node.parent.is_top_element:
+					pending_lines.append(depth * '\t' + node.text)
 
-				if node.parent and node.parent.is_visible and node.parent.is_top_element:
-					formatted_text.append(f'{depth_str}{node.text}')
+			if not open_elements and pending_lines:
+				yield from pending_lines  # type: ignore[misc]
+				pending_lines.clear()
 
-		process_node(self, 0)
-		return '\n'.join(formatted_text)
+	@time_execution_sync('--clickable_elements_to_string')
+	def clickable_elements_to_string(self, include_attributes: list[str] | None = None) -> str:
+		"""Convert the processed DOM content to HTML."""
+		return '\n'.join(self.iter_clickable_elements_lines(include_attributes))
 
 
 SelectorMap = dict[int, DOMElementNode]
@@ -4,14 +4,25 @@ import shutil
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from markdown_pdf import MarkdownPdf, Section
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 INVALID_FILENAME_ERROR_MESSAGE = 'Error: Invalid filename format. Must be alphanumeric with supported extension.'
 DEFAULT_FILE_SYSTEM_PATH = 'browseruse_agent_data'
 
+_io_executor: ThreadPoolExecutor | None = None
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+	"""Thread pool shared by all files for their disk writes, created on first use"""
+	global _io_executor
+	if _io_executor is None:
+		# a single worker keeps the writes to a file in the order they were made (appends depend on it)
+		_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='browser_use_file_system')
+	return _io_executor
+
 
 class FileSystemError(Exception):
 	"""Custom exception for file system operations that should be shown to LLM"""
@@ -25,6 +36,13 @@ class BaseFile(BaseModel, ABC):
 	name: str
 	content: str = ''
 
+	# whether appends can be written by appending to the file on disk, instead of rewriting it
+	supports_append_writes: ClassVar[bool] = True
+
+	# the path and content of the last disk write, the file is in sync if content is still that same string
+	_synced_path: Path | None = PrivateAttr(default=None)
+	_synced_content: str | None = PrivateAttr(default=None)
+
 	# --- Subclass must define this ---
 	@property
 	@abstractmethod
@@ -45,22 +63,42 @@ class BaseFile(BaseModel, ABC):
 	def update_content(self, content: str) -> None:
 		self.content = content
 
+	def is_synced(self, path: Path) -> bool:
+		"""Whether the file on disk already has the current content (as far as this file object wrote it)"""
+		return self._synced_path == path / self.full_name and self._synced_content is self.content
+
+	def _write_to_disk(self, file_path: Path, content: str) -> None:
+		file_path.write_text(content)
+		self._synced_path, self._synced_content = file_path, content
+
+	def _append_to_disk(self, file_path: Path, appended: str, content: str) -> None:
+		with open(file_path, 'a') as f:
+			f.write(appended)
+		self._synced_path, self._synced_content = file_path, content
+
 	def sync_to_disk_sync(self, path: Path) -> None:
-		file_path = path / self.full_name
-		file_path.write_text(self.content)
+		self._write_to_disk(path / self.full_name, self.content)
 
 	async def sync_to_disk(self, path: Path) -> None:
-		file_path = path / self.full_name
-		with ThreadPoolExecutor() as executor:
-			await asyncio.get_event_loop().run_in_executor(executor, lambda: file_path.write_text(self.content))
+		# the content is passed along as it is now, not as it is once the write runs
+		await asyncio.get_running_loop().run_in_executor(
+			_get_io_executor(), self._write_to_disk, path / self.full_name, self.content
+		)
 
 	async def write(self, content: str, path: Path) -> None:
 		self.write_file_content(content)
-		await self.sync_to_disk(path)
+		if not self.is_synced(path):
+			await self.sync_to_disk(path)
 
 	async def append(self, content: str, path: Path) -> None:
+		synced = self.is_synced(path)
 		self.append_file_content(content)
-		await self.sync_to_disk(path)
+		if synced and self.supports_append_writes:
+			await asyncio.get_running_loop().run_in_executor(
+				_get_io_executor(), self._append_to_disk, path / self.full_name, content, self.content
+			)
+		else:
+			await self.sync_to_disk(path)
 
 	def read(self) -> str:
 		return self.content
@@ -113,6 +151,8 @@ class CsvFile(BaseFile):
 class PdfFile(BaseFile):
 	"""PDF file implementation"""
 
+	supports_append_writes: ClassVar[bool] = False
+
 	@property
 	def extension(self) -> str:
 		return 'pdf'
@@ -127,8 +167,7 @@ class PdfFile(BaseFile):
 			raise FileSystemError(f"Error: Could not write to file '{self.full_name}'. {str(e)}")
 
 	async def sync_to_disk(self, path: Path) -> None:
-		with ThreadPoolExecutor() as executor:
-			await asyncio.get_event_loop().run_in_executor(executor, lambda: self.sync_to_disk_sync(path))
+		await asyncio.get_running_loop().run_in_executor(_get_io_executor(), self.sync_to_disk_sync, path)
 
 
 class FileSystemState(BaseModel):
@@ -163,6 +202,9 @@ class FileSystem:
 		}
 
 		self.files = {}
+		# get_state reuses the serialized data of files whose content is still the same string as in the last snapshot
+		self._file_states: dict[str, tuple[BaseFile, str, dict[str, Any]]] = {}
+		self._state: FileSystemState | None = None
 		if create_default_files:
 			self.default_files = ['todo.md']
 			self._create_default_files()
@@ -432,14 +474,36 @@ class FileSystem:
 		return todo_file.read() if todo_file else ''
 
 	def get_state(self) -> FileSystemState:
-		"""Get serializable state of the file system"""
-		files_data = {}
+		"""
+		Get serializable state of the file system.
+
+		Only files whose content changed since the previous call are serialized again, if nothing changed at all the
+		previous state is returned as is.
+		"""
+		file_states: dict[str, tuple[BaseFile, str, dict[str, Any]]] = {}
+		changed = len(self.files) != len(self._file_states)
 		for full_filename, file_obj in self.files.items():
-			files_data[full_filename] = {'type': file_obj.__class__.__name__, 'data': file_obj.model_dump()}
-
-		return FileSystemState(
-			files=files_data, base_dir=str(self.base_dir), extracted_content_count=self.extracted_content_count
-		)
+			cached = self._file_states.get(full_filename)
+			if cached is not None and cached[0] is file_obj and cached[1] is file_obj.content:
+				file_states[full_filename] = cached
+			else:
+				file_data = {'type': file_obj.__class__.__name__, 'data': file_obj.model_dump()}
+				file_states[full_filename] = (file_obj, file_obj.content, file_data)
+				changed = True
+		self._file_states = file_states
+
+		if (
+			changed
+			or self._state is None
+			or self._state.base_dir != str(self.base_dir)
+			or self._state.extracted_content_count != self.extracted_content_count
+		):
+			self._state = FileSystemState(
+				files={full_filename: file_data for full_filename, (_, _, file_data) in file_states.items()},
+				base_dir=str(self.base_dir),
+				extracted_content_count=self.extracted_content_count,
+			)
+		return self._state
 
 	def nuke(self) -> None:
 		"""Delete the file system directory"""
@@ -0,0 +1,150 @@
+"""
+Process-wide registry of HTTP clients, so LLM providers and the cloud sync reuse their connections across calls.
+
+Creating a new client for every request means a new connection pool, i.e. a fresh TCP + TLS handshake for every
+LLM call. Clients are kept per event loop because httpx connection pools can't be shared between loops, and are
+closed when the last agent running in their loop finishes (or dropped together with their loop).
+"""
+
+import asyncio
+import importlib.util
+import weakref
+from collections.abc import Callable, Hashable, Mapping
+from functools import cache
+from typing import Any, TypeVar
+
+import httpx
+
+from browser_use.config import CONFIG
+
+T = TypeVar('T')
+
+# event loop -> cache key -> (client, whether aclose_shared_clients() closes it)
+_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, tuple[Any, bool]]]' = weakref.WeakKeyDictionary()
+# event loop -> number of users (e.g. running agents) of its clients, the last one to finish closes them
+_users: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]' = weakref.WeakKeyDictionary()
+
+
+@cache
+def _http2_available() -> bool:
+	# httpx only speaks HTTP/2 with the optional h2 package installed
+	return importlib.util.find_spec('h2') is not None
+
+
+def _is_closed(client: Any) -> bool:
+	# httpx.AsyncClient.is_closed is a property, the openai/anthropic/groq SDK clients have an is_closed() method
+	is_closed = getattr(client, 'is_closed', False)
+	return bool(is_closed() if callable(is_closed) else is_closed)
+
+
+def get_http_limits() -> httpx.Limits:
+	return httpx.Limits(
+		max_connections=CONFIG.BROWSER_USE_HTTP_MAX_CONNECTIONS,
+		max_keepalive_connections=CONFIG.BROWSER_USE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+		keepalive_expiry=CONFIG.BROWSER_USE_HTTP_KEEPALIVE_EXPIRY,
+	)
+
+
+class _Identity:
+	"""Cache key part for an unhashable value, equal only to the very same object and keeping it alive so its id can't be reused"""
+
+	__slots__ = ('value',)
+
+	def __init__(self, value: Any):
+		self.value = value
+
+	def __hash__(self) -> int:
+		return id(self.value)
+
+	def __eq__(self, other: object) -> bool:
+		return isinstance(other, _Identity) and other.value is self.value
+
+
+def client_cache_key(*parts: Any) -> Hashable:
+	"""Turn client parameters (which may contain dicts of headers etc.) into a hashable cache key"""
+
+	def freeze(value: Any) -> Hashable:
+		if isinstance(value, Mapping):
+			return tuple(sorted((str(k), freeze(v)) for k, v in value.items()))
+		if isinstance(value, (list, tuple)):
+			return tuple(freeze(v) for v in value)
+		try:
+			hash(value)
+			return value
+		except TypeError:
+			# e.g. an httpx client or credentials object passed in by the user, only the same object can be reused
+			return _Identity(value)
+
+	return freeze(parts)
+
+
+def get_shared_client(key: Hashable, factory: Callable[[], T], close: bool = True) -> T:
+	"""
+	Get the client cached under key for the running event loop, creating it with factory() on first use.
+
+	Pass close=False for clients built around something the caller owns (e.g. an SDK client wrapping a user-supplied
+	httpx client), closing them would close that too, so aclose_shared_clients() leaves them open.
+	Outside of an event loop there is nothing to bind the client to, so a new uncached client is returned.
+	"""
+	try:
+		loop = asyncio.get_running_loop()
+	except RuntimeError:
+		return factory()
+
+	clients = _clients.get(loop)
+	if clients is None:
+		# a loop that was closed but is still referenced somewhere can't run its clients anymore
+		for closed_loop in [other for other in _clients if other.is_closed()]:
+			del _clients[closed_loop]
+		clients = _clients[loop] = {}
+
+	client, _ = clients.get(key, (None, close))
+	if client is None or _is_closed(client):
+		client = factory()
+		clients[key] = (client, close)
+	return client
+
+
+def get_http_client() -> httpx.AsyncClient:
+	"""The shared httpx client of the running event loop, with keep-alive, HTTP/2 (if available) and the configured pool limits"""
+	return get_shared_client(
+		'httpx',
+		lambda: httpx.AsyncClient(
+			limits=get_http_limits(),
+			http2=CONFIG.BROWSER_USE_HTTP2 and _http2_available(),
+			follow_redirects=True,
+		),
+	)
+
+
+async def aclose_shared_clients() -> None:
+	"""Close all clients created for the running event loop, except those built around a client of the caller"""
+	clients = _clients.pop(asyncio.get_running_loop(), {})
+	for client, owned in clients.values():
+		if not owned:
+			continue
+		close = getattr(client, 'aclose', None) or getattr(client, 'close', None)
+		if close is None:
+			continue
+		try:
+			result = close()
+			if asyncio.iscoroutine(result):
+				await result
+		except Exception:
+			pass
+
+
+def retain_shared_clients() -> None:
+	"""Keep the clients of the running event loop open until the matching release_shared_clients() call"""
+	loop = asyncio.get_running_loop()
+	_users[loop] = _users.get(loop, 0) + 1
+
+
+async def release_shared_clients() -> None:
+	"""Undo retain_shared_clients(), the clients of the running event loop are closed when it was the last user"""
+	loop = asyncio.get_running_loop()
+	users = _users.pop(loop, 0) - 1
+	if users > 0:
+		_users[loop] = users
+	else:
+		await aclose_shared_clients()
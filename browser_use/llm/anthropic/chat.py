@@ -1,5 +1,5 @@
 import json
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any, TypeVar, overload
 
@@ -19,6 +19,7 @@ from anthropic.types.tool_choice_tool_param import ToolChoiceToolParam
 from httpx import Timeout
 from pydantic import BaseModel
 
+from browser_use.http_clients import client_cache_key, get_shared_client
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
@@ -96,7 +97,7 @@ class ChatAnthropic(BaseChatModel):
 			AsyncAnthropic: An instance of the AsyncAnthropic client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncAnthropic(**client_params)
+		return get_shared_client(client_cache_key(AsyncAnthropic, client_params), lambda: AsyncAnthropic(**client_params))
 
 	@property
 	def name(self) -> str:
@@ -154,23 +155,7 @@ class ChatAnthropic(BaseChatModel):
 
 			else:
 				# Use tool calling for structured output
-				# Create a tool that represents the output format
-				tool_name = output_format.__name__
-				schema = SchemaOptimizer.create_optimized_json_schema(output_format)
-
-				# Remove title from schema if present (Anthropic doesn't like it in parameters)
-				if 'title' in schema:
-					del schema['title']
-
-				tool = ToolParam(
-					name=tool_name,
-					description=f'Extract information in the format of {tool_name}',
-					input_schema=schema,
-					cache_control=CacheControlEphemeralParam(type='ephemeral'),
-				)
-
-				# Force the model to use this tool
-				tool_choice = ToolChoiceToolParam(type='tool', name=tool_name)
+				tool, tool_choice = self._get_output_tool(output_format)
 
 				response = await self.get_client().messages.create(
 					model=self.model,
@@ -181,26 +166,39 @@ class ChatAnthropic(BaseChatModel):
 					**self._get_client_params_for_invoke(),
 				)
 
-				usage = self._get_usage(response)
+				return self._parse_tool_output(response, output_format)
 
-				# Extract the tool use block
-				for content_block in response.content:
-					if hasattr(content_block, 'type') and content_block.type == 'tool_use':
-						# Parse the tool input as the structured output
-						try:
-							return ChatInvokeCompletion(completion=output_format.model_validate(content_block.input), usage=usage)
-						except Exception as e:
-							# If validation fails, try to parse it as JSON first
-							if isinstance(content_block.input, str):
-								data = json.loads(content_block.input)
-								return ChatInvokeCompletion(
-									completion=output_format.model_validate(data),
-									usage=usage,
-								)
-							raise e
-
-				# If no tool use block found, raise an error
-				raise ValueError('Expected tool use in response but none found')
+		except APIConnectionError as e:
+			raise ModelProviderError(message=e.message, model=self.name) from e
+		except RateLimitError as e:
+			raise ModelRateLimitError(message=e.message, model=self.name) from e
+		except APIStatusError as e:
+			raise ModelProviderError(message=e.message, status_code=e.status_code, model=self.name) from e
+		except Exception as e:
+			raise ModelProviderError(message=str(e), model=self.name) from e
+
+	async def ainvoke_streaming(
+		self, messages: list[BaseMessage], output_format: type[T], on_delta: Callable[[str], None]
+	) -> ChatInvokeCompletion[T]:
+		anthropic_messages, system_prompt = AnthropicMessageSerializer.serialize_messages(messages)
+		tool, tool_choice = self._get_output_tool(output_format)
+
+		try:
+			async with self.get_client().messages.stream(
+				model=self.model,
+				messages=anthropic_messages,
+				tools=[tool],
+				system=system_prompt or NOT_GIVEN,
+				tool_choice=tool_choice,
+				**self._get_client_params_for_invoke(),
+			) as stream:
+				async for event in stream:
+					# the tool input arrives as raw JSON fragments
+					if event.type == 'content_block_delta' and event.delta.type == 'input_json_delta':
+						on_delta(event.delta.partial_json)
+				response = await stream.get_final_message()
+
+			return self._parse_tool_output(response, output_format)
 
 		except APIConnectionError as e:
 			raise ModelProviderError(message=e.message, model=self.name) from e
@@ -210,3 +208,43 @@ class ChatAnthropic(BaseChatModel):
 			raise ModelProviderError(message=e.message, status_code=e.status_code, model=self.name) from e
 		except Exception as e:
 			raise ModelProviderError(message=str(e), model=self.name) from e
+
+	@staticmethod
+	def _get_output_tool(output_format: type[BaseModel]) -> tuple[ToolParam, ToolChoiceToolParam]:
+		"""Create a tool that represents the output format, and a tool choice forcing the model to use it"""
+		tool_name = output_format.__name__
+		schema = SchemaOptimizer.create_optimized_json_schema(output_format)
+
+		# Remove title from schema if present (Anthropic doesn't like it in parameters)
+		if 'title' in schema:
+			del schema['title']
+
+		tool = ToolParam(
+			name=tool_name,
+			description=f'Extract information in the format of {tool_name}',
+			input_schema=schema,
+			cache_control=CacheControlEphemeralParam(type='ephemeral'),
+		)
+		return tool, ToolChoiceToolParam(type='tool', name=tool_name)
+
+	def _parse_tool_output(self, response: Message, output_format: type[T]) -> ChatInvokeCompletion[T]:
+		usage = self._get_usage(response)
+
+		# Extract the tool use block
+		for content_block in response.content:
+			if hasattr(content_block, 'type') and content_block.type == 'tool_use':
+				# Parse the tool input as the structured output
+				try:
+					return ChatInvokeCompletion(completion=output_format.model_validate(content_block.input), usage=usage)
+				except Exception as e:
+					# If validation fails, try to parse it as JSON first
+					if isinstance(content_block.input, str):
+						data = json.loads(content_block.input)
+						return ChatInvokeCompletion(
+							completion=output_format.model_validate(data),
+							usage=usage,
+						)
+					raise e
+
+		# If no tool use block found, raise an error
+		raise ValueError('Expected tool use in response but none found')
@@ -61,7 +61,9 @@ class AnthropicMessageSerializer:
 	def _serialize_content_part_text(part: ContentPartTextParam, use_cache: bool) -> TextBlockParam:
 		"""Convert a text content part to Anthropic's TextBlockParam."""
 		return TextBlockParam(
-			text=part.text, type='text', cache_control=AnthropicMessageSerializer._serialize_cache_control(use_cache)
+			text=part.text,
+			type='text',
+			cache_control=AnthropicMessageSerializer._serialize_cache_control(use_cache),
 		)
 
 	@staticmethod
@@ -125,6 +127,24 @@ class AnthropicMessageSerializer:
 
 		return serialized_blocks
 
+	@staticmethod
+	def _split_cache_prefix(
+		content: str | list[TextBlockParam | ImageBlockParam], prefix_length: int
+	) -> str | list[TextBlockParam | ImageBlockParam]:
+		"""Split the first text block at prefix_length, Anthropic caches the prompt up to a block with cache_control"""
+		blocks = [TextBlockParam(text=content, type='text')] if isinstance(content, str) else list(content)
+		first = blocks[0] if blocks else None
+		if first is None or first['type'] != 'text' or not 0 < prefix_length < len(first['text']):
+			return content
+
+		rest = TextBlockParam(text=first['text'][prefix_length:], type='text')
+		if cache_control := first.get('cache_control'):
+			rest['cache_control'] = cache_control
+		prefix = TextBlockParam(
+			text=first['text'][:prefix_length], type='text', cache_control=CacheControlEphemeralParam(type='ephemeral')
+		)
+		return [prefix, rest, *blocks[1:]]
+
 	@staticmethod
 	def _serialize_tool_calls_to_content(tool_calls, use_cache: bool = False) -> list[ToolUseBlockParam]:
 		"""Convert tool calls to Anthropic's ToolUseBlockParam format."""
@@ -172,6 +192,8 @@ class AnthropicMessageSerializer:
 		"""
 		if isinstance(message, UserMessage):
 			content = AnthropicMessageSerializer._serialize_content(message.content, use_cache=message.cache)
+			if message.cache_prefix_length:
+				content = AnthropicMessageSerializer._split_cache_prefix(content, message.cache_prefix_length)
 			return MessageParam(role='user', content=content)
 
 		elif isinstance(message, SystemMessage):
@@ -15,6 +15,7 @@ from anthropic.types.text_block import TextBlock
 from anthropic.types.tool_choice_tool_param import ToolChoiceToolParam
 from pydantic import BaseModel
 
+from browser_use.http_clients import client_cache_key, get_shared_client
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.aws.chat_bedrock import ChatAWSBedrock
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
@@ -122,7 +123,9 @@ class ChatAnthropicBedrock(ChatAWSBedrock):
 			AsyncAnthropicBedrock: An instance of the AsyncAnthropicBedrock client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncAnthropicBedrock(**client_params)
+		return get_shared_client(
+			client_cache_key(AsyncAnthropicBedrock, client_params), lambda: AsyncAnthropicBedrock(**client_params)
+		)
 
 	@property
 	def name(self) -> str:
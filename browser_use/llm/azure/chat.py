@@ -2,10 +2,10 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
 from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
 from openai.types.shared import ChatModel
 
+from browser_use.http_clients import client_cache_key, get_http_client, get_shared_client
 from browser_use.llm.openai.like import ChatOpenAILike
 
 
@@ -81,11 +81,11 @@ class ChatAzureOpenAI(ChatOpenAILike):
 		if self.http_client:
 			_client_params['http_client'] = self.http_client
 		else:
-			# Create a new async HTTP client with custom limits
-			_client_params['http_client'] = httpx.AsyncClient(
-				limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-			)
-
-		self.client = AsyncAzureOpenAIClient(**_client_params)
-
-		return self.client
+			# Reuse the connection pool shared by all providers
+			_client_params['http_client'] = get_http_client()
+
+		return get_shared_client(
+			client_cache_key(AsyncAzureOpenAIClient, _client_params),
+			lambda: AsyncAzureOpenAIClient(**_client_params),
+			close=not self.http_client,  # closing the SDK client would close the caller's http_client
+		)
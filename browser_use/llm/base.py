@@ -4,6 +4,7 @@ We have switched all of our code from langchain to openai.types.chat.chat_comple
 For easier transition we have
 """
 
+from collections.abc import Callable
 from typing import Any, Protocol, TypeVar, overload
 
 from pydantic import BaseModel
@@ -40,6 +41,18 @@ class BaseChatModel(Protocol):
 		self, messages: list[BaseMessage], output_format: type[T] | None = None
 	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]: ...
 
+	async def ainvoke_streaming(
+		self, messages: list[BaseMessage], output_format: type[T], on_delta: Callable[[str], None]
+	) -> ChatInvokeCompletion[T]:
+		"""
+		Like ainvoke() with an output_format, but reports the raw JSON output through on_delta() while it is generated.
+
+		Models without a streaming implementation report the whole output as a single delta once it is complete.
+		"""
+		response = await self.ainvoke(messages, output_format)
+		on_delta(response.completion.model_dump_json())
+		return response
+
 	@classmethod
 	def __get_pydantic_core_schema__(
 		cls,
@@ -15,6 +15,7 @@ from openai import (
 )
 from pydantic import BaseModel
 
+from browser_use.http_clients import client_cache_key, get_http_client, get_shared_client
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.deepseek.serializer import DeepSeekMessageSerializer
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
@@ -46,12 +47,14 @@ class ChatDeepSeek(BaseChatModel):
 		return 'deepseek'
 
 	def _client(self) -> AsyncOpenAI:
-		return AsyncOpenAI(
-			api_key=self.api_key,
-			base_url=self.base_url,
-			timeout=self.timeout,
+		client_params = {
+			'api_key': self.api_key,
+			'base_url': self.base_url,
+			'timeout': self.timeout,
+			'http_client': get_http_client(),
 			**(self.client_params or {}),
-		)
+		}
+		return get_shared_client(client_cache_key(AsyncOpenAI, client_params), lambda: AsyncOpenAI(**client_params))
 
 	@property
 	def name(self) -> str:
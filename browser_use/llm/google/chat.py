@@ -8,6 +8,7 @@ from google.genai import types
 from google.genai.types import MediaModality
 from pydantic import BaseModel
 
+from browser_use.http_clients import client_cache_key, get_shared_client
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.google.serializer import GoogleMessageSerializer
@@ -115,7 +116,7 @@ class ChatGoogle(BaseChatModel):
 			genai.Client: An instance of the Google genai client.
 		"""
 		client_params = self._get_client_params()
-		return genai.Client(**client_params)
+		return get_shared_client(client_cache_key(genai.Client, client_params), lambda: genai.Client(**client_params))
 
 	@property
 	def name(self) -> str:
@@ -19,6 +19,7 @@ from groq.types.chat.completion_create_params import (
 from httpx import URL
 from pydantic import BaseModel
 
+from browser_use.http_clients import client_cache_key, get_http_client, get_shared_client
 from browser_use.llm.base import BaseChatModel, ChatInvokeCompletion
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.groq.parser import try_parse_groq_failed_generation
@@ -55,7 +56,14 @@ class ChatGroq(BaseChatModel):
 	max_retries: int = 10  # Increase default retries for automation reliability
 
 	def get_client(self) -> AsyncGroq:
-		return AsyncGroq(api_key=self.api_key, base_url=self.base_url, timeout=self.timeout, max_retries=self.max_retries)
+		client_params = {
+			'api_key': self.api_key,
+			'base_url': self.base_url,
+			'timeout': self.timeout,
+			'max_retries': self.max_retries,
+			'http_client': get_http_client(),
+		}
+		return get_shared_client(client_cache_key(AsyncGroq, client_params), lambda: AsyncGroq(**client_params))
 
 	@property
 	def provider(self) -> str:
@@ -146,6 +146,11 @@ class UserMessage(_MessageBase):
     role.
     """
 
+	cache_prefix_length: int | None = None
+	"""Length of the start of the (first) text content that stays the same in the next requests, the prompt is cached up
+	to there. This is only applicable when using Anthropic models.
+	"""
+
 	@property
 	def text(self) -> str:
 		"""
@@ -5,6 +5,7 @@ import httpx
 from ollama import AsyncClient as OllamaAsyncClient
 from pydantic import BaseModel
 
+from browser_use.http_clients import client_cache_key, get_shared_client
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.messages import BaseMessage
@@ -47,7 +48,10 @@ class ChatOllama(BaseChatModel):
 		"""
 		Returns an OllamaAsyncClient client.
 		"""
-		return OllamaAsyncClient(host=self.host, timeout=self.timeout, **self.client_params or {})
+		return get_shared_client(
+			client_cache_key(OllamaAsyncClient, self._get_client_params()),
+			lambda: OllamaAsyncClient(host=self.host, timeout=self.timeout, **self.client_params or {}),
+		)
 
 	@property
 	def name(self) -> str:
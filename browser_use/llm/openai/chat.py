@@ -1,15 +1,17 @@
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any, TypeVar, overload
 
 import httpx
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
 from openai.types.chat.chat_completion import ChatCompletion
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types.shared.chat_model import ChatModel
 from openai.types.shared_params.reasoning_effort import ReasoningEffort
 from openai.types.shared_params.response_format_json_schema import JSONSchema, ResponseFormatJSONSchema
 from pydantic import BaseModel
 
+from browser_use.http_clients import client_cache_key, get_http_client, get_shared_client
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.messages import BaseMessage
@@ -83,19 +85,39 @@ class ChatOpenAI(BaseChatModel):
 
 	def get_client(self) -> AsyncOpenAI:
 		"""
-		Returns an AsyncOpenAI client.
+		Returns the AsyncOpenAI client for the current parameters, shared by all calls on the same event loop.
 
 		Returns:
 			AsyncOpenAI: An instance of the AsyncOpenAI client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncOpenAI(**client_params)
+		# reuse the connection pool shared by all providers unless the caller brought their own client
+		client_params.setdefault('http_client', get_http_client())
+		return get_shared_client(
+			client_cache_key(AsyncOpenAI, client_params),
+			lambda: AsyncOpenAI(**client_params),
+			close=self.http_client is None,  # closing the SDK client would close the caller's http_client
+		)
 
 	@property
 	def name(self) -> str:
 		return str(self.model)
 
-	def _get_usage(self, response: ChatCompletion) -> ChatInvokeUsage | None:
+	def _get_reasoning_params(self) -> dict[str, Any]:
+		if self.model in ReasoningModels:
+			return {'reasoning_effort': self.reasoning_effort}
+		return {}
+
+	@staticmethod
+	def _get_response_format(output_format: type[BaseModel]) -> ResponseFormatJSONSchema:
+		response_format: JSONSchema = {
+			'name': 'agent_output',
+			'strict': True,
+			'schema': SchemaOptimizer.create_optimized_json_schema(output_format),
+		}
+		return ResponseFormatJSONSchema(json_schema=response_format, type='json_schema')
+
+	def _get_usage(self, response: ChatCompletion | ChatCompletionChunk) -> ChatInvokeUsage | None:
 		if response.usage is not None:
 			completion_tokens = response.usage.completion_tokens
 			completion_token_details = response.usage.completion_tokens_details
@@ -143,11 +165,7 @@ class ChatOpenAI(BaseChatModel):
 		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
 
 		try:
-			reasoning_effort_dict: dict = {}
-			if self.model in ReasoningModels:
-				reasoning_effort_dict = {
-					'reasoning_effort': self.reasoning_effort,
-				}
+			reasoning_effort_dict = self._get_reasoning_params()
 
 			if output_format is None:
 				# Return string response
@@ -165,18 +183,12 @@ class ChatOpenAI(BaseChatModel):
 				)
 
 			else:
-				response_format: JSONSchema = {
-					'name': 'agent_output',
-					'strict': True,
-					'schema': SchemaOptimizer.create_optimized_json_schema(output_format),
-				}
-
 				# Return structured response
 				response = await self.get_client().chat.completions.create(
 					model=self.model,
 					messages=openai_messages,
 					temperature=self.temperature,
-					response_format=ResponseFormatJSONSchema(json_schema=response_format, type='json_schema'),
+					response_format=self._get_response_format(output_format),
 					**reasoning_effort_dict,
 				)
 
@@ -196,21 +208,72 @@ class ChatOpenAI(BaseChatModel):
 					usage=usage,
 				)
 
-		except RateLimitError as e:
+		except Exception as e:
+			raise self._get_provider_error(e) from e
+
+	async def ainvoke_streaming(
+		self, messages: list[BaseMessage], output_format: type[T], on_delta: Callable[[str], None]
+	) -> ChatInvokeCompletion[T]:
+		"""
+		Invoke the model for structured output, reporting the JSON output through on_delta() while it is generated.
+		"""
+
+		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
+
+		try:
+			stream = await self.get_client().chat.completions.create(
+				model=self.model,
+				messages=openai_messages,
+				temperature=self.temperature,
+				response_format=self._get_response_format(output_format),
+				stream=True,
+				stream_options={'include_usage': True},
+				**self._get_reasoning_params(),
+			)
+
+			content: list[str] = []
+			usage = None
+			async for chunk in stream:
+				if chunk.usage is not None:
+					usage = self._get_usage(chunk)
+				if chunk.choices and chunk.choices[0].delta.content:
+					content.append(chunk.choices[0].delta.content)
+					on_delta(chunk.choices[0].delta.content)
+
+			if not content:
+				raise ModelProviderError(
+					message='Failed to parse structured output from model response',
+					status_code=500,
+					model=self.name,
+				)
+
+			return ChatInvokeCompletion(
+				completion=output_format.model_validate_json(''.join(content)),
+				usage=usage,
+			)
+
+		except Exception as e:
+			raise self._get_provider_error(e) from e
+
+	def _get_provider_error(self, e: Exception) -> ModelProviderError:
+		if isinstance(e, ModelProviderError):
+			return e
+
+		if isinstance(e, RateLimitError):
 			error_message = e.response.json().get('error', {})
 			error_message = (
 				error_message.get('message', 'Unknown model error') if isinstance(error_message, dict) else error_message
 			)
-			raise ModelProviderError(
+			return ModelProviderError(
 				message=error_message,
 				status_code=e.response.status_code,
 				model=self.name,
-			) from e
+			)
 
-		except APIConnectionError as e:
-			raise ModelProviderError(message=str(e), model=self.name) from e
+		if isinstance(e, APIConnectionError):
+			return ModelProviderError(message=str(e), model=self.name)
 
-		except APIStatusError as e:
+		if isinstance(e, APIStatusError):
 			try:
 				error_message = e.response.json().get('error', {})
 			except Exception:
@@ -218,11 +281,10 @@ class ChatOpenAI(BaseChatModel):
 			error_message = (
 				error_message.get('message', 'Unknown model error') if isinstance(error_message, dict) else error_message
 			)
-			raise ModelProviderError(
+			return ModelProviderError(
 				message=error_message,
 				status_code=e.response.status_code,
 				model=self.name,
-			) from e
+			)
 
-		except Exception as e:
-			raise ModelProviderError(message=str(e), model=self.name) from e
+		return ModelProviderError(message=str(e), model=self.name)
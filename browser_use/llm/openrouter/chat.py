@@ -11,6 +11,7 @@ from openai.types.shared_params.response_format_json_schema import (
 )
 from pydantic import BaseModel
 
+from browser_use.http_clients import client_cache_key, get_http_client, get_shared_client
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
@@ -81,10 +82,13 @@ class ChatOpenRouter(BaseChatModel):
 		Returns:
 		    AsyncOpenAI: An instance of the AsyncOpenAI client with OpenRouter base URL.
 		"""
-		if not hasattr(self, '_client'):
-			client_params = self._get_client_params()
-			self._client = AsyncOpenAI(**client_params)
-		return self._client
+		client_params = self._get_client_params()
+		client_params.setdefault('http_client', get_http_client())
+		return get_shared_client(
+			client_cache_key(AsyncOpenAI, client_params),
+			lambda: AsyncOpenAI(**client_params),
+			close=self.http_client is None,  # closing the SDK client would close the caller's http_client
+		)
 
 	@property
 	def name(self) -> str:
@@ -2,6 +2,8 @@
 Utilities for creating optimized Pydantic schemas for LLM usage.
 """
 
+import copy
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -20,6 +22,13 @@ class SchemaOptimizer:
 		Returns:
 			Optimized schema with all $refs resolved and strict mode compatibility
 		"""
+		# the schema is built once per model (the agent reuses its output models while the actions are the same),
+		# callers adapt it to their provider so each gets its own copy
+		return copy.deepcopy(SchemaOptimizer._create_optimized_json_schema(model))
+
+	@staticmethod
+	@lru_cache(maxsize=64)
+	def _create_optimized_json_schema(model: type[BaseModel]) -> dict[str, Any]:
 		# Generate original schema
 		original_schema = model.model_json_schema()
 
@@ -0,0 +1,84 @@
+"""
+Incremental parsing of structured outputs that are still being streamed by the model.
+"""
+
+import json
+from typing import Any
+
+
+class IncrementalJSONArrayParser:
+	"""
+	Picks the items of one top-level array (e.g. the "action" list of AgentOutput) out of a JSON object while it is
+	still streaming in, so callers can act on each item as soon as its closing brace arrives.
+
+	Only object items are reported. The parser doesn't validate the document, the complete output is still parsed
+	the usual way once the stream ends.
+	"""
+
+	def __init__(self, array_key: str):
+		self.array_key = array_key
+		self.items: list[dict[str, Any]] = []
+
+		self._buffer = ''
+		self._pos = 0  # next char of the buffer to scan
+		self._depth = 0
+		self._in_string = False
+		self._escape = False
+		self._string_start = 0
+		self._expect_key = False  # at depth 1, whether the next string is a key
+		self._last_key: str | None = None
+		self._in_array = False  # inside the array we are collecting from
+		self._item_start: int | None = None
+
+	def feed(self, chunk: str) -> list[dict[str, Any]]:
+		"""Add the next chunk of the streamed output, returns the items completed by it"""
+		self._buffer += chunk
+		completed: list[dict[str, Any]] = []
+
+		buffer = self._buffer
+		for i in range(self._pos, len(buffer)):
+			char = buffer[i]
+
+			if self._in_string:
+				if self._escape:
+					self._escape = False
+				elif char == '\\':
+					self._escape = True
+				elif char == '"':
+					self._in_string = False
+					if self._depth == 1 and self._expect_key:
+						self._last_key = json.loads(buffer[self._string_start : i + 1])
+				continue
+
+			if char == '"':
+				self._in_string = True
+				self._string_start = i
+			elif char in '{[':
+				self._depth += 1
+				if self._depth == 1:
+					self._expect_key = True
+				elif self._depth == 2 and char == '[' and self._last_key == self.array_key:
+					self._in_array = True
+				elif self._depth == 3 and char == '{' and self._in_array:
+					self._item_start = i
+			elif char in '}]':
+				if self._depth == 3 and self._item_start is not None:
+					try:
+						item = json.loads(buffer[self._item_start : i + 1])
+					except json.JSONDecodeError:
+						pass  # left for the final parse to report
+					else:
+						self.items.append(item)
+						completed.append(item)
+					self._item_start = None
+				elif self._depth == 2:
+					self._in_array = False
+				self._depth -= 1
+			elif self._depth == 1:
+				if char == ':':
+					self._expect_key = False
+				elif char == ',':
+					self._expect_key = True
+
+		self._pos = len(buffer)
+		return completed
@@ -0,0 +1,106 @@
+"""
+Lookups for the sensitive_data of an agent, prepared once instead of for every message and action.
+
+sensitive_data is either in the old format {placeholder: value}, which is exposed on all domains, or in the new format
+{domain_pattern: {placeholder: value}}. Secret values are redacted to <secret>placeholder</secret> in the messages sent
+to the LLM, and the placeholders in the LLM's actions are replaced by the values of the secrets for the current page.
+"""
+
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+
+from browser_use.utils import is_new_tab_page, match_url_with_domain_pattern
+
+SECRET_PLACEHOLDER_RE = re.compile(r'<secret>(.*?)</secret>')
+
+# pages visited during a run, the secrets for each are looked up once
+URL_CACHE_SIZE = 256
+
+SensitiveData = Mapping[str, str | Mapping[str, str]]
+
+
+class SensitiveDataIndex:
+	"""Redaction table and domain -> secrets index of one sensitive_data dict, use get_sensitive_data_index to get one"""
+
+	def __init__(self, sensitive_data: SensitiveData):
+		# a copy, so changes to the agent's dict are noticed by get_sensitive_data_index
+		self.sensitive_data = {
+			key_or_domain: dict(content) if isinstance(content, Mapping) else content
+			for key_or_domain, content in sensitive_data.items()
+		}
+		self.global_secrets: dict[str, str] = {}  # old format, exposed on all domains
+		self.domain_secrets: dict[str, dict[str, str]] = {}  # domain pattern -> secrets
+
+		placeholder_by_value: dict[str, str] = {}
+		for key_or_domain, content in sensitive_data.items():
+			if isinstance(content, Mapping):
+				self.domain_secrets[key_or_domain] = dict(content)
+				secrets = content.items()
+			else:
+				self.global_secrets[key_or_domain] = content
+				secrets = [(key_or_domain, content)]
+			for placeholder, value in secrets:
+				if value:  # empty values can't be redacted
+					placeholder_by_value.setdefault(value, placeholder)
+
+		# longest values first, so a secret that contains another one is redacted as a whole.
+		# str.replace per value beats a single-pass regex alternation of the values, even with dozens of secrets,
+		# CPython's re has no multi-literal search and tries every alternative at every position
+		self.redactions = [
+			(value, f'<secret>{placeholder}</secret>')
+			for value, placeholder in sorted(placeholder_by_value.items(), key=lambda item: len(item[0]), reverse=True)
+		]
+		self._secrets_for_url = lru_cache(maxsize=URL_CACHE_SIZE)(self._find_secrets_for_url)
+
+	def redact(self, text: str) -> str:
+		"""Replace all secret values in text with their placeholder tags"""
+		for value, tag in self.redactions:
+			text = text.replace(value, tag)
+		return text
+
+	def secrets_for_url(self, url: str | None) -> dict[str, str]:
+		"""The non-empty secrets that can be used on the url, domain-specific ones only on real pages that match"""
+		return self._secrets_for_url(url)
+
+	def placeholders_for_url(self, url: str) -> set[str]:
+		"""Placeholder names to tell the LLM about on the url"""
+		placeholders = set(self.global_secrets)
+		for domain_pattern, secrets in self.domain_secrets.items():
+			if match_url_with_domain_pattern(url, domain_pattern, True):
+				placeholders.update(secrets)
+		return placeholders
+
+	def _find_secrets_for_url(self, url: str | None) -> dict[str, str]:
+		secrets = dict(self.global_secrets)
+		if url and not is_new_tab_page(url):
+			# it's a real url, check it using our custom allowed_domains scheme://*.example.com glob matching
+			for domain_pattern, domain_secrets in self.domain_secrets.items():
+				if match_url_with_domain_pattern(url, domain_pattern):
+					secrets.update(domain_secrets)
+		return {placeholder: value for placeholder, value in secrets.items() if value}
+
+
+def replace_placeholders(text: str, secrets: Mapping[str, str], used: set[str], missing: set[str]) -> str:
+	"""Replace the <secret> tags in text with the values in secrets, adding the placeholder names to used or missing"""
+
+	def replace(match: re.Match[str]) -> str:
+		placeholder = match.group(1)
+		if placeholder in secrets:
+			used.add(placeholder)
+			return secrets[placeholder]
+		# Don't replace the tag, keep it as is
+		missing.add(placeholder)
+		return match.group(0)
+
+	return SECRET_PLACEHOLDER_RE.sub(replace, text)
+
+
+def get_sensitive_data_index(sensitive_data: SensitiveData, index: SensitiveDataIndex | None) -> SensitiveDataIndex:
+	"""
+	The index for sensitive_data: the given index if it was built for the same secrets (even when passed as a new dict),
+	a new one otherwise. Callers keep the index on their instance, so the secrets are not held after the agent is gone.
+	"""
+	if index is not None and index.sensitive_data == sensitive_data:
+		return index
+	return SensitiveDataIndex(sensitive_data)
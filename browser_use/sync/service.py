@@ -3,6 +3,9 @@ Cloud sync service for sending events to the Browser Use cloud.
 """
 
 import asyncio
+import base64
+import gzip
+import hashlib
 import json
 import logging
 import shutil
@@ -12,15 +15,27 @@ import httpx
 from bubus import BaseEvent
 
 from browser_use.config import CONFIG
+from browser_use.http_clients import get_http_client
 from browser_use.sync.auth import TEMP_USER_ID, DeviceAuthClient
+from browser_use.sync.uploader import EventUploader, UploadMetrics
+from browser_use.sync.wal import EventWAL
 
 logger = logging.getLogger(__name__)
 
+# request bodies smaller than this aren't worth compressing
+GZIP_MIN_SIZE = 1024
+
 
 class CloudSync:
-	"""Service for syncing events to the Browser Use cloud"""
+	"""
+	Service for syncing events to the Browser Use cloud
+
+	With background_upload=True, events are batched and uploaded by a background task (see EventUploader) with
+	gzipped request bodies, and step screenshots are uploaded once as content-addressed blobs instead of being
+	inlined into every event. Call flush() before the event loop ends to send what is still queued.
+	"""
 
-	def __init__(self, base_url: str | None = None, enable_auth: bool = True):
+	def __init__(self, base_url: str | None = None, enable_auth: bool = True, background_upload: bool = False):
 		# Backend API URL for all API requests - can be passed directly or defaults to env var
 		self.base_url = base_url or CONFIG.BROWSER_USE_CLOUD_API_URL
 		self.enable_auth = enable_auth
@@ -28,6 +43,13 @@ class CloudSync:
 		self.pending_events: list[BaseEvent] = []
 		self.auth_task = None
 		self.session_id: str | None = None
+		self.uploader = EventUploader(self._send_events) if background_upload else None
+		self._uploaded_blobs: dict[str, str] = {}  # sha256 of the screenshot -> blob url
+		self._blob_uploads_supported = True
+
+	@property
+	def upload_metrics(self) -> UploadMetrics | None:
+		return self.uploader.metrics if self.uploader else None
 
 	async def handle_event(self, event: BaseEvent) -> None:
 		"""Handle an event by sending it to the cloud"""
@@ -52,57 +74,125 @@ class CloudSync:
 							logger.warning('Cannot start auth - session_id not set yet')
 
 			# Send event to cloud
-			await self._send_event(event)
+			if self.uploader:
+				self.uploader.put(event)
+			else:
+				await self._send_event(event)
 
 		except Exception as e:
 			logger.error(f'Failed to handle {event.event_type} event: {type(e).__name__}: {e}', exc_info=True)
 
 	async def _send_event(self, event: BaseEvent) -> None:
 		"""Send event to cloud API"""
+		await self._send_events([event])
+
+	async def _send_events(self, events: list[BaseEvent]) -> bool:
+		"""Send a batch of events to cloud API, returns False if it failed in a way worth retrying"""
 		try:
 			headers = {}
 
-			# override user_id on event with auth client user_id if available
-			if self.auth_client:
-				event.user_id = str(self.auth_client.user_id)  # type: ignore
-			else:
-				event.user_id = TEMP_USER_ID  # type: ignore
+			for event in events:
+				# override user_id on event with auth client user_id if available
+				if self.auth_client:
+					event.user_id = str(self.auth_client.user_id)  # type: ignore
+				else:
+					event.user_id = TEMP_USER_ID  # type: ignore
 
 			# Add auth headers if available
 			if self.auth_client:
 				headers.update(self.auth_client.get_headers())
 
-			# Send event (batch format with direct BaseEvent serialization)
-			async with httpx.AsyncClient() as client:
-				# Serialize event and add device_id to all events
-				event_data = event.model_dump(mode='json')
-				if self.auth_client and self.auth_client.device_id:
+			# Serialize events and add device_id to all events
+			events_data = [event.model_dump(mode='json') for event in events]
+			if self.auth_client and self.auth_client.device_id:
+				for event_data in events_data:
 					event_data['device_id'] = self.auth_client.device_id
 
-				response = await client.post(
-					f'{self.base_url.rstrip("/")}/api/v1/events',
-					json={'events': [event_data]},
-					headers=headers,
-					timeout=10.0,
-				)
+			if self.uploader:
+				await self._upload_screenshots(events_data, headers)
+
+			# Send events (batch format with direct BaseEvent serialization), over the shared keep-alive connection pool
+			body = json.dumps({'events': events_data}).encode()
+			headers['Content-Type'] = 'application/json'
+			if self.uploader and len(body) >= GZIP_MIN_SIZE:
+				body = gzip.compress(body, compresslevel=6)
+				headers['Content-Encoding'] = 'gzip'
+			if self.uploader:
+				self.uploader.metrics.bytes_sent += len(body)
+
+			response = await get_http_client().post(
+				f'{self.base_url.rstrip("/")}/api/v1/events',
+				content=body,
+				headers=headers,
+				timeout=10.0,
+			)
 
-				if response.status_code == 401 and self.auth_client and not self.auth_client.is_authenticated:
-					# Store event for retry after auth
-					self.pending_events.append(event)
-				elif response.status_code >= 400:
-					# Log error but don't raise - we want to fail silently
-					logger.debug(
-						f'Failed to send sync event: POST {response.request.url} {response.status_code} - {response.text}'
-					)
+			if response.status_code == 401 and self.auth_client and not self.auth_client.is_authenticated:
+				# Store events for retry after auth
+				self.pending_events.extend(events)
+			elif response.status_code == 429 or response.status_code >= 500:
+				logger.debug(f'Failed to send sync events: POST {response.request.url} {response.status_code} - {response.text}')
+				return False
+			elif response.status_code >= 400:
+				# Log error but don't raise - we want to fail silently
+				logger.debug(f'Failed to send sync event: POST {response.request.url} {response.status_code} - {response.text}')
+			return True
 		except httpx.TimeoutException:
-			logger.warning(f'⚠️ Event send timed out after 10 seconds: {event}')
+			logger.warning(f'⚠️ Event send timed out after 10 seconds: {self._describe(events)}')
 		except httpx.ConnectError as e:
 			# logger.warning(f'⚠️ Failed to connect to cloud service at {self.base_url}: {e}')
 			pass
 		except httpx.HTTPError as e:
-			logger.warning(f'⚠️ HTTP error sending event {event}: {type(e).__name__}: {e}')
+			logger.warning(f'⚠️ HTTP error sending event {self._describe(events)}: {type(e).__name__}: {e}')
 		except Exception as e:
-			logger.warning(f'⚠️ Unexpected error sending event {event}: {type(e).__name__}: {e}')
+			logger.warning(f'⚠️ Unexpected error sending event {self._describe(events)}: {type(e).__name__}: {e}')
+			return True  # e.g. an event that can't be serialized, sending it again won't help
+		return False
+
+	@staticmethod
+	def _describe(events: list[BaseEvent]) -> str:
+		return str(events[0]) if len(events) == 1 else f'batch of {len(events)} events'
+
+	async def _upload_screenshots(self, events_data: list[dict], headers: dict[str, str]) -> None:
+		"""Replace inlined base64 screenshots with the url of the uploaded blob, each distinct screenshot is uploaded once"""
+		for event_data in events_data:
+			screenshot_url = event_data.get('screenshot_url')
+			if not self._blob_uploads_supported or not screenshot_url or not screenshot_url.startswith('data:'):
+				continue
+			blob_url = await self._upload_blob(screenshot_url, headers)
+			if blob_url:
+				event_data['screenshot_url'] = blob_url
+
+	async def _upload_blob(self, data_url: str, headers: dict[str, str]) -> str | None:
+		try:
+			media_type, _, payload = data_url.removeprefix('data:').partition(',')
+			data = base64.b64decode(payload)
+			digest = hashlib.sha256(data).hexdigest()
+			if digest in self._uploaded_blobs:
+				return self._uploaded_blobs[digest]
+
+			blob_url = f'{self.base_url.rstrip("/")}/api/v1/blobs/{digest}'
+			response = await get_http_client().put(
+				blob_url,
+				content=data,
+				headers={**headers, 'Content-Type': media_type.split(';')[0] or 'application/octet-stream'},
+				timeout=10.0,
+			)
+			if response.status_code in (404, 405, 501):
+				# the server doesn't take blobs, keep sending screenshots inline
+				logger.debug(f'Cloud sync blob uploads are not supported by {self.base_url}, sending screenshots inline')
+				self._blob_uploads_supported = False
+				return None
+			if response.status_code >= 400:
+				return None
+
+			self._uploaded_blobs[digest] = blob_url
+			if self.uploader:
+				self.uploader.metrics.bytes_sent += len(data)
+			return blob_url
+		except Exception as e:
+			logger.debug(f'Failed to upload screenshot blob: {type(e).__name__}: {e}')
+			return None
 
 	async def _background_auth(self, agent_session_id: str) -> None:
 		"""Run authentication in background or show cloud URL if already authenticated"""
@@ -142,6 +232,12 @@ class CloudSync:
 		if not self.pending_events:
 			return
 
+		if self.uploader:
+			for event in self.pending_events:
+				self.uploader.put(event)
+			self.pending_events.clear()
+			return
+
 		# Send all pending events
 		for event in self.pending_events:
 			try:
@@ -156,35 +252,23 @@ class CloudSync:
 		try:
 			assert self.auth_client, 'Cloud sync must be authenticated to update WAL user ID'
 
-			wal_path = CONFIG.BROWSER_USE_CONFIG_DIR / 'events' / f'{session_id}.jsonl'
-			if not await anyio.Path(wal_path).exists():
+			wal = EventWAL(CONFIG.BROWSER_USE_CONFIG_DIR / 'events' / f'{session_id}.jsonl')
+			if not await anyio.Path(wal.path).exists():
 				raise FileNotFoundError(
-					f'CloudSync failed to update saved event user_ids after auth: Agent EventBus WAL file not found: {wal_path}'
+					f'CloudSync failed to update saved event user_ids after auth: Agent EventBus WAL file not found: {wal.path}'
 				)
 
-			# Read all events
-			events = []
-			content = await anyio.Path(wal_path).read_text()
-			for line in content.splitlines():
-				if line.strip():
-					events.append(json.loads(line))
-
-			# Update user_id and device_id
-			user_id = self.auth_client.user_id
-			device_id = self.auth_client.device_id
-			for event in events:
-				if 'user_id' in event:
-					event['user_id'] = user_id
-				# Add device_id to all events
-				event['device_id'] = device_id
-
-			# Write back
-			updated_content = '\n'.join(json.dumps(event) for event in events) + '\n'
-			await anyio.Path(wal_path).write_text(updated_content)
+			# Only the metadata sidecar is written, the events get the new ids applied when they are read
+			await wal.update_metadata(user_id=self.auth_client.user_id, device_id=self.auth_client.device_id)
 
 		except Exception as e:
 			logger.warning(f'Failed to update WAL user IDs: {e}')
 
+	async def flush(self, timeout: float = 10.0) -> None:
+		"""Upload the events still queued by the background uploader"""
+		if self.uploader:
+			await self.uploader.flush(timeout=timeout)
+
 	async def wait_for_auth(self) -> None:
 		"""Wait for authentication to complete if in progress"""
 		if self.auth_task and not self.auth_task.done():
@@ -0,0 +1,135 @@
+"""
+Background uploader that batches cloud sync events, so the event bus never waits for the network.
+
+Events are put on a bounded queue and sent by a single worker task in batches, a batch is sent once it is full or
+max_batch_delay after its first event arrived. Failed batches are retried with exponential backoff. When the queue
+is full (the cloud is slower than the agent produces events), new events are dropped instead of blocking the agent.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from bubus import BaseEvent
+
+logger = logging.getLogger(__name__)
+
+# put on the queue by flush() to send the current batch right away instead of waiting for max_batch_delay
+_FLUSH = object()
+
+
+@dataclass
+class UploadMetrics:
+	queued: int = 0  # events accepted by put()
+	sent: int = 0  # events in batches the server accepted (or rejected for good)
+	failed: int = 0  # events given up on after all retries
+	dropped: int = 0  # events rejected because the queue was full
+	batches: int = 0  # requests made, including retries
+	retries: int = 0
+	bytes_sent: int = 0  # request body size after compression
+	max_queue_depth: int = 0
+
+
+class EventUploader:
+	"""
+	Sends events with send_batch in batches from a background task.
+
+	send_batch returns False if the batch failed in a way worth retrying (timeouts, 5xx, ...), True otherwise.
+	"""
+
+	def __init__(
+		self,
+		send_batch: Callable[[list[BaseEvent]], Awaitable[bool]],
+		max_queue_size: int = 1000,
+		max_batch_size: int = 50,
+		max_batch_delay: float = 0.5,
+		max_retries: int = 3,
+		retry_backoff: float = 0.5,
+	):
+		self.send_batch = send_batch
+		self.max_queue_size = max_queue_size
+		self.max_batch_size = max_batch_size
+		self.max_batch_delay = max_batch_delay
+		self.max_retries = max_retries
+		self.retry_backoff = retry_backoff
+		self.metrics = UploadMetrics()
+		self._queue: asyncio.Queue[BaseEvent | object] | None = None
+		self._worker: asyncio.Task | None = None
+
+	def put(self, event: BaseEvent) -> bool:
+		"""Queue an event for upload without waiting, returns False if it was dropped because the queue is full"""
+		if self._worker is not None and self._worker.done():
+			# the worker only stops with its event loop, the queue can't be used from another loop
+			self._queue = self._worker = None
+		if self._queue is None:
+			self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+		try:
+			self._queue.put_nowait(event)
+		except asyncio.QueueFull:
+			if not self.metrics.dropped:
+				logger.warning(f'⚠️ Cloud sync upload queue is full ({self.max_queue_size} events), dropping new events')
+			self.metrics.dropped += 1
+			return False
+
+		self.metrics.queued += 1
+		self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self._queue.qsize())
+		if self._worker is None:
+			self._worker = asyncio.create_task(self._run(self._queue), name='cloud_sync_uploader')
+		return True
+
+	async def flush(self, timeout: float = 10.0) -> bool:
+		"""Send everything that is queued and stop the worker (it restarts on the next put), returns False on timeout"""
+		queue, worker = self._queue, self._worker
+		if queue is None or worker is None or worker.done():
+			return True
+
+		try:
+			queue.put_nowait(_FLUSH)
+		except asyncio.QueueFull:
+			pass  # a full queue is sent in full batches anyway
+		try:
+			await asyncio.wait_for(queue.join(), timeout=timeout)
+			return True
+		except TimeoutError:
+			logger.warning(f'⚠️ Cloud sync could not upload {queue.qsize()} queued events within {timeout} seconds')
+			return False
+		finally:
+			worker.cancel()
+			self._worker = None
+			# whatever is left was not sent, start with an empty queue next time
+			self._queue = None
+
+	async def _run(self, queue: 'asyncio.Queue[BaseEvent | object]') -> None:
+		loop = asyncio.get_running_loop()
+		while True:
+			items = [await queue.get()]
+			deadline = loop.time() + self.max_batch_delay
+			while items[-1] is not _FLUSH and len(items) < self.max_batch_size:
+				try:
+					items.append(await asyncio.wait_for(queue.get(), timeout=max(deadline - loop.time(), 0)))
+				except TimeoutError:
+					break
+
+			try:
+				batch = [item for item in items if item is not _FLUSH]
+				if batch:
+					await self._send_with_retry(batch)  # type: ignore[arg-type]
+			except Exception as e:
+				logger.warning(f'⚠️ Unexpected error uploading cloud sync events: {type(e).__name__}: {e}')
+			finally:
+				for _ in items:
+					queue.task_done()
+
+	async def _send_with_retry(self, batch: list[BaseEvent]) -> None:
+		for attempt in range(self.max_retries + 1):
+			if attempt:
+				self.metrics.retries += 1
+				await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+			self.metrics.batches += 1
+			if await self.send_batch(batch):
+				self.metrics.sent += len(batch)
+				return
+
+		logger.debug(f'Giving up on uploading {len(batch)} cloud sync events after {self.max_retries} retries')
+		self.metrics.failed += len(batch)
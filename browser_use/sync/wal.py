@@ -0,0 +1,146 @@
+"""
+Write-ahead log of the events of an agent session, as written by the agent's event bus.
+
+The log is append-only JSONL split into segments (<session>.jsonl, <session>.1.jsonl, ...), next to it are an offset
+index (<session>.idx, one [event_id, event_type, segment, offset, length] line per event) and a metadata sidecar
+(<session>.meta.json) with session-level fields like the user_id and device_id. Setting those after authentication
+only rewrites the small sidecar, readers apply it to the events they return.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import anyio
+from bubus import BaseEvent, EventBus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_SIZE = 16 * 1024 * 1024  # a step event with a screenshot is a few hundred KB
+
+
+class WALIndexEntry(NamedTuple):
+	event_id: str
+	event_type: str
+	segment: int
+	offset: int
+	length: int
+
+
+class EventWAL:
+	"""Segmented, indexed event log of one agent session, see the module docstring for the file layout"""
+
+	def __init__(self, path: Path | str, max_segment_size: int = DEFAULT_SEGMENT_SIZE):
+		self.path = Path(path)  # the first segment
+		self.max_segment_size = max_segment_size
+		self.index_path = self.path.with_suffix('.idx')
+		self.metadata_path = self.path.with_suffix('.meta.json')
+		self._segment: int | None = None  # the segment being appended to, found on the first append
+		self._segment_size = 0
+
+	def segment_path(self, segment: int) -> Path:
+		return self.path if segment == 0 else self.path.with_name(f'{self.path.stem}.{segment}{self.path.suffix}')
+
+	def segments(self) -> list[Path]:
+		paths = []
+		while self.segment_path(len(paths)).exists():
+			paths.append(self.segment_path(len(paths)))
+		return paths
+
+	async def append(self, event_id: str, event_type: str, event_json: str) -> WALIndexEntry:
+		"""Append an event to the current segment (starting a new one once it is full) and index it"""
+		if self._segment is None:
+			self._segment = max(len(self.segments()) - 1, 0)
+			segment_path = self.segment_path(self._segment)
+			self._segment_size = segment_path.stat().st_size if segment_path.exists() else 0
+
+		line = (event_json + '\n').encode()
+		if self._segment_size and self._segment_size + len(line) > self.max_segment_size:
+			self._segment += 1
+			self._segment_size = 0
+
+		entry = WALIndexEntry(event_id, event_type, self._segment, self._segment_size, len(line))
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		async with await anyio.open_file(self.segment_path(self._segment), 'ab') as f:
+			await f.write(line)
+		async with await anyio.open_file(self.index_path, 'a', encoding='utf-8') as f:
+			await f.write(json.dumps(entry) + '\n')
+		self._segment_size += len(line)
+		return entry
+
+	def read_metadata(self) -> dict[str, Any]:
+		try:
+			return json.loads(self.metadata_path.read_text())
+		except FileNotFoundError:
+			return {}
+
+	async def update_metadata(self, **fields: Any) -> None:
+		"""Set session-level fields for all events (e.g. user_id after authentication), without touching the log itself"""
+		metadata = {**self.read_metadata(), **fields}
+		self.metadata_path.parent.mkdir(parents=True, exist_ok=True)
+		tmp_path = self.metadata_path.with_name(f'{self.metadata_path.name}.tmp')
+		await anyio.Path(tmp_path).write_text(json.dumps(metadata))
+		os.replace(tmp_path, self.metadata_path)
+
+	def read_index(self) -> list[WALIndexEntry]:
+		try:
+			with open(self.index_path, encoding='utf-8') as f:
+				return [WALIndexEntry(*json.loads(line)) for line in f if line.strip()]
+		except FileNotFoundError:
+			return []
+
+	def iter_events(self, after_event_id: str | None = None) -> Iterator[dict[str, Any]]:
+		"""Yield the logged events in order with the metadata applied, optionally only those after after_event_id"""
+		metadata = self.read_metadata()
+		segment, offset = 0, 0
+		if after_event_id is not None:
+			entry = next((entry for entry in self.read_index() if entry.event_id == after_event_id), None)
+			if entry is None:
+				raise KeyError(f'Event {after_event_id} is not in the index of {self.path}')
+			segment, offset = entry.segment, entry.offset + entry.length
+
+		for path in self.segments()[segment:]:
+			with open(path, 'rb') as f:
+				f.seek(offset)
+				for line in f:
+					if line.strip():
+						yield _apply_metadata(json.loads(line), metadata)
+			offset = 0
+
+	def read_event(self, event_id: str) -> dict[str, Any] | None:
+		"""Read a single event, seeking to it with the index"""
+		entry = next((entry for entry in self.read_index() if entry.event_id == event_id), None)
+		if entry is None:
+			return None
+		with open(self.segment_path(entry.segment), 'rb') as f:
+			f.seek(entry.offset)
+			return _apply_metadata(json.loads(f.read(entry.length)), self.read_metadata())
+
+
+def _apply_metadata(event: dict[str, Any], metadata: dict[str, Any]) -> dict[str, Any]:
+	# same rules as the cloud sync applies to live events: user_id is overridden where present, device_id added to all
+	if 'user_id' in metadata and 'user_id' in event:
+		event['user_id'] = metadata['user_id']
+	if 'device_id' in metadata:
+		event['device_id'] = metadata['device_id']
+	return event
+
+
+class WALEventBus(EventBus):
+	"""EventBus that persists completed events to an EventWAL instead of a single ever-growing JSONL file"""
+
+	def __init__(self, name: str | None = None, wal_path: Path | str | None = None, **kwargs: Any):
+		super().__init__(name=name, wal_path=wal_path, **kwargs)
+		self.wal = EventWAL(self.wal_path) if self.wal_path else None
+
+	async def _default_wal_handler(self, event: BaseEvent) -> None:
+		# overrides a private hook of bubus, tests/ci/test_event_wal.py checks that bubus still calls it
+		if not self.wal:
+			return
+		try:
+			await self.wal.append(event.event_id, event.event_type, event.model_dump_json())
+		except Exception as e:
+			logger.error(f'❌ {self} Failed to save event {event.event_id} to WAL file: {type(e).__name__} {e}')
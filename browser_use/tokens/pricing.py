@@ -0,0 +1,126 @@
+"""
+Compact pricing index for TokenCost.
+
+LiteLLM's model_prices_and_context_window.json is over a megabyte with dozens of fields per model, TokenCost only
+needs a handful of them. The index keeps one row of those fields per model. A snapshot of it ships with the package
+so costs can be calculated without network access, refreshed indexes are cached as a pickle that loads in a
+millisecond.
+
+Regenerate the bundled snapshot with: python -m browser_use.tokens.pricing
+"""
+
+import importlib.resources
+import json
+import os
+import pickle
+from collections.abc import Iterator, Mapping
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+PRICING_URL = 'https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json'
+PRICING_FIELDS = (
+	'input_cost_per_token',
+	'output_cost_per_token',
+	'cache_read_input_token_cost',
+	'cache_creation_input_token_cost',
+	'max_tokens',
+	'max_input_tokens',
+	'max_output_tokens',
+)
+SNAPSHOT_FILENAME = 'pricing_snapshot.json'
+INDEX_FILENAME = 'pricing_index.pkl'
+
+PricingRow = tuple[float | int | None, ...]
+
+
+def compact_pricing(data: Mapping[str, Any]) -> dict[str, PricingRow]:
+	"""Reduce the LiteLLM pricing data to one row of PRICING_FIELDS per model that has any token costs"""
+	rows: dict[str, PricingRow] = {}
+	for model, fields in data.items():
+		if not isinstance(fields, dict):
+			continue
+		row = tuple(value if isinstance(value, (int, float)) else None for value in map(fields.get, PRICING_FIELDS))
+		if any(value is not None for value in row[:4]):
+			rows[model] = row
+	return rows
+
+
+class PricingIndex(Mapping[str, dict[str, Any]]):
+	"""Model name -> pricing fields, the field dicts are only built for the models that are looked up"""
+
+	def __init__(self, rows: dict[str, PricingRow], timestamp: datetime):
+		self.rows = rows
+		self.timestamp = timestamp
+
+	def __getitem__(self, model: str) -> dict[str, Any]:
+		return {name: value for name, value in zip(PRICING_FIELDS, self.rows[model]) if value is not None}
+
+	def __contains__(self, model: object) -> bool:
+		return model in self.rows
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self.rows)
+
+	def __len__(self) -> int:
+		return len(self.rows)
+
+	def is_fresh(self, max_age: timedelta) -> bool:
+		return datetime.now() - self.timestamp < max_age
+
+	@classmethod
+	def from_litellm(cls, data: Mapping[str, Any]) -> 'PricingIndex':
+		return cls(compact_pricing(data), timestamp=datetime.now())
+
+	@classmethod
+	def load(cls, path: Path) -> 'PricingIndex | None':
+		"""Load a cached index, None if there is none (or it can't be read)"""
+		try:
+			with open(path, 'rb') as f:
+				timestamp, rows = pickle.load(f)
+			return cls(rows, timestamp)
+		except Exception:
+			return None
+
+	@classmethod
+	def load_snapshot(cls) -> 'PricingIndex | None':
+		"""The index bundled with the package, None if it is missing from the install (or can't be read)"""
+		try:
+			snapshot = json.loads(importlib.resources.files('browser_use.tokens').joinpath(SNAPSHOT_FILENAME).read_text())
+			fields = tuple(snapshot['fields'])
+			rows = {
+				model: tuple(dict(zip(fields, row)).get(name) for name in PRICING_FIELDS)
+				for model, row in snapshot['models'].items()
+			}
+			return cls(rows, timestamp=datetime.fromisoformat(snapshot['timestamp']))
+		except Exception:
+			return None
+
+	def save(self, path: Path) -> None:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		tmp_path = path.with_name(f'{path.name}.tmp')
+		with open(tmp_path, 'wb') as f:
+			pickle.dump((self.timestamp, self.rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(tmp_path, path)
+
+	def save_snapshot(self, path: Path) -> None:
+		# one line per model, so updates make readable diffs
+		models = ',\n'.join(f'\t\t{json.dumps(model)}: {json.dumps(self.rows[model])}' for model in sorted(self.rows))
+		path.write_text(
+			'{\n'
+			f'\t"source": {json.dumps(PRICING_URL)},\n'
+			f'\t"timestamp": {json.dumps(self.timestamp.isoformat(timespec="seconds"))},\n'
+			f'\t"fields": {json.dumps(PRICING_FIELDS)},\n'
+			f'\t"models": {{\n{models}\n\t}}\n'
+			'}\n'
+		)
+
+
+if __name__ == '__main__':
+	import httpx
+
+	response = httpx.get(PRICING_URL, timeout=30)
+	response.raise_for_status()
+	index = PricingIndex.from_litellm(response.json())
+	index.save_snapshot(Path(__file__).with_name(SNAPSHOT_FILENAME))
+	print(f'Saved pricing of {len(index)} models to {SNAPSHOT_FILENAME}')
@@ -1,25 +1,27 @@
 """
 Token cost service that tracks LLM token usage and costs.
 
-Fetches pricing data from LiteLLM repository and caches it for 1 day.
+Pricing comes from a compact index of LiteLLM's pricing data, bundled with the package and refreshed in the
+background once a day (see browser_use/tokens/pricing.py).
 Automatically tracks token usage when LLMs are registered and invoked.
 """
 
 import asyncio
 import logging
 import os
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import aiofiles
-import httpx
 from dotenv import load_dotenv
 
+from browser_use.http_clients import get_http_client
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.views import ChatInvokeUsage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+from browser_use.tokens.pricing import INDEX_FILENAME, PRICING_URL, PricingIndex
 from browser_use.tokens.views import (
-	CachedPricingData,
 	ModelPricing,
 	ModelUsageStats,
 	ModelUsageTokens,
@@ -36,6 +38,42 @@ logger = logging.getLogger(__name__)
 cost_logger = logging.getLogger('cost')
 
 
+@dataclass
+class _UsageTotals:
+	"""Running totals of a group of usage entries, costs are only added once the pricing is known"""
+
+	invocations: int = 0
+	prompt_tokens: int = 0
+	prompt_cached_tokens: int = 0
+	completion_tokens: int = 0
+	prompt_cost: float = 0.0
+	prompt_cached_cost: float = 0.0
+	completion_cost: float = 0.0
+
+	def add_tokens(self, usage: ChatInvokeUsage) -> None:
+		self.invocations += 1
+		self.prompt_tokens += usage.prompt_tokens
+		self.prompt_cached_tokens += usage.prompt_cached_tokens or 0
+		self.completion_tokens += usage.completion_tokens
+
+	def add_cost(self, cost: TokenCostCalculated | None) -> None:
+		if cost:
+			self.prompt_cost += cost.prompt_cost
+			self.prompt_cached_cost += cost.prompt_read_cached_cost or 0
+			self.completion_cost += cost.completion_cost
+
+	def reset_cost(self) -> None:
+		self.prompt_cost = self.prompt_cached_cost = self.completion_cost = 0.0
+
+
+@dataclass
+class _UsageBucket:
+	"""Usage of one time bucket, the entries are kept for queries starting in the middle of the bucket"""
+
+	entries: list[TokenUsageEntry] = field(default_factory=list)
+	by_model: dict[str, _UsageTotals] = field(default_factory=dict)
+
+
 def xdg_cache_home() -> Path:
 	default = Path.home() / '.cache'
 	if CONFIG.XDG_CACHE_HOME and (path := Path(CONFIG.XDG_CACHE_HOME)).is_absolute():
@@ -48,17 +86,39 @@ class TokenCost:
 
 	CACHE_DIR_NAME = 'browser_use/token_cost'
 	CACHE_DURATION = timedelta(days=1)
-	PRICING_URL = 'https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json'
+	PRICING_URL = PRICING_URL
+	BUCKET_SECONDS = 60  # granularity of the rollups used by get_usage_summary(since=...)
 
 	def __init__(self, include_cost: bool = False):
 		self.include_cost = include_cost or os.getenv('BROWSER_USE_CALCULATE_COST', 'false').lower() == 'true'
 
 		self.usage_history: list[TokenUsageEntry] = []
 		self.registered_llms: dict[str, BaseChatModel] = {}
-		self._pricing_data: dict[str, Any] | None = None
+		self._pricing_data_value: Mapping[str, Any] | None = None
+		self._pricing_cache: dict[str, ModelPricing | None] = {}
 		self._initialized = False
 		self._cache_dir = xdg_cache_home() / self.CACHE_DIR_NAME
 
+		# running aggregates of usage_history, updated by add_usage() so summaries don't rescan the history
+		self._totals: dict[str, _UsageTotals] = {}
+		self._buckets: dict[int, _UsageBucket] = {}
+		self._unpriced: list[TokenUsageEntry] = []  # entries added before the pricing data was loaded
+		self._log_tasks: set[asyncio.Task] = set()
+		self._refresh_task: asyncio.Task | None = None
+
+	@property
+	def _pricing_data(self) -> Mapping[str, Any] | None:
+		return self._pricing_data_value
+
+	@_pricing_data.setter
+	def _pricing_data(self, data: Mapping[str, Any] | None) -> None:
+		# new prices: forget the memoized lookups and price the whole history again on the next summary
+		self._pricing_data_value = data
+		self._pricing_cache.clear()
+		for totals in self._iter_totals():
+			totals.reset_cost()
+		self._unpriced = list(self.usage_history)
+
 	async def initialize(self) -> None:
 		"""Initialize the service by loading pricing data"""
 		if not self._initialized:
@@ -67,99 +127,28 @@ class TokenCost:
 			self._initialized = True
 
 	async def _load_pricing_data(self) -> None:
-		"""Load pricing data from cache or fetch from GitHub"""
-		# Try to find a valid cache file
-		cache_file = await self._find_valid_cache()
+		"""Load the cached pricing index (or the one bundled with the package), refreshing it in the background when it's old"""
+		index = PricingIndex.load(self._cache_dir / INDEX_FILENAME) or PricingIndex.load_snapshot()
+		if index is None:
+			logger.debug('No pricing data available until it is fetched, costs are not calculated')
+		self._pricing_data = index
 
-		if cache_file:
-			await self._load_from_cache(cache_file)
-		else:
-			await self._fetch_and_cache_pricing_data()
-
-	async def _find_valid_cache(self) -> Path | None:
-		"""Find the most recent valid cache file"""
-		try:
-			# Ensure cache directory exists
-			self._cache_dir.mkdir(parents=True, exist_ok=True)
-
-			# List all JSON files in the cache directory
-			cache_files = list(self._cache_dir.glob('*.json'))
-
-			if not cache_files:
-				return None
-
-			# Sort by modification time (most recent first)
-			cache_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-			# Check each file until we find a valid one
-			for cache_file in cache_files:
-				if await self._is_cache_valid(cache_file):
-					return cache_file
-				else:
-					# Clean up old cache files
-					try:
-						os.remove(cache_file)
-					except Exception:
-						pass
-
-			return None
-		except Exception:
-			return None
-
-	async def _is_cache_valid(self, cache_file: Path) -> bool:
-		"""Check if a specific cache file is valid and not expired"""
-		try:
-			if not cache_file.exists():
-				return False
-
-			# Read the cached data
-			async with aiofiles.open(cache_file, 'r') as f:
-				content = await f.read()
-				cached = CachedPricingData.model_validate_json(content)
-
-			# Check if cache is still valid
-			return datetime.now() - cached.timestamp < self.CACHE_DURATION
-		except Exception:
-			return False
-
-	async def _load_from_cache(self, cache_file: Path) -> None:
-		"""Load pricing data from a specific cache file"""
-		try:
-			async with aiofiles.open(cache_file, 'r') as f:
-				content = await f.read()
-				cached = CachedPricingData.model_validate_json(content)
-				self._pricing_data = cached.data
-		except Exception as e:
-			print(f'Error loading cached pricing data from {cache_file}: {e}')
-			# Fall back to fetching
-			await self._fetch_and_cache_pricing_data()
+		if CONFIG.BROWSER_USE_PRICING_REFRESH and (index is None or not index.is_fresh(self.CACHE_DURATION)):
+			self._refresh_task = asyncio.create_task(self._fetch_and_cache_pricing_data())
 
 	async def _fetch_and_cache_pricing_data(self) -> None:
-		"""Fetch pricing data from LiteLLM GitHub and cache it with timestamp"""
+		"""Fetch pricing data from LiteLLM GitHub and cache it as a compact index"""
 		try:
-			async with httpx.AsyncClient() as client:
-				response = await client.get(self.PRICING_URL, timeout=30)
-				response.raise_for_status()
-
-				self._pricing_data = response.json()
-
-			# Create cache object with timestamp
-			cached = CachedPricingData(timestamp=datetime.now(), data=self._pricing_data or {})
-
-			# Ensure cache directory exists
-			self._cache_dir.mkdir(parents=True, exist_ok=True)
-
-			# Create cache file with timestamp in filename
-			timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-			cache_file = self._cache_dir / f'pricing_{timestamp_str}.json'
-
-			async with aiofiles.open(cache_file, 'w') as f:
-				await f.write(cached.model_dump_json(indent=2))
-
+			response = await get_http_client().get(self.PRICING_URL, timeout=30)
+			response.raise_for_status()
+			index = PricingIndex.from_litellm(response.json())
+			index.save(self._cache_dir / INDEX_FILENAME)
+			self._pricing_data = index
 		except Exception as e:
-			print(f'Error fetching pricing data: {e}')
-			# Fall back to empty pricing data
-			self._pricing_data = {}
+			# e.g. no network access, the bundled or previously cached prices stay in use
+			logger.debug(f'Error fetching pricing data: {type(e).__name__}: {e}')
+			if self._pricing_data is None:
+				self._pricing_data = PricingIndex.load_snapshot()
 
 	async def get_model_pricing(self, model_name: str) -> ModelPricing | None:
 		"""Get pricing information for a specific model"""
@@ -167,26 +156,44 @@ class TokenCost:
 		if not self._initialized:
 			await self.initialize()
 
+		return self._get_model_pricing(model_name)
+
+	def _get_model_pricing(self, model_name: str) -> ModelPricing | None:
+		if model_name in self._pricing_cache:
+			return self._pricing_cache[model_name]
+
 		if not self._pricing_data or model_name not in self._pricing_data:
+			pricing = None
+		else:
+			data = self._pricing_data[model_name]
+			pricing = ModelPricing(
+				model=model_name,
+				input_cost_per_token=data.get('input_cost_per_token'),
+				output_cost_per_token=data.get('output_cost_per_token'),
+				max_tokens=data.get('max_tokens'),
+				max_input_tokens=data.get('max_input_tokens'),
+				max_output_tokens=data.get('max_output_tokens'),
+				cache_read_input_token_cost=data.get('cache_read_input_token_cost'),
+				cache_creation_input_token_cost=data.get('cache_creation_input_token_cost'),
+			)
+		if self._pricing_data is not None:
+			self._pricing_cache[model_name] = pricing
+		return pricing
+
+	async def calculate_cost(self, model: str, usage: ChatInvokeUsage) -> TokenCostCalculated | None:
+		if not self.include_cost:
 			return None
 
-		data = self._pricing_data[model_name]
-		return ModelPricing(
-			model=model_name,
-			input_cost_per_token=data.get('input_cost_per_token'),
-			output_cost_per_token=data.get('output_cost_per_token'),
-			max_tokens=data.get('max_tokens'),
-			max_input_tokens=data.get('max_input_tokens'),
-			max_output_tokens=data.get('max_output_tokens'),
-			cache_read_input_token_cost=data.get('cache_read_input_token_cost'),
-			cache_creation_input_token_cost=data.get('cache_creation_input_token_cost'),
-		)
+		if not self._initialized:
+			await self.initialize()
 
-	async def calculate_cost(self, model: str, usage: ChatInvokeUsage) -> TokenCostCalculated | None:
+		return self._calculate_cost(model, usage)
+
+	def _calculate_cost(self, model: str, usage: ChatInvokeUsage) -> TokenCostCalculated | None:
 		if not self.include_cost:
 			return None
 
-		data = await self.get_model_pricing(model)
+		data = self._get_model_pricing(model)
 		if data is None:
 			return None
 
@@ -211,7 +218,7 @@ class TokenCost:
 		)
 
 	def add_usage(self, model: str, usage: ChatInvokeUsage) -> TokenUsageEntry:
-		"""Add token usage entry to history (without calculating cost)"""
+		"""Add token usage entry to history and the running totals (costs are added once the pricing is loaded)"""
 		entry = TokenUsageEntry(
 			model=model,
 			timestamp=datetime.now(),
@@ -220,8 +227,43 @@ class TokenCost:
 
 		self.usage_history.append(entry)
 
+		bucket = self._buckets.setdefault(self._bucket_key(entry.timestamp), _UsageBucket())
+		bucket.entries.append(entry)
+		model_totals = self._totals.setdefault(model, _UsageTotals())
+		bucket_totals = bucket.by_model.setdefault(model, _UsageTotals())
+		model_totals.add_tokens(usage)
+		bucket_totals.add_tokens(usage)
+
+		if self.include_cost and self._pricing_data is None:
+			self._unpriced.append(entry)
+		else:
+			cost = self._calculate_cost(model, usage)
+			model_totals.add_cost(cost)
+			bucket_totals.add_cost(cost)
+
 		return entry
 
+	def _bucket_key(self, timestamp: datetime) -> int:
+		return int(timestamp.timestamp()) // self.BUCKET_SECONDS
+
+	def _iter_totals(self) -> Iterator[_UsageTotals]:
+		yield from self._totals.values()
+		for bucket in self._buckets.values():
+			yield from bucket.by_model.values()
+
+	async def _price_pending_usage(self) -> None:
+		"""Add the costs of the entries that were added before the pricing data was available"""
+		if not self.include_cost or not self._unpriced:
+			return
+		if not self._initialized:
+			await self.initialize()
+
+		unpriced, self._unpriced = self._unpriced, []
+		for entry in unpriced:
+			cost = self._calculate_cost(entry.model, entry.usage)
+			self._totals[entry.model].add_cost(cost)
+			self._buckets[self._bucket_key(entry.timestamp)].by_model[entry.model].add_cost(cost)
+
 	# async def _log_non_usage_llm(self, llm: BaseChatModel) -> None:
 	# 	"""Log non-usage to the logger"""
 	# 	C_CYAN = '\033[96m'
@@ -234,15 +276,16 @@ class TokenCost:
 		if not self._initialized:
 			await self.initialize()
 
+		self._log_usage_entry(model, usage)
+
+	def _log_usage_entry(self, model: str, usage: TokenUsageEntry) -> None:
 		# ANSI color codes
 		C_CYAN = '\033[96m'
-		C_YELLOW = '\033[93m'
 		C_GREEN = '\033[92m'
-		C_BLUE = '\033[94m'
 		C_RESET = '\033[0m'
 
 		# Always get cost breakdown for token details (even if not showing costs)
-		cost = await self.calculate_cost(model, usage.usage)
+		cost = self._calculate_cost(model, usage.usage)
 
 		# Build input tokens breakdown
 		input_part = self._build_input_tokens_display(usage.usage, cost)
@@ -321,111 +364,116 @@ class TokenCost:
 		# Store reference to self for use in the closure
 		token_cost_service = self
 
-		# Create a wrapped version that tracks usage
-		async def tracked_ainvoke(messages, output_format=None):
-			# Call the original method
-			result = await original_ainvoke(messages, output_format)
-
+		def track_usage(result: ChatInvokeCompletion) -> None:
 			# Track usage if available (no await needed since add_usage is now sync)
 			if result.usage:
 				usage = token_cost_service.add_usage(llm.model, result.usage)
 
 				logger.debug(f'Token cost service: {usage}')
 
-				asyncio.create_task(token_cost_service._log_usage(llm.model, usage))
+				if token_cost_service._initialized:
+					token_cost_service._log_usage_entry(llm.model, usage)
+				else:
+					# the pricing data is loaded on first use, don't hold up the LLM call for it
+					task = asyncio.create_task(token_cost_service._log_usage(llm.model, usage))
+					token_cost_service._log_tasks.add(task)
+					task.add_done_callback(token_cost_service._log_tasks.discard)
 
 			# else:
 			# 	await token_cost_service._log_non_usage_llm(llm)
 
+		# Create a wrapped version that tracks usage
+		async def tracked_ainvoke(messages, output_format=None):
+			# Call the original method
+			result = await original_ainvoke(messages, output_format)
+			track_usage(result)
 			return result
 
 		# Replace the method with our tracked version
 		# Using setattr to avoid type checking issues with overloaded methods
 		setattr(llm, 'ainvoke', tracked_ainvoke)
 
+		# Streaming implementations don't go through ainvoke(), the default one does and is already tracked
+		if getattr(type(llm), 'ainvoke_streaming', BaseChatModel.ainvoke_streaming) is not BaseChatModel.ainvoke_streaming:
+			original_ainvoke_streaming = llm.ainvoke_streaming
+
+			async def tracked_ainvoke_streaming(messages, output_format, on_delta):
+				result = await original_ainvoke_streaming(messages, output_format, on_delta)
+				track_usage(result)
+				return result
+
+			setattr(llm, 'ainvoke_streaming', tracked_ainvoke_streaming)
+
 		return llm
 
 	def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
 		"""Get usage tokens for a specific model"""
-		filtered_usage = [u for u in self.usage_history if u.model == model]
+		totals = self._totals.get(model, _UsageTotals())
 
 		return ModelUsageTokens(
 			model=model,
-			prompt_tokens=sum(u.usage.prompt_tokens for u in filtered_usage),
-			prompt_cached_tokens=sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage),
-			completion_tokens=sum(u.usage.completion_tokens for u in filtered_usage),
-			total_tokens=sum(u.usage.prompt_tokens + u.usage.completion_tokens for u in filtered_usage),
+			prompt_tokens=totals.prompt_tokens,
+			prompt_cached_tokens=totals.prompt_cached_tokens,
+			completion_tokens=totals.completion_tokens,
+			total_tokens=totals.prompt_tokens + totals.completion_tokens,
 		)
 
+	def _get_totals_since(self, since: datetime) -> dict[str, _UsageTotals]:
+		"""Totals per model of the entries at or after since, from the rollups of the buckets that started after it"""
+		since_key = self._bucket_key(since)
+		totals: dict[str, _UsageTotals] = {}
+		for key, bucket in self._buckets.items():
+			if key > since_key:
+				for model, bucket_totals in bucket.by_model.items():
+					model_totals = totals.setdefault(model, _UsageTotals())
+					for name, value in vars(bucket_totals).items():
+						setattr(model_totals, name, getattr(model_totals, name) + value)
+			elif key == since_key:
+				# the bucket since falls into is only partially included
+				for entry in bucket.entries:
+					if entry.timestamp >= since:
+						model_totals = totals.setdefault(entry.model, _UsageTotals())
+						model_totals.add_tokens(entry.usage)
+						model_totals.add_cost(self._calculate_cost(entry.model, entry.usage))
+		return totals
+
 	async def get_usage_summary(self, model: str | None = None, since: datetime | None = None) -> UsageSummary:
-		"""Get summary of token usage and costs (costs calculated on-the-fly)"""
-		filtered_usage = self.usage_history
+		"""Get summary of token usage and costs, from the running totals"""
+		await self._price_pending_usage()
 
+		totals = self._get_totals_since(since) if since else self._totals
 		if model:
-			filtered_usage = [u for u in filtered_usage if u.model == model]
-
-		if since:
-			filtered_usage = [u for u in filtered_usage if u.timestamp >= since]
-
-		if not filtered_usage:
-			return UsageSummary(
-				total_prompt_tokens=0,
-				total_prompt_cost=0.0,
-				total_prompt_cached_tokens=0,
-				total_prompt_cached_cost=0.0,
-				total_completion_tokens=0,
-				total_completion_cost=0.0,
-				total_tokens=0,
-				total_cost=0.0,
-				entry_count=0,
-			)
-
-		# Calculate totals
-		total_prompt = sum(u.usage.prompt_tokens for u in filtered_usage)
-		total_completion = sum(u.usage.completion_tokens for u in filtered_usage)
-		total_tokens = total_prompt + total_completion
-		total_prompt_cached = sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage)
-		models = list({u.model for u in filtered_usage})
+			totals = {model: totals[model]} if model in totals else {}
 
-		# Calculate per-model stats with record-by-record cost calculation
 		model_stats: dict[str, ModelUsageStats] = {}
-		total_prompt_cost = 0.0
-		total_completion_cost = 0.0
-		total_prompt_cached_cost = 0.0
-
-		for entry in filtered_usage:
-			if entry.model not in model_stats:
-				model_stats[entry.model] = ModelUsageStats(model=entry.model)
-
-			stats = model_stats[entry.model]
-			stats.prompt_tokens += entry.usage.prompt_tokens
-			stats.completion_tokens += entry.usage.completion_tokens
-			stats.total_tokens += entry.usage.prompt_tokens + entry.usage.completion_tokens
-			stats.invocations += 1
+		for model_name, model_totals in totals.items():
+			total_tokens = model_totals.prompt_tokens + model_totals.completion_tokens
+			model_stats[model_name] = ModelUsageStats(
+				model=model_name,
+				prompt_tokens=model_totals.prompt_tokens,
+				completion_tokens=model_totals.completion_tokens,
+				total_tokens=total_tokens,
+				cost=model_totals.prompt_cost + model_totals.completion_cost,
+				invocations=model_totals.invocations,
+				average_tokens_per_invocation=total_tokens / model_totals.invocations if model_totals.invocations else 0.0,
+			)
 
-			if self.include_cost:
-				# Calculate cost record by record using the updated calculate_cost function
-				cost = await self.calculate_cost(entry.model, entry.usage)
-				if cost:
-					total_prompt_cost += cost.prompt_cost
-					total_completion_cost += cost.completion_cost
-					total_prompt_cached_cost += cost.prompt_read_cached_cost or 0
-
-		# Calculate averages
-		for stats in model_stats.values():
-			if stats.invocations > 0:
-				stats.average_tokens_per_invocation = stats.total_tokens / stats.invocations
+		total_prompt = sum(t.prompt_tokens for t in totals.values())
+		total_completion = sum(t.completion_tokens for t in totals.values())
+		total_prompt_cost = sum(t.prompt_cost for t in totals.values())
+		total_completion_cost = sum(t.completion_cost for t in totals.values())
+		total_prompt_cached_cost = sum(t.prompt_cached_cost for t in totals.values())
 
 		return UsageSummary(
 			total_prompt_tokens=total_prompt,
 			total_prompt_cost=total_prompt_cost,
-			total_prompt_cached_tokens=total_prompt_cached,
+			total_prompt_cached_tokens=sum(t.prompt_cached_tokens for t in totals.values()),
 			total_prompt_cached_cost=total_prompt_cached_cost,
 			total_completion_tokens=total_completion,
 			total_completion_cost=total_completion_cost,
-			total_tokens=total_tokens,
+			total_tokens=total_prompt + total_completion,
 			total_cost=total_prompt_cost + total_completion_cost + total_prompt_cached_cost,
-			entry_count=len(filtered_usage),
+			entry_count=sum(t.invocations for t in totals.values()),
 			by_model=model_stats,
 		)
 
@@ -491,19 +539,9 @@ class TokenCost:
 
 			# Format cost display (only if cost tracking is enabled)
 			if self.include_cost:
-				# Calculate per-model costs on-the-fly
-				total_model_cost = 0.0
-				model_prompt_cost = 0.0
-				model_completion_cost = 0.0
-
-				# Calculate costs for this model
-				for entry in self.usage_history:
-					if entry.model == model:
-						cost = await self.calculate_cost(entry.model, entry.usage)
-						if cost:
-							model_prompt_cost += cost.prompt_cost
-							model_completion_cost += cost.completion_cost
-
+				model_totals = self._totals[model]
+				model_prompt_cost = model_totals.prompt_cost
+				model_completion_cost = model_totals.completion_cost
 				total_model_cost = model_prompt_cost + model_completion_cost
 
 				if total_model_cost > 0:
@@ -533,30 +571,31 @@ class TokenCost:
 	def clear_history(self) -> None:
 		"""Clear usage history"""
 		self.usage_history = []
+		self._totals = {}
+		self._buckets = {}
+		self._unpriced = []
 
 	async def refresh_pricing_data(self) -> None:
 		"""Force refresh of pricing data from GitHub"""
 		if self.include_cost:
 			await self._fetch_and_cache_pricing_data()
+			self._initialized = True
 
 	async def clean_old_caches(self, keep_count: int = 3) -> None:
-		"""Clean up old cache files, keeping only the most recent ones"""
-		try:
-			# List all JSON files in the cache directory
-			cache_files = list(self._cache_dir.glob('*.json'))
-
-			if len(cache_files) <= keep_count:
-				return
-
-			# Sort by modification time (oldest first)
-			cache_files.sort(key=lambda f: f.stat().st_mtime)
+		"""
+		Clean up old cache files.
 
-			# Remove all but the most recent files
-			for cache_file in cache_files[:-keep_count]:
-				try:
-					os.remove(cache_file)
-				except Exception:
-					pass
+		The pricing index is a single file that is replaced in place, so everything else in the cache dir (the
+		timestamped JSON caches of older versions, temp files of interrupted saves) is removed. keep_count is
+		only accepted for backwards compatibility.
+		"""
+		try:
+			for cache_file in self._cache_dir.glob('*'):
+				if cache_file.is_file() and cache_file.name != INDEX_FILENAME:
+					try:
+						os.remove(cache_file)
+					except Exception:
+						pass
 		except Exception as e:
 			print(f'Error cleaning old cache files: {e}')
 
@@ -0,0 +1,116 @@
+"""
+Benchmark how long a freshly spawned chrome takes until its CDP port can be connected to.
+
+Compares the old readiness wait of BrowserSession (sleep 2s, then GET /json/version once a second) with watching
+the DevToolsActivePort file that chrome writes to its user_data_dir as soon as the CDP server is listening,
+and with a full BrowserSession.start() + stop() that uses the latter.
+
+	python examples/browser/startup_benchmark.py [runs]
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx
+
+from browser_use import BrowserProfile, BrowserSession
+from browser_use.browser.types import async_playwright
+from browser_use.browser.utils import read_devtools_active_port
+
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+
+async def spawn_chrome(executable_path: str, user_data_dir: str) -> tuple[asyncio.subprocess.Process, int]:
+	with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+		s.bind(('127.0.0.1', 0))
+		debug_port = s.getsockname()[1]
+	args = BrowserProfile(headless=True).get_args()
+	args = [arg for arg in args if not arg.startswith('--remote-debugging-port=')]
+	process = await asyncio.create_subprocess_exec(
+		executable_path,
+		*args,
+		f'--remote-debugging-port={debug_port}',
+		f'--user-data-dir={user_data_dir}',
+		stdout=asyncio.subprocess.DEVNULL,
+		stderr=asyncio.subprocess.DEVNULL,
+	)
+	return process, debug_port
+
+
+async def wait_legacy(debug_port: int) -> None:
+	"""The readiness wait BrowserSession used before: sleep 2s, then poll /json/version once a second"""
+	await asyncio.sleep(2)
+	async with httpx.AsyncClient() as client:
+		for _ in range(30):
+			try:
+				response = await client.get(f'http://127.0.0.1:{debug_port}/json/version', timeout=1.0)
+				if response.status_code == 200:
+					return
+			except (httpx.ConnectError, httpx.TimeoutException):
+				await asyncio.sleep(1)
+	raise TimeoutError('CDP port did not become available')
+
+
+async def wait_devtools_active_port(user_data_dir: str, debug_port: int) -> None:
+	"""The readiness wait BrowserSession uses now for the browsers it spawns"""
+	for _ in range(30 * 50):
+		if read_devtools_active_port(user_data_dir) == debug_port:
+			return
+		await asyncio.sleep(0.02)
+	raise TimeoutError('DevToolsActivePort was not written')
+
+
+async def time_wait(executable_path: str, legacy: bool) -> float:
+	user_data_dir = tempfile.mkdtemp(prefix='browseruse-tmp-benchmark-')
+	start = time.perf_counter()
+	process, debug_port = await spawn_chrome(executable_path, user_data_dir)
+	try:
+		if legacy:
+			await wait_legacy(debug_port)
+		else:
+			await wait_devtools_active_port(user_data_dir, debug_port)
+		return time.perf_counter() - start
+	finally:
+		process.kill()
+		await process.wait()
+		shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
+async def time_session_start() -> float:
+	browser_session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None))
+	start = time.perf_counter()
+	await browser_session.start()
+	duration = time.perf_counter() - start
+	await browser_session.kill()
+	return duration
+
+
+def summarize(label: str, durations: list[float]) -> None:
+	durations = sorted(durations)
+	print(f'{label:<32} min {durations[0]:6.2f}s  median {durations[len(durations) // 2]:6.2f}s  max {durations[-1]:6.2f}s')
+
+
+async def main():
+	playwright = await async_playwright().start()
+	executable_path = playwright.chromium.executable_path
+	await playwright.stop()
+
+	legacy = [await time_wait(executable_path, legacy=True) for _ in range(RUNS)]
+	devtools_active_port = [await time_wait(executable_path, legacy=False) for _ in range(RUNS)]
+	session_start = [await time_session_start() for _ in range(RUNS)]
+
+	print(f'time until the CDP port of a new chrome is ready ({RUNS} runs):')
+	summarize('sleep(2) + poll every 1s', legacy)
+	summarize('DevToolsActivePort file', devtools_active_port)
+	summarize('BrowserSession.start() total', session_start)
+
+
+if __name__ == '__main__':
+	asyncio.run(main())
@@ -0,0 +1,89 @@
+"""Tests for saving/loading AgentHistoryList with content-addressed screenshot blobs."""
+
+import base64
+import json
+
+from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList
+from browser_use.browser.screenshot_store import ScreenshotBlob
+from browser_use.browser.views import BrowserStateHistory
+
+SCREENSHOT_A = base64.b64encode(b'\x89PNG\r\n\x1a\n first page').decode()
+SCREENSHOT_B = base64.b64encode(b'\x89PNG\r\n\x1a\n second page').decode()
+
+
+def _history(*screenshots: str | None) -> AgentHistoryList:
+	return AgentHistoryList(
+		history=[
+			AgentHistory(
+				model_output=None,
+				result=[ActionResult(extracted_content=f'step {i}')],
+				state=BrowserStateHistory(
+					url=f'https://example.com/{i}', title='Example', tabs=[], interacted_element=[None], screenshot=screenshot
+				),
+			)
+			for i, screenshot in enumerate(screenshots)
+		]
+	)
+
+
+def test_identical_screenshots_share_one_blob():
+	history = _history(SCREENSHOT_A, SCREENSHOT_A, SCREENSHOT_B)
+
+	blobs = [h.state.screenshot_blob for h in history.history]
+	assert blobs[0] is blobs[1] is ScreenshotBlob.from_base64(SCREENSHOT_A)
+	assert blobs[2] is not blobs[0]
+	assert history.screenshots() == [SCREENSHOT_A, SCREENSHOT_A, SCREENSHOT_B]
+
+
+def test_save_writes_deduplicated_blobs_and_load_is_lazy(tmp_path):
+	filepath = tmp_path / 'run' / 'history.json'
+	_history(SCREENSHOT_A, None, SCREENSHOT_A, SCREENSHOT_B).save_to_file(filepath)
+
+	data = json.loads(filepath.read_text())
+	states = [h['state'] for h in data['history']]
+	assert all(state['screenshot'] is None for state in states)
+	assert states[0]['screenshot_path'] == states[2]['screenshot_path']
+	assert 'screenshot_path' not in states[1]
+	assert len(list((filepath.parent / 'history_screenshots').iterdir())) == 2
+
+	# drop the in-memory blobs so loading has to go to disk
+	ScreenshotBlob._interned.clear()
+	loaded = AgentHistoryList.load_from_file(filepath, AgentHistory)  # type: ignore[arg-type]
+	blob = loaded.history[0].state.screenshot_blob
+	assert blob is not None and blob.path is not None and blob._data is None
+	assert loaded.screenshots() == [SCREENSHOT_A, None, SCREENSHOT_A, SCREENSHOT_B]
+	assert loaded.final_result() == 'step 3'
+
+	# saving a loaded history again reuses the existing blob files
+	loaded.save_to_file(filepath)
+	assert json.loads(filepath.read_text()) == data
+
+
+def test_load_inline_screenshots_from_older_files(tmp_path):
+	filepath = tmp_path / 'history.json'
+	filepath.write_text(json.dumps(_history(SCREENSHOT_A).model_dump()))
+
+	loaded = AgentHistoryList.load_from_file(filepath, AgentHistory)  # type: ignore[arg-type]
+	assert loaded.screenshots() == [SCREENSHOT_A]
+
+
+def test_missing_screenshot_files_load_as_none(tmp_path):
+	filepath = tmp_path / 'history.json'
+	_history(SCREENSHOT_A, SCREENSHOT_B).save_to_file(filepath)
+	ScreenshotBlob._interned.clear()
+	loaded = AgentHistoryList.load_from_file(filepath, AgentHistory)  # type: ignore[arg-type]
+
+	# a blob deleted after loading reads as a missing screenshot instead of raising
+	blob = loaded.history[1].state.screenshot_blob
+	assert blob is not None and blob.path is not None
+	blob.path.unlink()
+	assert loaded.screenshots() == [SCREENSHOT_A, None]
+
+	# the history file copied without its screenshots dir
+	for screenshot_file in (tmp_path / 'history_screenshots').iterdir():
+		screenshot_file.unlink()
+	(tmp_path / 'history_screenshots').rmdir()
+	ScreenshotBlob._interned.clear()
+	loaded = AgentHistoryList.load_from_file(filepath, AgentHistory)  # type: ignore[arg-type]
+	assert loaded.screenshots() == [None, None]
+	assert loaded.history[0].state.screenshot_blob is None
@@ -7,6 +7,7 @@ from browser_use.controller.registry.service import Registry
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm import SystemMessage, UserMessage
 from browser_use.llm.messages import ContentPartTextParam
+from browser_use.sensitive_data import get_sensitive_data_index
 from browser_use.utils import is_new_tab_page, match_url_with_domain_pattern
 
 
@@ -269,3 +270,31 @@ def test_is_new_tab_page():
 	assert is_new_tab_page('http://google.com') is False
 	assert is_new_tab_page('') is False
 	assert is_new_tab_page('chrome://settings') is False
+
+
+def test_sensitive_data_index():
+	"""Test that the index is built once per set of secrets and redacts and substitutes like the old per-call code"""
+	sensitive_data = {
+		'example.com': {'username': 'admin', 'password': 'admin123'},
+		'google.com': {'password': 'google_pass'},
+		'api_key': 'sk-1',
+	}
+	index = get_sensitive_data_index(sensitive_data, None)
+	assert get_sensitive_data_index(dict(sensitive_data), index) is index
+	assert get_sensitive_data_index({**sensitive_data, 'api_key': 'sk-2'}, index) is not index
+	# changes to the dict the index was built from are noticed
+	sensitive_data['google.com']['password'] = 'new_pass'
+	assert get_sensitive_data_index(sensitive_data, index) is not index
+	sensitive_data['google.com']['password'] = 'google_pass'
+
+	# values of all domains are redacted, a value that contains another one as a whole
+	assert (
+		index.redact('admin logged in with admin123, google_pass and sk-1')
+		== '<secret>username</secret> logged in with <secret>password</secret>, <secret>password</secret> and <secret>api_key</secret>'
+	)
+
+	assert index.secrets_for_url('https://example.com/login') == {'api_key': 'sk-1', 'username': 'admin', 'password': 'admin123'}
+	assert index.secrets_for_url('https://google.com') == {'api_key': 'sk-1', 'password': 'google_pass'}
+	assert index.secrets_for_url('about:blank') == {'api_key': 'sk-1'}
+	assert index.secrets_for_url(None) == {'api_key': 'sk-1'}
+	assert index.placeholders_for_url('https://example.com') == {'api_key', 'username', 'password'}
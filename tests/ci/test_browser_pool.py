@@ -0,0 +1,153 @@
+"""Tests for the BrowserPool that keeps started browsers warm and reuses them between tasks."""
+
+import asyncio
+
+import pytest
+
+from browser_use.browser.pool import BrowserPool
+from browser_use.browser.session import BrowserSession
+
+
+class FakeBrowserSession:
+	def __init__(self, number: int):
+		self.number = number
+		self.connected = True
+		self.killed = False
+		self.resets = 0
+		self.url = 'about:blank'
+
+	async def is_connected(self, restart: bool = True) -> bool:
+		return self.connected
+
+	async def reset(self, start_url=None):
+		self.resets += 1
+		self.url = start_url or 'about:blank'
+
+	async def kill(self):
+		self.killed = True
+
+
+@pytest.fixture
+def launched(monkeypatch):
+	"""Replace the browser launch of BrowserPool with fake sessions, returns the list of launched sessions"""
+	sessions: list[FakeBrowserSession] = []
+
+	async def launch(self):
+		await asyncio.sleep(0.01)  # launching a browser takes a while
+		session = FakeBrowserSession(len(sessions))
+		sessions.append(session)
+		return session
+
+	monkeypatch.setattr(BrowserPool, '_launch', launch)
+	return sessions
+
+
+async def test_pool_reuses_released_browsers(launched):
+	async with BrowserPool(size=2) as pool:
+		assert len(launched) == 2
+
+		async with pool.session() as first:
+			assert first in launched
+		assert first.resets == 1 and not first.killed
+
+		async with pool.session() as second:
+			assert second is first
+			assert len(launched) == 2
+
+			# more sessions than size at once are launched on demand, and killed when they are given back
+			async with pool.session() as third, pool.session() as fourth:
+				assert len(launched) == 3
+				assert third is not second and fourth not in (second, third)
+		assert sum(session.killed for session in launched) == 1
+		assert len(pool._idle) == 2
+
+	assert all(session.killed for session in launched)
+
+
+async def test_pool_replaces_dead_browsers(launched):
+	async with BrowserPool(size=1, health_check_interval=3600) as pool:
+		(dead,) = launched
+		dead.connected = False
+
+		await pool.check_health()
+		assert dead.killed
+		await asyncio.sleep(0.05)
+		assert pool._idle == [launched[1]]
+
+		# acquire() skips browsers that died since the last health check
+		launched[1].connected = False
+		browser_session = await pool.acquire()
+		assert browser_session is launched[2]
+		assert launched[1].killed
+		await pool.release(browser_session)
+
+
+async def test_acquire_waits_for_a_launching_browser(launched):
+	pool = BrowserPool(size=1, health_check_interval=3600)
+	pool._fill()
+	browser_session = await pool.acquire()
+	assert browser_session is launched[0]
+	await pool.stop()
+	assert browser_session.killed
+
+
+async def test_released_browsers_wait_on_the_start_url(launched):
+	async with BrowserPool(size=1, health_check_interval=3600, start_url='https://example.com') as pool:
+		async with pool.session() as browser_session:
+			browser_session.url = 'https://other.example.com/checkout'
+		assert browser_session.url == 'https://example.com'
+
+
+class FakeRequest:
+	def __init__(self, url: str, navigation: bool = True):
+		self.url = url
+		self.navigation = navigation
+
+	def is_navigation_request(self) -> bool:
+		return self.navigation
+
+
+def test_reset_knows_every_origin_loaded_since_the_last_one():
+	browser_session = BrowserSession()
+	for request in (
+		FakeRequest('https://shop.example.com/cart'),
+		FakeRequest('https://payments.example.net/iframe?id=1'),  # an iframe, not in any open tab at reset() time
+		FakeRequest('https://cdn.example.org/app.js', navigation=False),
+		FakeRequest('about:blank'),
+	):
+		browser_session._on_request(request)  # type: ignore[arg-type]
+
+	assert browser_session._visited_origins == {'https://shop.example.com', 'https://payments.example.net'}
+
+
+async def test_reset_forgets_the_downloads_still_being_saved():
+	browser_session = BrowserSession()
+	saving = asyncio.create_task(asyncio.sleep(3600))  # a download that won't finish in time
+	browser_session._download_tasks = [saving]
+	browser_session._pending_download_paths = {'/tmp/downloads/report.pdf'}
+	browser_session._downloaded_files = ['/tmp/downloads/invoice.pdf']
+
+	with pytest.MonkeyPatch.context() as monkeypatch:
+		monkeypatch.setattr('browser_use.browser.session.DOWNLOADS_FINISH_TIMEOUT', 0.01)
+		await browser_session._forget_downloads()
+
+	assert saving.cancelled()
+	assert browser_session._download_tasks == []
+	assert browser_session._pending_download_paths == set()
+	assert browser_session.downloaded_files == []
+
+
+async def test_reset_leaves_no_history_to_go_back_to(browser_session, httpserver):
+	httpserver.expect_request('/account').respond_with_data('<h1>Account of the last task</h1>', content_type='text/html')
+	httpserver.expect_request('/orders').respond_with_data('<h1>Orders of the last task</h1>', content_type='text/html')
+	await browser_session.navigate(httpserver.url_for('/account'))
+	await browser_session.navigate(httpserver.url_for('/orders'))
+
+	await browser_session.reset()
+
+	page = await browser_session.get_current_page()
+	assert page.url == 'about:blank'
+	assert await page.evaluate('history.length') == 1
+	await page.go_back()
+	assert page.url == 'about:blank'
+	assert len(browser_session.browser_context.pages) == 1
@@ -1,8 +1,10 @@
 """Test to verify download detection timing issue"""
 
+import asyncio
 import os
 import time
 
+import anyio
 import pytest
 
 from browser_use.browser import BrowserSession
@@ -166,3 +168,70 @@ async def test_actual_download_detection(test_server, tmp_path):
 	assert duration < 2.0, f'Download detection took {duration:.2f}s, expected <2s'
 
 	await browser_session.close()
+
+
+async def test_click_without_download_does_not_wait(test_server, tmp_path):
+	"""Test that clicks return right away when downloads_path is set, and downloads are tracked by the page listener."""
+
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(
+			headless=True,
+			downloads_path=str(tmp_path / 'downloads'),
+			user_data_dir=None,
+		)
+	)
+
+	await browser_session.start()
+	page = await browser_session.get_current_page()
+	await page.goto(test_server.url_for('/'))
+
+	state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+	button_node = next(elem for elem in state.selector_map.values() if elem.attributes.get('id') == 'test-button')
+
+	start_time = time.time()
+	result = await browser_session._click_element_node(button_node)
+	duration = time.time() - start_time
+
+	assert result is None
+	assert duration < 3, f'Expected click without download to take <3s, got {duration:.2f}s'
+
+	# downloads started outside of a click are saved too
+	await page.evaluate("""() => {
+		const link = document.createElement('a');
+		link.href = '/download/test.pdf';
+		link.download = 'test.pdf';
+		link.click();
+	}""")
+	for _ in range(50):
+		if browser_session.downloaded_files:
+			break
+		await asyncio.sleep(0.1)
+	assert len(browser_session.downloaded_files) == 1
+	assert await anyio.Path(browser_session.downloaded_files[0]).exists()
+
+	await browser_session.close()
+
+
+async def test_concurrent_downloads_get_unique_filenames(tmp_path):
+	"""Test that downloads with the same suggested filename that are saved at the same time don't overwrite each other."""
+
+	class SlowDownload:
+		suggested_filename = 'report.csv'
+
+		async def save_as(self, path):
+			await asyncio.sleep(0.05)
+			await anyio.Path(path).write_text('data')
+
+	browser_session = BrowserSession(browser_profile=BrowserProfile(downloads_path=str(tmp_path), user_data_dir=None))
+	(tmp_path / 'report.csv').write_text('existing')
+
+	for _ in range(3):
+		browser_session._on_download(SlowDownload())  # type: ignore[arg-type]
+	await browser_session._wait_for_downloads(timeout=5)
+
+	assert sorted(os.path.basename(path) for path in browser_session.downloaded_files) == [
+		'report (1).csv',
+		'report (2).csv',
+		'report (3).csv',
+	]
+	assert (tmp_path / 'report.csv').read_text() == 'existing'
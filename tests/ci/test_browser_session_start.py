@@ -12,7 +12,9 @@ Tests cover:
 import asyncio
 import json
 import logging
+import sys
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -23,6 +25,7 @@ from browser_use.browser.profile import (
 	BrowserProfile,
 )
 from browser_use.browser.session import BrowserSession
+from browser_use.browser.utils import DEVTOOLS_ACTIVE_PORT_FILE, read_devtools_active_port
 from browser_use.config import CONFIG
 
 # Set up test logging
@@ -1017,3 +1020,54 @@ class TestBrowserSessionReusePatterns:
 		for i, result in enumerate(results):
 			if isinstance(result, Exception):
 				print(f'Warning: Browser session kill raised exception: {type(result).__name__}: {result}')
+
+
+class TestBrowserLaunchReadiness:
+	"""Tests for waiting until the CDP port of a spawned browser is ready."""
+
+	def test_read_devtools_active_port(self, tmp_path):
+		assert read_devtools_active_port(tmp_path) is None
+
+		# chrome has not finished writing the file yet
+		(tmp_path / DEVTOOLS_ACTIVE_PORT_FILE).write_text('9222')
+		assert read_devtools_active_port(tmp_path) is None
+
+		(tmp_path / DEVTOOLS_ACTIVE_PORT_FILE).write_text('9222\n/devtools/browser/387adf4c-243f-4051-a181-46798f4a46f4')
+		assert read_devtools_active_port(tmp_path) == 9222
+
+	async def test_spawned_browser_ready_when_devtools_active_port_is_written(self, tmp_path):
+		"""The wait for a browser we spawned ends as soon as it writes DevToolsActivePort, not after a fixed delay."""
+		debug_port = 9999
+		# stands in for chrome: a process with chrome's CLI args that writes DevToolsActivePort after a short startup
+		process = await asyncio.create_subprocess_exec(
+			sys.executable,
+			'-c',
+			'import sys, time; time.sleep(0.3); open(sys.argv[2], "w").write("9999\\n/devtools/browser/abc"); time.sleep(30)',
+			f'--remote-debugging-port={debug_port}',
+			str(tmp_path / DEVTOOLS_ACTIVE_PORT_FILE),
+			f'--user-data-dir={tmp_path}',
+		)
+		connected_to = []
+
+		class FakeChromium:
+			async def connect_over_cdp(self, cdp_url, **kwargs):
+				connected_to.append(cdp_url)
+				return None
+
+		class FakePlaywright:
+			chromium = FakeChromium()
+
+		browser_session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None))
+		browser_session._subprocess = process
+		browser_session.browser_pid = process.pid
+		browser_session.playwright = FakePlaywright()  # type: ignore[assignment]
+		try:
+			start = time.monotonic()
+			await browser_session.setup_browser_via_browser_pid()
+			duration = time.monotonic() - start
+		finally:
+			process.kill()
+			await process.wait()
+
+		assert connected_to == [f'http://127.0.0.1:{debug_port}/']
+		assert 0.3 <= duration < 1.5, f'Expected the wait to end right after the file was written, took {duration:.2f}s'
@@ -0,0 +1,142 @@
+"""Tests for the concurrent state capture pipeline of BrowserSession._get_updated_state()."""
+
+import asyncio
+import time
+
+import pytest
+
+from browser_use.browser import BrowserSession
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.views import PageInfo, TabInfo
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMElementNode, DOMState
+
+PROBE_DELAY = 0.2
+
+
+class FakePage:
+	url = 'https://example.com/'
+
+	async def evaluate(self, script):
+		return 1
+
+	async def title(self):
+		await asyncio.sleep(PROBE_DELAY)
+		return 'Example'
+
+
+def _page_info() -> PageInfo:
+	return PageInfo(
+		viewport_width=1280,
+		viewport_height=720,
+		page_width=1280,
+		page_height=2000,
+		scroll_x=0,
+		scroll_y=0,
+		pixels_above=0,
+		pixels_below=1280,
+		pixels_left=0,
+		pixels_right=0,
+	)
+
+
+def _patch_probes(
+	monkeypatch, page: FakePage, calls: list[str], failing: set[str] = set(), error: type[Exception] = RuntimeError
+):
+	async def probe(name, result):
+		calls.append(name)
+		await asyncio.sleep(PROBE_DELAY)
+		if name in failing:
+			raise error(f'{name} broke')
+		return result
+
+	async def get_clickable_elements(self, **kwargs):
+		tree = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+		button = DOMElementNode(tag_name='button', xpath='/body/button', attributes={}, children=[], is_visible=True, parent=tree)
+		button.highlight_index = 0
+		tree.children.append(button)
+		return await probe('dom', DOMState(element_tree=tree, selector_map={0: button}))
+
+	async def get_current_page(self):
+		return page
+
+	monkeypatch.setattr(BrowserSession, 'get_current_page', get_current_page)
+	monkeypatch.setattr(BrowserSession, 'remove_highlights', lambda self: probe('remove_highlights', None))
+	monkeypatch.setattr(BrowserSession, '_auto_download_pdf_if_needed', lambda self, page: probe('pdf_download', None))
+	monkeypatch.setattr(BrowserSession, 'take_screenshot', lambda self: probe('screenshot', 'iVBORw0KGgo='))
+	monkeypatch.setattr(
+		BrowserSession, 'get_tabs_info', lambda self: probe('tabs', [TabInfo(page_id=0, url=page.url, title='Example')])
+	)
+	monkeypatch.setattr(BrowserSession, 'get_page_info', lambda self, page: probe('page_info', _page_info()))
+	monkeypatch.setattr(BrowserSession, 'get_scroll_info', lambda self, page: probe('scroll_info', (0, 1280)))
+	monkeypatch.setattr(DomService, 'get_clickable_elements', get_clickable_elements)
+
+
+async def test_independent_probes_run_concurrently(monkeypatch):
+	page = FakePage()
+	calls = []
+	_patch_probes(monkeypatch, page, calls)
+	session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, headless=True))
+
+	start = time.perf_counter()
+	state = await session._get_updated_state()
+	elapsed = time.perf_counter() - start
+
+	# remove_highlights -> dom -> screenshot is the only sequential chain, everything else overlaps with it
+	assert elapsed < 5 * PROBE_DELAY
+	assert calls.index('remove_highlights') < calls.index('dom') < calls.index('screenshot')
+	assert state.title == 'Example'
+	assert state.screenshot == 'iVBORw0KGgo='
+	assert state.pixels_below == 1280
+	assert list(state.selector_map) == [0]
+	assert set(state.probe_timings) == {
+		'remove_highlights',
+		'dom',
+		'screenshot',
+		'pdf_download',
+		'tabs',
+		'page_info',
+		'scroll_info',
+		'title',
+	}
+	assert all(duration >= PROBE_DELAY * 0.9 for duration in state.probe_timings.values())
+
+
+async def test_failing_probes_fall_back_without_failing_the_state(monkeypatch):
+	page = FakePage()
+	calls = []
+	_patch_probes(monkeypatch, page, calls, failing={'tabs', 'screenshot', 'page_info'})
+	session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, headless=True))
+
+	state = await session._get_updated_state()
+
+	assert state.tabs == []
+	assert state.screenshot is None
+	assert state.page_info is None
+	assert list(state.selector_map) == [0]
+	assert state.browser_errors == []
+	assert state.pixels_below == 1280
+	assert state.title == 'Example'
+
+
+async def test_timed_out_dom_falls_back_to_minimal_state(monkeypatch):
+	page = FakePage()
+	calls = []
+	_patch_probes(monkeypatch, page, calls, failing={'dom'}, error=TimeoutError)
+	session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, headless=True))
+
+	state = await session._get_updated_state()
+
+	assert state.selector_map == {}
+	assert state.browser_errors  # the minimal DOM fallback is reported to the LLM
+
+
+async def test_failing_dom_is_raised(monkeypatch):
+	page = FakePage()
+	calls = []
+	_patch_probes(monkeypatch, page, calls, failing={'dom'})
+	session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, headless=True))
+
+	# only a timeout is reported as a slow page, other DOM errors are not hidden behind the minimal state
+	with pytest.raises(RuntimeError, match='dom broke'):
+		await session._get_updated_state()
@@ -0,0 +1,140 @@
+"""Tests for the per-page CDP session pool used by BrowserSession's CDP-based helpers."""
+
+import asyncio
+
+import pytest
+
+from browser_use.browser.cdp_pool import CDPSessionPool
+from browser_use.browser.session import BrowserSession
+
+
+class FakeCDPSession:
+	def __init__(self):
+		self.detached = False
+
+	async def detach(self):
+		self.detached = True
+
+
+class FakeContext:
+	def __init__(self):
+		self.attached: list[FakeCDPSession] = []
+		self.fail = False
+
+	async def new_cdp_session(self, page):
+		await asyncio.sleep(0.01)  # a round trip to the browser
+		if self.fail:
+			raise RuntimeError('Target page, context or browser has been closed')
+		session = FakeCDPSession()
+		self.attached.append(session)
+		return session
+
+
+class FakeBrowser(FakeContext):
+	async def new_browser_cdp_session(self):
+		return await self.new_cdp_session(None)
+
+
+class FakePage:
+	def __init__(self, context: FakeContext):
+		self.context = context
+		self.listeners: dict[str, list] = {}
+
+	def on(self, event, handler):
+		self.listeners.setdefault(event, []).append(handler)
+
+	def remove_listener(self, event, handler):
+		self.listeners[event].remove(handler)
+
+	def emit(self, event):
+		for handler in list(self.listeners.get(event, [])):
+			handler(self)
+
+
+async def test_sessions_are_reused_per_page():
+	context = FakeContext()
+	page, other_page = FakePage(context), FakePage(context)
+	pool = CDPSessionPool()
+
+	# concurrent callers share a single attach
+	first, second = await asyncio.gather(pool.get(page), pool.get(page))
+	assert first is second
+	assert await pool.get(page) is first
+	assert await pool.get(other_page) is not first
+	assert len(context.attached) == 2
+
+
+@pytest.mark.parametrize('event', ['close', 'crash'])
+async def test_session_is_dropped_with_its_page(event):
+	context = FakeContext()
+	page = FakePage(context)
+	pool = CDPSessionPool()
+
+	session = await pool.get(page)
+	page.emit(event)
+
+	assert page not in pool
+	assert all(not handlers for handlers in page.listeners.values())
+	assert await pool.get(page) is not session
+
+
+async def test_discard_detaches_and_failed_attach_is_retried():
+	context = FakeContext()
+	page = FakePage(context)
+	pool = CDPSessionPool()
+
+	session = await pool.get(page)
+	await pool.discard(page)
+	assert session.detached
+	assert page not in pool
+
+	context.fail = True
+	with pytest.raises(RuntimeError):
+		await pool.get(page)
+	assert page not in pool
+
+	context.fail = False
+	assert await pool.get(page) is not session
+
+
+async def test_close_detaches_everything():
+	context = FakeContext()
+	pages = [FakePage(context) for _ in range(3)]
+	pool = CDPSessionPool()
+	sessions = [await pool.get(page) for page in pages]
+
+	await pool.close()
+
+	assert len(pool) == 0
+	assert all(session.detached for session in sessions)
+
+
+async def test_browser_session_is_attached_once_and_detached_on_close():
+	browser = FakeBrowser()
+	pool = CDPSessionPool()
+
+	browser.fail = True
+	with pytest.raises(RuntimeError):
+		await pool.get_browser_session(browser)  # type: ignore[arg-type]
+
+	browser.fail = False
+	first, second = await asyncio.gather(pool.get_browser_session(browser), pool.get_browser_session(browser))  # type: ignore[arg-type]
+	assert first is second
+	assert len(browser.attached) == 1
+
+	await pool.close()
+	assert first.detached
+
+
+async def test_copies_of_a_browser_session_have_their_own_pool():
+	context = FakeContext()
+	page = FakePage(context)
+	browser_session = BrowserSession()
+	session = await browser_session._cdp_sessions.get(page)  # type: ignore[arg-type]
+
+	copy = browser_session.model_copy()
+	await copy._cdp_sessions.close()
+
+	assert copy._cdp_sessions is not browser_session._cdp_sessions
+	assert not session.detached
+	assert page in browser_session._cdp_sessions
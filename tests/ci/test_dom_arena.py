@@ -0,0 +1,152 @@
+"""Tests for the columnar DOMTreeArena and its node views."""
+
+import pytest
+
+from browser_use.dom.arena import DOMElementNodeView, DOMTextNodeView, DOMTreeArena
+from browser_use.dom.clickable_element_processor.service import ClickableElementProcessor
+from browser_use.dom.history_tree_processor.service import HistoryTreeProcessor
+from browser_use.dom.views import DOMElementNode, DOMTextNode
+
+# index.js output for:
+# <body><div><a href="/home" title="Home">Home</a><p>Intro <span>text</span></p></div><button aria-label="Send" type="submit">Send <b>now</b></button></body>
+EVAL_PAGE = {
+	'rootId': '9',
+	'map': {
+		'0': {'type': 'TEXT_NODE', 'text': 'Home', 'isVisible': True},
+		'1': {
+			'tagName': 'a',
+			'xpath': 'html/body/div/a',
+			'attributes': {'href': '/home', 'title': 'Home'},
+			'children': ['0'],
+			'isVisible': True,
+			'isTopElement': True,
+			'isInteractive': True,
+			'isInViewport': True,
+			'highlightIndex': 0,
+		},
+		'2': {'type': 'TEXT_NODE', 'text': 'Intro', 'isVisible': True},
+		'3': {'type': 'TEXT_NODE', 'text': 'text', 'isVisible': True},
+		'4': {
+			'tagName': 'span',
+			'xpath': 'html/body/div/p/span',
+			'attributes': {},
+			'children': ['3'],
+			'isVisible': True,
+			'isTopElement': True,
+		},
+		'5': {
+			'tagName': 'p',
+			'xpath': 'html/body/div/p',
+			'attributes': {},
+			'children': ['2', '4'],
+			'isVisible': True,
+			'isTopElement': True,
+		},
+		'6': {
+			'tagName': 'div',
+			'xpath': 'html/body/div',
+			'attributes': {},
+			'children': ['1', '5'],
+			'isVisible': True,
+			'isTopElement': True,
+		},
+		'7': {'type': 'TEXT_NODE', 'text': 'Send', 'isVisible': True},
+		'8': {
+			'tagName': 'button',
+			'xpath': 'html/body/button',
+			'attributes': {'aria-label': 'Send', 'type': 'submit'},
+			'children': ['7', '10'],
+			'isVisible': True,
+			'isTopElement': True,
+			'isInteractive': True,
+			'isInViewport': True,
+			'highlightIndex': 1,
+		},
+		'9': {'tagName': 'body', 'xpath': '/body', 'attributes': {}, 'children': ['6', '8']},
+		'10': {'type': 'TEXT_NODE', 'text': 'now', 'isVisible': True},
+	},
+}
+
+
+def _build_dataclass_tree() -> tuple[DOMElementNode, dict[int, DOMElementNode]]:
+	"""Build the same tree with regular DOMElementNode/DOMTextNode objects."""
+	nodes = {}
+	selector_map = {}
+	for js_id in sorted(EVAL_PAGE['map'], key=int):
+		node_data = EVAL_PAGE['map'][js_id]
+		if node_data.get('type') == 'TEXT_NODE':
+			nodes[js_id] = DOMTextNode(text=node_data['text'], is_visible=True, parent=None)
+			continue
+		node = DOMElementNode(
+			tag_name=node_data['tagName'],
+			xpath=node_data['xpath'],
+			attributes=node_data['attributes'],
+			children=[],
+			is_visible=node_data.get('isVisible', False),
+			is_top_element=node_data.get('isTopElement', False),
+			is_interactive=node_data.get('isInteractive', False),
+			is_in_viewport=node_data.get('isInViewport', False),
+			highlight_index=node_data.get('highlightIndex'),
+			parent=None,
+		)
+		nodes[js_id] = node
+		if node.highlight_index is not None:
+			selector_map[node.highlight_index] = node
+	for js_id, node in nodes.items():
+		if isinstance(node, DOMElementNode):
+			for child_id in EVAL_PAGE['map'][js_id]['children']:
+				nodes[child_id].parent = node
+				node.children.append(nodes[child_id])
+	return nodes['9'], selector_map
+
+
+def test_arena_layout_is_preorder():
+	arena = DOMTreeArena.from_eval_page(EVAL_PAGE)
+
+	assert len(arena) == 11
+	assert arena.root.tag_name == 'body'
+	assert arena.subtree_end[0] == len(arena)
+	assert [arena.node(i).tag_name for i in range(4) if isinstance(arena.node(i), DOMElementNode)] == ['body', 'div', 'a']
+	# repeated strings are only stored once
+	assert arena.strings.count('Send') == 1
+
+
+def test_views_expose_the_dom_element_node_api():
+	arena = DOMTreeArena.from_eval_page(EVAL_PAGE)
+	selector_map = arena.selector_map()
+	button = selector_map[1]
+
+	assert isinstance(button, DOMElementNodeView) and isinstance(button, DOMElementNode)
+	assert button.tag_name == 'button'
+	assert button.attributes == {'aria-label': 'Send', 'type': 'submit'}
+	assert button.parent is arena.root
+	assert all(isinstance(child, DOMTextNodeView) for child in button.children)
+	assert button.get_all_text_till_next_clickable_element() == 'Send\nnow'
+
+	button.is_new = True
+	assert selector_map[1].is_new is True
+	assert arena.selector_map()[1] is button  # views are cached per node
+
+	# views are read-only
+	assert isinstance(button.children, tuple)
+	with pytest.raises(AttributeError):
+		button.children.append(button)  # type: ignore[attr-defined]
+	with pytest.raises(AttributeError):
+		button.tag_name = 'a'  # type: ignore[misc]
+
+
+def test_arena_matches_dataclass_tree():
+	arena = DOMTreeArena.from_eval_page(EVAL_PAGE)
+	tree, selector_map = _build_dataclass_tree()
+
+	assert arena.clickable_elements_to_string() == tree.clickable_elements_to_string()
+	assert arena.root.clickable_elements_to_string() == tree.clickable_elements_to_string()
+	assert DOMTreeArena.from_element_tree(tree).clickable_elements_to_string() == tree.clickable_elements_to_string()
+
+	for highlight_index, view in arena.selector_map().items():
+		assert HistoryTreeProcessor._hash_dom_element(view) == HistoryTreeProcessor._hash_dom_element(
+			selector_map[highlight_index]
+		)
+	assert ClickableElementProcessor.get_clickable_elements_hashes(
+		arena.root
+	) == ClickableElementProcessor.get_clickable_elements_hashes(tree)
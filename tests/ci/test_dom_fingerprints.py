@@ -0,0 +1,108 @@
+"""Tests for the cached branch paths and element fingerprints used by the DOM tree processors."""
+
+import hashlib
+
+from browser_use.dom.clickable_element_processor.service import ClickableElementProcessor
+from browser_use.dom.history_tree_processor.service import HistoryTreeProcessor
+from browser_use.dom.history_tree_processor.view import DOMHistoryElement
+from browser_use.dom.views import DOMElementNode
+
+
+def _element(tag: str, parent: DOMElementNode | None, highlight_index: int | None = None, **attributes) -> DOMElementNode:
+	element = DOMElementNode(
+		tag_name=tag,
+		xpath=f'{parent.xpath}/{tag}' if parent else tag,
+		attributes=attributes,
+		children=[],
+		is_visible=True,
+		highlight_index=highlight_index,
+		parent=parent,
+	)
+	if parent is not None:
+		parent.children.append(element)
+	return element
+
+
+def _walk_up_branch_path(element: DOMElementNode) -> list[str]:
+	"""The branch path as it was computed before it was cached on the tree"""
+	path = []
+	while element.parent is not None:
+		path.append(element.tag_name)
+		element = element.parent
+	return path[::-1]
+
+
+def test_branch_path_matches_walking_up_to_the_root():
+	html = _element('html', None)
+	body = _element('body', html)
+	div = _element('div', body)
+	button = _element('button', div, highlight_index=0, type='submit')
+
+	assert html.branch_path == ''
+	assert button.branch_path == 'body/div/button'
+	for element in (html, body, div, button):
+		assert HistoryTreeProcessor._get_parent_branch_path(element) == _walk_up_branch_path(element)
+
+
+def test_hashed_dom_element_is_compatible_with_stored_histories():
+	html = _element('html', None)
+	form = _element('form', _element('body', html))
+	button = _element('button', form, highlight_index=0, type='submit', name='go')
+
+	expected_branch_path_hash = hashlib.sha256('body/form/button'.encode()).hexdigest()
+	assert button.hash.branch_path_hash == expected_branch_path_hash
+	assert button.hash.attributes_hash == hashlib.sha256('type=submitname=go'.encode()).hexdigest()
+
+	# a history element saved by an older version only stores the branch path as a list of tags
+	history_element = DOMHistoryElement(
+		tag_name='button',
+		xpath=button.xpath,
+		highlight_index=3,
+		entire_parent_branch_path=['body', 'form', 'button'],
+		attributes={'type': 'submit', 'name': 'go'},
+	)
+	assert HistoryTreeProcessor.compare_history_element_and_dom_element(history_element, button)
+	assert HistoryTreeProcessor.find_history_element_in_tree(history_element, html) is button
+
+
+def test_deep_tree_branch_path_does_not_recurse():
+	element = _element('html', None)
+	for _ in range(5_000):
+		element = _element('div', element)
+
+	assert element.branch_path == '/'.join(['div'] * 5_000)
+
+
+def test_moved_subtree_drops_cached_fingerprints():
+	html = _element('html', None)
+	body = _element('body', html)
+	nav = _element('nav', body)
+	main = _element('main', body)
+	link = _element('a', _element('li', nav), highlight_index=0, href='/')
+
+	old_hash = link.hash
+	assert link.branch_path == 'body/nav/li/a'
+
+	li = nav.children.pop()
+	assert isinstance(li, DOMElementNode)
+	li.invalidate_fingerprints()
+	li.parent = main
+	main.children.append(li)
+
+	assert link.branch_path == 'body/main/li/a'
+	assert link.hash != old_hash
+	assert nav.branch_path == 'body/nav'  # untouched elements keep their cache
+
+
+def test_clickable_element_hashes():
+	html = _element('html', None)
+	body = _element('body', html)
+	first = _element('a', body, highlight_index=1, href='/a')
+	second = _element('a', body, highlight_index=2, href='/b')
+
+	hashes = ClickableElementProcessor.get_clickable_elements_hashes(html)
+	assert hashes == {ClickableElementProcessor.hash_dom_element(first), ClickableElementProcessor.hash_dom_element(second)}
+	assert len(hashes) == 2
+
+	second.attributes['href'] = '/c'
+	assert ClickableElementProcessor.hash_dom_element(second) not in hashes
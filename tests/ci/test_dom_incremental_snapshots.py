@@ -0,0 +1,193 @@
+"""Tests for incremental DOM snapshots (BrowserProfile(incremental_dom_snapshots=True))."""
+
+import pytest
+
+from browser_use.browser import BrowserSession
+from browser_use.browser.profile import BrowserProfile
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMElementNode, DOMTextNode
+
+
+def _element(tag: str, children: list[str], highlight_index: int | None = None, **attributes) -> dict:
+	return {
+		'tagName': tag,
+		'xpath': f'html/body/{tag}',
+		'attributes': attributes,
+		'children': children,
+		'isVisible': True,
+		'isTopElement': True,
+		'isInteractive': highlight_index is not None,
+		'highlightIndex': highlight_index,
+	}
+
+
+def _text(text: str) -> dict:
+	return {'type': 'TEXT_NODE', 'text': text, 'isVisible': True}
+
+
+class TestApplyDomSnapshot:
+	"""Patching the previous tree with the diffs sent back by index.js"""
+
+	async def _full_snapshot(self, dom_service: DomService):
+		return await dom_service._apply_dom_snapshot(
+			{
+				'rootId': '0',
+				'snapshotId': 's:1',
+				'baseSnapshotId': None,
+				'unchanged': False,
+				'removed': [],
+				'map': {
+					'0': _element('body', ['1', '3']),
+					'1': _element('button', ['2'], highlight_index=0, id='ok'),
+					'2': _text('OK'),
+					'3': _element('div', ['4']),
+					'4': _text('Static text'),
+				},
+			}
+		)
+
+	async def test_full_snapshot_builds_tree(self):
+		dom_service = DomService(page=None)  # type: ignore
+		root, selector_map = await self._full_snapshot(dom_service)
+
+		assert root.tag_name == 'body'
+		assert [child.tag_name for child in root.children if isinstance(child, DOMElementNode)] == ['button', 'div']
+		assert selector_map[0].attributes == {'id': 'ok'}
+		assert selector_map[0].parent is root
+
+	async def test_unchanged_snapshot_reuses_tree(self):
+		dom_service = DomService(page=None)  # type: ignore
+		root, selector_map = await self._full_snapshot(dom_service)
+
+		new_root, new_selector_map = await dom_service._apply_dom_snapshot(
+			{'rootId': '0', 'snapshotId': 's:1', 'baseSnapshotId': 's:1', 'unchanged': True, 'removed': [], 'map': {}}
+		)
+
+		assert new_root is root
+		assert new_selector_map[0] is selector_map[0]
+		assert new_selector_map is not selector_map
+
+	async def test_diff_patches_changed_nodes_in_place(self):
+		dom_service = DomService(page=None)  # type: ignore
+		root, selector_map = await self._full_snapshot(dom_service)
+		static_div = root.children[1]
+
+		# the button text changed and a new link was appended to the body
+		new_root, new_selector_map = await dom_service._apply_dom_snapshot(
+			{
+				'rootId': '0',
+				'snapshotId': 's:2',
+				'baseSnapshotId': 's:1',
+				'unchanged': False,
+				'removed': ['2'],
+				'map': {
+					'0': _element('body', ['1', '3', '5']),
+					'1': _element('button', ['6'], highlight_index=0, id='ok'),
+					'5': _element('a', [], highlight_index=1, href='/next'),
+					'6': _text('Saved'),
+				},
+			}
+		)
+
+		assert new_root is not root  # body's children changed, so it was re-parsed
+		assert new_root.children[1] is static_div  # untouched subtree is kept as-is
+		assert static_div.parent is new_root
+		assert set(new_selector_map) == {0, 1}
+		assert new_selector_map[1].attributes == {'href': '/next'}
+		button_text = new_selector_map[0].children[0]
+		assert isinstance(button_text, DOMTextNode) and button_text.text == 'Saved'
+		assert button_text.parent is new_selector_map[0]
+
+		# the selector map handed out for the previous state is not affected by the patch
+		assert set(selector_map) == {0}
+
+	async def test_removed_interactive_node_leaves_selector_map(self):
+		dom_service = DomService(page=None)  # type: ignore
+		await self._full_snapshot(dom_service)
+
+		new_root, new_selector_map = await dom_service._apply_dom_snapshot(
+			{
+				'rootId': '0',
+				'snapshotId': 's:2',
+				'baseSnapshotId': 's:1',
+				'unchanged': False,
+				'removed': ['1', '2'],
+				'map': {'0': _element('body', ['3'])},
+			}
+		)
+
+		assert new_selector_map == {}
+		assert [child.tag_name for child in new_root.children if isinstance(child, DOMElementNode)] == ['div']
+
+	async def test_mismatched_base_snapshot_rebuilds_from_scratch(self):
+		dom_service = DomService(page=None)  # type: ignore
+		await self._full_snapshot(dom_service)
+
+		new_root, new_selector_map = await dom_service._apply_dom_snapshot(
+			{
+				'rootId': '10',
+				'snapshotId': 'other:1',
+				'baseSnapshotId': None,
+				'unchanged': False,
+				'removed': [],
+				'map': {'10': _element('body', ['11']), '11': _element('input', [], highlight_index=0, type='text')},
+			}
+		)
+
+		assert new_root.children[0].tag_name == 'input'  # type: ignore
+		assert dom_service._snapshot_node_map.keys() == {'10', '11'}
+		assert new_selector_map[0].attributes == {'type': 'text'}
+
+
+@pytest.fixture
+def httpserver(make_httpserver):
+	server = make_httpserver
+	server.expect_request('/').respond_with_data(
+		"""<html>
+		<head><title>Incremental</title></head>
+		<body>
+			<button id="toggle" onclick="document.getElementById('menu').innerHTML += '<a href=\\'#\\'>Item</a>'">Toggle</button>
+			<div id="menu"></div>
+			<p>Some static text</p>
+		</body>
+		</html>""",
+		content_type='text/html',
+	)
+	return server
+
+
+@pytest.fixture
+async def browser_session():
+	session = BrowserSession(
+		browser_profile=BrowserProfile(
+			user_data_dir=None,
+			headless=True,
+			incremental_dom_snapshots=True,
+		)
+	)
+	async with session:
+		yield session
+
+
+async def test_incremental_snapshots_match_full_snapshots(browser_session, httpserver):
+	"""Incremental snapshots should produce the same elements as a full extraction."""
+	page = await browser_session.get_current_page()
+	await page.goto(httpserver.url_for('/'))
+	await page.wait_for_load_state()
+
+	first = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+	second = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+	assert second.element_tree is first.element_tree  # nothing changed, the walk was skipped
+	assert second.selector_map.keys() == first.selector_map.keys()
+
+	await page.click('#toggle')
+	third = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+	full = await DomService(page).get_clickable_elements(
+		highlight_elements=False, viewport_expansion=browser_session.browser_profile.viewport_expansion
+	)
+
+	assert len(third.selector_map) == len(first.selector_map) + 1
+	assert {index: node.xpath for index, node in third.selector_map.items()} == {
+		index: node.xpath for index, node in full.selector_map.items()
+	}
+	assert third.element_tree.clickable_elements_to_string() == full.element_tree.clickable_elements_to_string()
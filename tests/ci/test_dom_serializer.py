@@ -0,0 +1,85 @@
+"""Tests for the iterative clickable_elements_to_string() serializer."""
+
+import types
+
+from browser_use.dom.views import DOMElementNode, DOMTextNode
+
+
+def _element(tag: str, parent: DOMElementNode | None, highlight_index: int | None = None, **attributes) -> DOMElementNode:
+	element = DOMElementNode(
+		tag_name=tag,
+		xpath=f'html/body/{tag}',
+		attributes=attributes,
+		children=[],
+		is_visible=True,
+		is_top_element=True,
+		is_interactive=highlight_index is not None,
+		highlight_index=highlight_index,
+		parent=parent,
+	)
+	if parent is not None:
+		parent.children.append(element)
+	return element
+
+
+def _text(text: str, parent: DOMElementNode) -> DOMTextNode:
+	node = DOMTextNode(text=text, is_visible=True, parent=parent)
+	parent.children.append(node)
+	return node
+
+
+def _build_page() -> DOMElementNode:
+	# <body>Intro<button aria-label="Save">Save <a>nested</a> more</button><div>Outro</div></body>
+	body = _element('body', None)
+	_text('Intro', body)
+	button = _element('button', body, highlight_index=0, **{'aria-label': 'Save', 'type': 'submit'})
+	_text('Save', button)
+	link = _element('a', button, highlight_index=1, href='/x')
+	_text('nested', link)
+	_text('more', button)
+	div = _element('div', body)
+	_text('Outro', div)
+	return body
+
+
+def test_clickable_elements_to_string_output():
+	body = _build_page()
+
+	assert body.clickable_elements_to_string() == '\n'.join(
+		[
+			'Intro',
+			'[0]<button aria-label=Save type=submit>Save\nmore />',
+			'\t[1]<a >nested />',
+			'Outro',
+		]
+	)
+
+
+def test_lines_are_streamed_in_document_order():
+	body = _build_page()
+	lines = body.iter_clickable_elements_lines()
+
+	assert isinstance(lines, types.GeneratorType)
+	assert next(lines) == 'Intro'  # yielded before the rest of the tree is walked
+	assert '\n'.join(['Intro', *lines]) == body.clickable_elements_to_string()
+
+
+def test_subtree_below_highlighted_ancestor_skips_text():
+	body = _build_page()
+	link = body.children[1].children[1]  # type: ignore
+
+	assert isinstance(link, DOMElementNode)
+	assert link.clickable_elements_to_string() == '[1]<a >nested />'
+	assert body.children[1].get_all_text_till_next_clickable_element() == 'Save\nmore'  # type: ignore
+
+
+def test_deep_tree_does_not_hit_recursion_limit():
+	body = _element('body', None)
+	parent = body
+	for _ in range(5_000):
+		parent = _element('div', parent)
+	_element('button', parent, highlight_index=0)
+	_text('deep text', parent.children[0])  # type: ignore
+
+	assert body.clickable_elements_to_string() == '[0]<button >deep text />'  # only highlighted elements indent
+	assert body.get_all_text_till_next_clickable_element() == ''
@@ -0,0 +1,81 @@
+"""Tests for the segmented, indexed event WAL written by the agent's event bus."""
+
+import json
+
+from bubus import BaseEvent, EventBus
+
+from browser_use.sync.wal import EventWAL, WALEventBus
+
+
+class StepEvent(BaseEvent):
+	user_id: str = 'temp-user'
+	step: int = 0
+	screenshot_url: str = ''
+
+
+async def test_segments_rotate_and_events_can_be_seeked(tmp_path):
+	wal = EventWAL(tmp_path / 'session.jsonl', max_segment_size=1000)
+	events = [StepEvent(step=i, screenshot_url='x' * 300) for i in range(10)]
+	for event in events:
+		await wal.append(event.event_id, event.event_type, event.model_dump_json())
+
+	segments = wal.segments()
+	assert segments[0] == tmp_path / 'session.jsonl'
+	assert segments[1] == tmp_path / 'session.1.jsonl'
+	assert len(segments) > 3
+	assert all(path.stat().st_size <= 1000 for path in segments)
+
+	assert [event['step'] for event in wal.iter_events()] == list(range(10))
+	assert [event['step'] for event in wal.iter_events(after_event_id=events[6].event_id)] == [7, 8, 9]
+	assert wal.read_event(events[4].event_id)['step'] == 4  # type: ignore[index]
+	assert [entry.event_type for entry in wal.read_index()] == ['StepEvent'] * 10
+
+	# a new writer (e.g. a resumed session) continues in the last segment
+	resumed = EventWAL(tmp_path / 'session.jsonl', max_segment_size=1000)
+	await resumed.append('last', 'StepEvent', StepEvent(step=10).model_dump_json())
+	assert len(resumed.segments()) == len(segments)
+	assert [event['step'] for event in resumed.iter_events(after_event_id=events[9].event_id)] == [10]
+
+
+async def test_metadata_updates_leave_the_log_untouched(tmp_path):
+	wal = EventWAL(tmp_path / 'session.jsonl')
+	for i in range(3):
+		event = StepEvent(step=i)
+		await wal.append(event.event_id, event.event_type, event.model_dump_json())
+	await wal.append('no-user', 'OtherEvent', json.dumps({'event_type': 'OtherEvent'}))
+	log = wal.path.read_bytes()
+
+	await wal.update_metadata(user_id='real-user', device_id='device-1')
+
+	assert wal.path.read_bytes() == log
+	events = list(wal.iter_events())
+	assert [event.get('user_id') for event in events] == ['real-user'] * 3 + [None]
+	assert {event['device_id'] for event in events} == {'device-1'}
+
+
+async def test_event_bus_writes_completed_events_to_the_wal(tmp_path):
+	bus = WALEventBus(name='WALTest', wal_path=tmp_path / 'session.jsonl')
+	bus.on('StepEvent', lambda event: 'handled')
+	event = await bus.dispatch(StepEvent(step=1))
+	await bus.stop(timeout=5.0)
+
+	assert bus.wal
+	logged = bus.wal.read_event(event.event_id)
+	assert logged and logged['step'] == 1
+
+
+async def test_event_bus_still_calls_the_wal_handler_hook(tmp_path, monkeypatch):
+	# WALEventBus overrides EventBus._default_wal_handler, a private hook of bubus, this fails if bubus stops calling it
+	assert '_default_wal_handler' in EventBus.__dict__
+	calls = []
+
+	async def record(self, event):
+		calls.append(event.event_id)
+
+	monkeypatch.setattr(WALEventBus, '_default_wal_handler', record)
+	bus = WALEventBus(name='WALHookTest', wal_path=tmp_path / 'session.jsonl')
+	event = await bus.dispatch(StepEvent(step=1))
+	await bus.stop(timeout=5.0)
+
+	assert calls == [event.event_id]
+	assert not (tmp_path / 'session.jsonl').exists()  # nothing else wrote the log behind the hook's back
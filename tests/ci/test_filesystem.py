@@ -555,6 +555,56 @@ class TestFileSystem:
 		assert state.extracted_content_count == 0
 		assert 'todo.md' in state.files
 
+	async def test_get_state_only_serializes_changed_files(self, temp_filesystem):
+		"""Test that state snapshots reuse the data of unchanged files."""
+		fs = temp_filesystem
+		await fs.write_file('results.md', '# Results')
+		await fs.write_file('notes.txt', 'notes')
+
+		state = fs.get_state()
+		assert fs.get_state() is state
+
+		await fs.append_file('results.md', '\n- first')
+		state2 = fs.get_state()
+
+		assert state2 is not state
+		assert state2.files['results.md']['data']['content'] == '# Results\n- first'
+		assert state2.files['notes.txt'] == state.files['notes.txt']
+
+		fs.get_file('todo.md').update_content('- [ ] Task')
+		assert fs.get_state().files['todo.md']['data']['content'] == '- [ ] Task'
+
+		await fs.save_extracted_content('page')
+		state3 = fs.get_state()
+		assert state3.extracted_content_count == 1
+		assert 'extracted_content_0.md' in state3.files
+
+	async def test_append_writes_only_the_new_content(self, temp_filesystem, monkeypatch):
+		"""Test that appends append to the file on disk instead of rewriting it."""
+		fs = temp_filesystem
+		await fs.write_file('data.csv', 'id,name')
+
+		rewrites = []
+		original_write_text = Path.write_text
+		monkeypatch.setattr(
+			Path, 'write_text', lambda self, *args, **kwargs: rewrites.append(self) or original_write_text(self, *args, **kwargs)
+		)
+
+		for i in range(3):
+			await fs.append_file('data.csv', f'\n{i},row {i}')
+		# writing or replacing without a change leaves the file alone
+		await fs.replace_file_str('data.csv', 'missing', 'other')
+
+		assert rewrites == []
+		assert (fs.data_dir / 'data.csv').read_text() == 'id,name\n0,row 0\n1,row 1\n2,row 2'
+
+		# after a change outside of the file system methods, the next append rewrites the file
+		fs.get_file('data.csv').update_content('id,name')
+		await fs.append_file('data.csv', '\n3,row 3')
+
+		assert rewrites == [fs.data_dir / 'data.csv']
+		assert (fs.data_dir / 'data.csv').read_text() == 'id,name\n3,row 3'
+
 	async def test_from_state(self, temp_filesystem):
 		"""Test restoring filesystem from state."""
 		fs = temp_filesystem
@@ -0,0 +1,133 @@
+"""Tests for the per-event-loop registry of shared HTTP/LLM clients."""
+
+import asyncio
+
+import httpx
+
+from browser_use.agent.service import Agent
+from browser_use.http_clients import (
+	aclose_shared_clients,
+	client_cache_key,
+	get_http_client,
+	get_shared_client,
+	release_shared_clients,
+	retain_shared_clients,
+)
+from browser_use.llm.anthropic.chat import ChatAnthropic
+from browser_use.llm.openai.chat import ChatOpenAI
+from tests.ci.conftest import create_mock_llm
+
+
+async def test_clients_are_shared_within_an_event_loop():
+	client = get_http_client()
+	assert get_http_client() is client
+	assert not client.is_closed
+
+	# a closed client is replaced instead of handed out again
+	await client.aclose()
+	replacement = get_http_client()
+	assert replacement is not client
+
+	await aclose_shared_clients()
+	assert replacement.is_closed
+	assert get_http_client() is not replacement
+	await aclose_shared_clients()
+
+
+async def test_clients_are_closed_when_the_last_user_releases_them():
+	# e.g. two agents running concurrently in the same event loop
+	retain_shared_clients()
+	retain_shared_clients()
+	client = get_http_client()
+
+	await release_shared_clients()
+	assert not client.is_closed  # the other agent is still using it
+	assert get_http_client() is client
+
+	await release_shared_clients()
+	assert client.is_closed
+
+
+def test_clients_are_not_shared_between_event_loops():
+	async def get_client():
+		return get_http_client()
+
+	first = asyncio.run(get_client())
+	second = asyncio.run(get_client())
+	assert first is not second
+
+	# outside of an event loop, every call gets its own client
+	assert get_shared_client('outside', object) is not get_shared_client('outside', object)
+
+
+class Credentials:
+	"""Unhashable, like most credential objects passed to the SDK clients"""
+
+	def __eq__(self, other):
+		return isinstance(other, Credentials)
+
+
+def test_cache_key_handles_unhashable_params():
+	headers = {'x-team': 'agents'}
+	credentials = Credentials()
+	key = client_cache_key(ChatOpenAI, {'api_key': 'a', 'default_headers': headers, 'credentials': credentials})
+
+	assert key == client_cache_key(ChatOpenAI, {'default_headers': dict(headers), 'api_key': 'a', 'credentials': credentials})
+	assert key != client_cache_key(ChatOpenAI, {'api_key': 'b', 'default_headers': headers, 'credentials': credentials})
+	# only the very same credentials object can share a client
+	assert key != client_cache_key(ChatOpenAI, {'api_key': 'a', 'default_headers': headers, 'credentials': Credentials()})
+
+	# the key keeps the credentials alive, a new object can't get their id (and their client) after they are gone
+	del credentials
+	assert key != client_cache_key(ChatOpenAI, {'api_key': 'a', 'default_headers': headers, 'credentials': Credentials()})
+
+
+async def test_llm_providers_reuse_their_clients():
+	llm = ChatOpenAI(model='gpt-4o', api_key='key-a')
+	client = llm.get_client()
+	assert llm.get_client() is client
+	# another instance with the same settings (e.g. a second agent) shares the client too
+	assert ChatOpenAI(model='gpt-4o-mini', api_key='key-a').get_client() is client
+
+	# different credentials get their own SDK client, but still share the connection pool
+	other = ChatOpenAI(model='gpt-4o', api_key='key-b').get_client()
+	assert other is not client
+	assert other._client is client._client is get_http_client()
+
+	anthropic = ChatAnthropic(model='claude-sonnet-4-0', api_key='key-a')
+	assert anthropic.get_client() is anthropic.get_client()
+
+	await aclose_shared_clients()
+
+
+async def test_user_supplied_http_clients_are_never_closed():
+	user_client = httpx.AsyncClient()
+	retain_shared_clients()
+	sdk_client = ChatOpenAI(model='gpt-4o', api_key='key-a', http_client=user_client).get_client()
+	shared_sdk_client = ChatOpenAI(model='gpt-4o', api_key='key-a').get_client()
+
+	await release_shared_clients()
+
+	# the pool of the registry is closed, the caller's client (and the SDK client around it) stay usable
+	assert shared_sdk_client.is_closed()
+	assert not sdk_client.is_closed()
+	assert not user_client.is_closed
+	await user_client.aclose()
+
+
+async def test_user_supplied_http_client_survives_agent_run(browser_session):
+	user_client = httpx.AsyncClient()
+	llm = create_mock_llm()
+	mock_ainvoke = llm.ainvoke.side_effect
+
+	async def ainvoke(*args, **kwargs):
+		# what ChatOpenAI(http_client=...) does on every call
+		ChatOpenAI(model='gpt-4o', api_key='key-a', http_client=user_client).get_client()
+		return await mock_ainvoke(*args, **kwargs)
+
+	llm.ainvoke.side_effect = ainvoke
+	agent = Agent(task='Test task', llm=llm, browser_session=browser_session)
+	await agent.run(max_steps=1)
+
+	assert not user_client.is_closed
+	await user_client.aclose()
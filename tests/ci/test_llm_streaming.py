@@ -0,0 +1,130 @@
+"""Tests for streamed LLM outputs and the early handling of the first action in Agent.get_model_output()."""
+
+import asyncio
+import json
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from browser_use import Agent
+from browser_use.browser import BrowserSession
+from browser_use.browser.profile import BrowserProfile
+from browser_use.dom.views import DOMElementNode
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.streaming import IncrementalJSONArrayParser
+from browser_use.llm.views import ChatInvokeCompletion
+
+MODEL_OUTPUT = {
+	'thinking': 'The "action": [{"fake": 1}] in this string is not an action, neither is {this} or this \\"',
+	'evaluation_previous_goal': 'Opened the page',
+	'memory': 'action',
+	'next_goal': 'Fill in the form',
+	'action': [
+		{'input_text': {'index': 2, 'text': 'brackets ] } in text'}},
+		{'click_element_by_index': {'index': 5}},
+		{'done': {'text': 'nested [1, [2, {"a": 3}]]', 'success': True}},
+	],
+}
+
+
+@dataclass
+class StreamingLLM(BaseChatModel):
+	"""Streams a fixed JSON output in small chunks, recording what the agent did before each chunk"""
+
+	output: str
+	model: str = 'streaming-test-llm'
+	chunk_size: int = 7
+	_verified_api_keys: bool = True
+
+	@property
+	def provider(self) -> str:
+		return 'test'
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	async def ainvoke(self, messages, output_format=None):
+		raise AssertionError('the streaming path should not use ainvoke()')
+
+	async def ainvoke_streaming(self, messages, output_format, on_delta):
+		self.chunks_sent = 0
+		for start in range(0, len(self.output), self.chunk_size):
+			on_delta(self.output[start : start + self.chunk_size])
+			self.chunks_sent += 1
+			await asyncio.sleep(0)
+		return ChatInvokeCompletion(completion=output_format.model_validate_json(self.output), usage=None)
+
+
+def test_parser_reports_array_items_as_they_complete():
+	output = json.dumps(MODEL_OUTPUT, indent=2)
+	parser = IncrementalJSONArrayParser(array_key='action')
+
+	completed_at = []
+	for i, char in enumerate(output):
+		for item in parser.feed(char):
+			completed_at.append((i, item))
+
+	assert [item for _, item in completed_at] == MODEL_OUTPUT['action']
+	# every item is reported on the chunk holding its closing brace, long before the end of the output
+	for i, item in completed_at:
+		assert output[i] == '}'
+	assert completed_at[0][0] < output.index('click_element_by_index')
+
+
+def test_parser_ignores_other_arrays_and_malformed_items():
+	parser = IncrementalJSONArrayParser(array_key='action')
+	assert parser.feed('{"tags": [{"a": 1}], "action": [{"go": 1}, {"bad": 01}, {"x"') == [{'go': 1}]
+	assert parser.feed(': {"y": "}"}}]}') == [{'x': {'y': '}'}}]
+
+
+async def test_default_streaming_falls_back_to_a_single_delta():
+	@dataclass
+	class NonStreamingLLM(StreamingLLM):
+		async def ainvoke(self, messages, output_format=None):
+			return ChatInvokeCompletion(completion=output_format.model_validate_json(self.output), usage=None)
+
+		ainvoke_streaming = BaseChatModel.ainvoke_streaming
+
+	class Answer(BaseModel):
+		text: str
+
+	deltas = []
+	response = await NonStreamingLLM(output='{"text": "hello"}').ainvoke_streaming([], Answer, deltas.append)
+
+	assert deltas == ['{"text":"hello"}']
+	assert response.completion.text == 'hello'
+
+
+async def test_agent_prewarms_the_first_action_while_streaming(monkeypatch):
+	output = json.dumps(MODEL_OUTPUT)
+	llm = StreamingLLM(output=output)
+	session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, headless=True))
+	agent = Agent(task='fill in the form', llm=llm, browser_session=session, stream_actions=True)
+
+	elements = {
+		index: DOMElementNode(
+			tag_name='input', xpath=f'/body/input[{index}]', attributes={}, children=[], is_visible=True, parent=None
+		)
+		for index in (2, 5)
+	}
+	prewarmed = []
+
+	async def get_selector_map(self):
+		return elements
+
+	def prewarm_element(self, element):
+		prewarmed.append((element, llm.chunks_sent))
+
+	monkeypatch.setattr(BrowserSession, 'get_selector_map', get_selector_map)
+	monkeypatch.setattr(BrowserSession, 'prewarm_element', prewarm_element)
+
+	parsed = await agent.get_model_output([])
+
+	assert len(parsed.action) == 3
+	assert parsed.action[0].get_index() == 2
+	# only the first action is prewarmed, and before the rest of its output was streamed
+	assert len(prewarmed) == 1
+	assert prewarmed[0][0] is elements[2]
+	total_chunks = -(-len(output) // llm.chunk_size)
+	assert prewarmed[0][1] < total_chunks * 3 / 4
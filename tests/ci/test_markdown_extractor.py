@@ -0,0 +1,201 @@
+"""Tests for the streaming HTML to markdown conversion behind extract_structured_data."""
+
+import asyncio
+import time
+
+from browser_use.dom.markdown_extractor.chunking import CHUNK_SEPARATOR, score_chunks, select_relevant_markdown, split_markdown
+from browser_use.dom.markdown_extractor.service import SELECTION_NOTE, TRUNCATION_NOTE, MarkdownExtractor, html_to_markdown
+
+PAGE_HTML = """<html><head><title>Shop</title><style>body { color: red }</style></head>
+<body>
+	<nav><a href="/">Home</a> <a href="/cart">Cart</a></nav>
+	<h1>Catalogue</h1>
+	<p>All   our
+		products, <b>on sale</b> &amp; <em>in stock</em>.<br>Shipping is free.</p>
+	<ul><li>First <a href="/p/1">product</a></li><li>Second<ol><li>variant a</li><li>variant b</li></ol></li></ul>
+	<img src="/logo.png" alt="Logo">
+	<table><tr><th>Name</th><th>Price</th></tr><tr><td>Desk</td><td>$99</td></tr></table>
+	<pre>def f():
+    return 1</pre>
+	<script>window.secret = 1</script><noscript>Enable JS</noscript>
+</body></html>"""
+
+
+def test_converts_html_to_markdown():
+	markdown, truncated = html_to_markdown(PAGE_HTML)
+
+	assert not truncated
+	assert markdown.splitlines() == [
+		'Home Cart',
+		'# Catalogue',
+		'All our products, **on sale** & *in stock*.',
+		'Shipping is free.',
+		'- First product',
+		'- Second',
+		'  1. variant a',
+		'  2. variant b',
+		'| Name | Price |',
+		'| Desk | $99 |',
+		'```',
+		'def f():',
+		'    return 1',
+		'```',
+	]
+
+
+def test_links_and_images_are_only_kept_when_requested():
+	markdown, _ = html_to_markdown(PAGE_HTML, extract_links=True)
+
+	assert '[Cart](/cart)' in markdown
+	assert '- First [product](/p/1)' in markdown
+	assert '![Logo](/logo.png)' in markdown
+
+
+def test_conversion_stops_at_the_budget():
+	html = '<body>' + ''.join(f'<p>Paragraph number {i}</p>' for i in range(100_000)) + '</body>'
+
+	start = time.perf_counter()
+	markdown, truncated = html_to_markdown(html, max_chars=1000)
+	elapsed = time.perf_counter() - start
+
+	assert truncated
+	assert len(markdown) <= 1000
+	assert markdown.startswith('Paragraph number 0\nParagraph number 1\n')
+	# only the first chunk of the 2.7MB document gets parsed
+	assert elapsed < 0.5
+
+
+class FakeFrame:
+	def __init__(self, url: str, html: str, delay: float = 0):
+		self.url = url
+		self.html = html
+		self.delay = delay
+		self.content_calls = 0
+		self.document_id = 'doc-1'
+		self.dom_version = 0
+
+	async def wait_for_load_state(self, timeout=None):
+		pass
+
+	async def content(self):
+		self.content_calls += 1
+		await asyncio.sleep(self.delay)
+		return self.html
+
+	async def evaluate(self, script):
+		return [self.document_id, self.dom_version]
+
+
+class FakePage(FakeFrame):
+	def __init__(self, url: str, html: str, iframes: list[FakeFrame] = []):
+		super().__init__(url, html)
+		self.frames = [self, *iframes]
+
+
+async def test_iframes_are_extracted_concurrently():
+	iframes = [FakeFrame(f'https://widgets.example.com/{i}', f'<p>Widget {i}</p>', delay=0.2) for i in range(5)]
+	page = FakePage('https://example.com/', '<h1>Main</h1>', iframes + [FakeFrame('about:blank', '<p>blank</p>')])
+
+	start = time.perf_counter()
+	content = await MarkdownExtractor().extract(page)
+	elapsed = time.perf_counter() - start
+
+	assert elapsed < 0.6
+	assert content.splitlines() == ['# Main'] + [
+		line for i in range(5) for line in (f'IFRAME https://widgets.example.com/{i}:', f'Widget {i}')
+	]
+
+
+async def test_markdown_is_cached_per_url_and_dom_version():
+	page = FakePage('https://example.com/', '<p>Version one</p>')
+	extractor = MarkdownExtractor()
+
+	assert await extractor.extract(page) == 'Version one'
+	assert await extractor.extract(page) == 'Version one'
+	assert page.content_calls == 1
+
+	# links are part of the key, the markdown differs
+	await extractor.extract(page, extract_links=True)
+	assert page.content_calls == 2
+
+	page.html = '<p>Version two</p>'
+	page.dom_version += 1
+	assert await extractor.extract(page) == 'Version two'
+
+	# a reload starts a new document with a fresh counter
+	page.html = '<p>Version three</p>'
+	page.document_id, page.dom_version = 'doc-2', 0
+	assert await extractor.extract(page) == 'Version three'
+	assert page.content_calls == 4
+
+
+async def test_changes_inside_iframes_invalidate_the_cache():
+	iframe = FakeFrame('https://widgets.example.com/', '<p>Old widget</p>')
+	page = FakePage('https://example.com/', '<h1>Main</h1>', [iframe])
+	extractor = MarkdownExtractor()
+
+	assert (await extractor.extract(page)).endswith('Old widget')
+	assert (await extractor.extract(page)).endswith('Old widget')
+	assert iframe.content_calls == 1
+
+	# the top document didn't change, the iframe's own observer did see the change
+	iframe.html = '<p>New widget</p>'
+	iframe.dom_version += 1
+	assert (await extractor.extract(page)).endswith('New widget')
+	assert iframe.content_calls == 2
+
+
+async def test_long_pages_are_cut_with_a_note():
+	page = FakePage('https://example.com/', ''.join(f'<p>Row {i}</p>' for i in range(1000)))
+
+	content = await MarkdownExtractor(max_chars=100).extract(page)
+
+	assert content.endswith(TRUNCATION_NOTE)
+	assert len(content) == 100 + len(TRUNCATION_NOTE)
+	assert content.startswith('Row 0\nRow 1\n')
+
+
+def test_markdown_is_split_at_headings_and_size_limit():
+	markdown = '# Intro\nshort\n## Details\n' + '\n'.join(f'line {i}' for i in range(20)) + '\n' + 'x' * 250
+
+	chunks = split_markdown(markdown, chunk_chars=100)
+
+	assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+	assert chunks[0].text == '# Intro\nshort'
+	assert chunks[1].text.startswith('## Details\nline 0')
+	assert all(len(chunk.text) <= 100 for chunk in chunks)
+	# nothing is lost
+	assert ''.join(chunk.text for chunk in chunks).replace('\n', '') == markdown.replace('\n', '')
+
+
+def test_chunks_are_ranked_with_bm25():
+	chunks = split_markdown('# Shipping\nShipping costs and delivery\n# Returns\nReturns are free\n# Price\nThe price is $10')
+
+	score_chunks(chunks, 'what is the price of shipping')
+
+	assert chunks[0].score > 0 and chunks[2].score > 0
+	assert chunks[1].score == 0
+
+
+async def test_long_pages_keep_the_parts_relevant_to_the_query():
+	rows = [f'<p>Filler row {i} about nothing in particular</p>' for i in range(2000)]
+	rows[1000] = '<h2>Warranty</h2><p>The warranty period is 24 months</p>'
+	rows[1500] = '<h2>Contact</h2><p>Warranty claims go to support@example.com</p>'
+	page = FakePage('https://example.com/', '<h1>Product</h1>' + ''.join(rows))
+
+	content = await MarkdownExtractor(max_chars=2000).extract(page, query='How long is the warranty period?')
+
+	assert content.endswith(SELECTION_NOTE)
+	assert len(content) <= 2000 + len(SELECTION_NOTE)
+	# the start of the page is kept for context, the relevant sections follow in page order
+	assert content.startswith('# Product\nFiller row 0')
+	assert content.index('The warranty period is 24 months') < content.index('support@example.com')
+	assert CHUNK_SEPARATOR + '## Warranty' in content
+
+
+def test_selection_without_matches_keeps_the_start_of_the_page():
+	markdown = '\n'.join(f'Row {i}' for i in range(1000))
+
+	selected = select_relevant_markdown(markdown, 'unrelated', max_chars=200, chunk_chars=50)
+
+	assert markdown.startswith(selected)
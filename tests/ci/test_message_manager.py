@@ -0,0 +1,121 @@
+"""Tests for the incrementally built agent history of the MessageManager."""
+
+import pytest
+
+from browser_use.agent.message_manager.service import HISTORY_CACHE_CHUNK_SIZE, MessageManager
+from browser_use.agent.message_manager.views import HistoryItem
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.agent.views import MessageManagerState
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.views import DOMElementNode
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm import SystemMessage, UserMessage
+from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
+
+
+@pytest.fixture
+def file_system(tmp_path):
+	return FileSystem(tmp_path)
+
+
+def make_message_manager(file_system: FileSystem, max_history_items: int | None = None) -> MessageManager:
+	return MessageManager(
+		task='Test task',
+		system_message=SystemMessage(content='System message'),
+		state=MessageManagerState(),
+		file_system=file_system,
+		max_history_items=max_history_items,
+	)
+
+
+def add_steps(message_manager: MessageManager, count: int) -> None:
+	for _ in range(count):
+		step_number = len(message_manager.state.agent_history_items)
+		message_manager.state.agent_history_items.append(
+			HistoryItem(step_number=step_number, memory=f'memory {step_number}', next_goal=f'goal {step_number}')
+		)
+
+
+def test_history_prefix_grows_in_chunks(file_system):
+	message_manager = make_message_manager(file_system)
+	items = message_manager.state.agent_history_items
+
+	add_steps(message_manager, HISTORY_CACHE_CHUNK_SIZE - 2)
+	assert message_manager.agent_history_prefix == ''
+
+	add_steps(message_manager, 1)
+	prefix = message_manager.agent_history_prefix
+	assert prefix == '\n'.join(item.to_string() for item in items[:HISTORY_CACHE_CHUNK_SIZE])
+
+	# the prefix stays the same until the next chunk is complete
+	add_steps(message_manager, HISTORY_CACHE_CHUNK_SIZE - 1)
+	assert message_manager.agent_history_prefix == prefix
+	assert message_manager.agent_history_description == '\n'.join(item.to_string() for item in items)
+
+	add_steps(message_manager, 1)
+	assert message_manager.agent_history_prefix.startswith(prefix + '\n')
+	assert message_manager.agent_history_description == message_manager.agent_history_prefix
+
+	# restored state starts over
+	message_manager.state = MessageManagerState(agent_history_items=items[:5])
+	assert message_manager.agent_history_prefix == ''
+	assert message_manager.agent_history_description == '\n'.join(item.to_string() for item in items[:5])
+
+
+def test_history_window_has_no_prefix(file_system):
+	message_manager = make_message_manager(file_system, max_history_items=12)
+	add_steps(message_manager, 11)
+	assert message_manager.agent_history_prefix != ''
+
+	add_steps(message_manager, 5)
+	items = message_manager.state.agent_history_items
+
+	assert message_manager.agent_history_prefix == ''
+	assert message_manager.agent_history_description == '\n'.join(
+		[items[0].to_string(), '<sys>[... 5 previous steps omitted...]</sys>', *(item.to_string() for item in items[-11:])]
+	)
+
+
+def test_state_message_marks_the_history_prefix_cacheable(file_system):
+	message_manager = make_message_manager(file_system)
+	add_steps(message_manager, HISTORY_CACHE_CHUNK_SIZE + 3)
+	browser_state = BrowserStateSummary(
+		element_tree=DOMElementNode(tag_name='body', xpath='', attributes={}, children=[], is_visible=True, parent=None),
+		selector_map={},
+		url='https://example.com',
+		title='Example',
+		tabs=[],
+	)
+
+	message = AgentMessagePrompt(
+		browser_state_summary=browser_state,
+		file_system=file_system,
+		agent_history_description=message_manager.agent_history_description,
+		agent_history_prefix=message_manager.agent_history_prefix,
+	).get_user_message(use_vision=False)
+
+	# one string for every provider, only the Anthropic serializer splits it at the prefix
+	assert isinstance(message.content, str)
+	assert message.content.startswith('<agent_history>\n' + message_manager.agent_history_prefix)
+	assert message.cache_prefix_length == len('<agent_history>\n' + message_manager.agent_history_prefix)
+
+	serialized = AnthropicMessageSerializer.serialize(message)
+	blocks = list(serialized['content'])
+	assert blocks[0].get('text') == message.content[: message.cache_prefix_length]
+	assert blocks[0].get('cache_control') == {'type': 'ephemeral'}
+	assert str(blocks[1].get('text')).startswith(f'\n<step_{HISTORY_CACHE_CHUNK_SIZE}>')
+	assert blocks[1].get('cache_control') is None
+
+
+def test_redacting_the_state_message_keeps_the_prefix_length(file_system):
+	message_manager = make_message_manager(file_system)
+	message_manager.sensitive_data = {'password': 'memory 1'}
+	prefix = '<agent_history>\nmemory 1, memory 1\n'
+	message = UserMessage(content=prefix + 'memory 1 after the prefix', cache_prefix_length=len(prefix))
+
+	message_manager._filter_sensitive_data(message)
+
+	assert message.text == (
+		'<agent_history>\n<secret>password</secret>, <secret>password</secret>\n<secret>password</secret> after the prefix'
+	)
+	assert message.text[: message.cache_prefix_length].endswith('</secret>\n')
@@ -0,0 +1,106 @@
+"""Tests for the event-driven network idle detection used by BrowserSession._wait_for_stable_network()."""
+
+import asyncio
+from types import SimpleNamespace
+
+from browser_use.browser.network_idle import IGNORED_URL_PATTERNS, NetworkIdleDetector, is_relevant_request
+
+
+class FakePage:
+	"""Minimal stand-in for the playwright Page event emitter"""
+
+	def __init__(self):
+		self.listeners: dict[str, list] = {}
+
+	def on(self, event, handler):
+		self.listeners.setdefault(event, []).append(handler)
+
+	def remove_listener(self, event, handler):
+		self.listeners[event].remove(handler)
+
+	def emit(self, event, arg):
+		for handler in list(self.listeners.get(event, [])):
+			handler(arg)
+
+
+class FakeRequest:
+	def __init__(self, url: str, resource_type: str = 'script', headers: dict | None = None):
+		self.url = url
+		self.resource_type = resource_type
+		self.headers = headers or {}
+
+
+def _response(request, content_type: str = 'application/javascript'):
+	return SimpleNamespace(request=request, headers={'content-type': content_type})
+
+
+def test_url_filter_matches_substring_search():
+	urls = [
+		'https://example.com/app.js',
+		'https://www.google-analytics.com/collect',
+		'https://example.com/api/ping?x=1',
+		'https://d1.cloudfront.net/img.png',
+		'wss://example.com/socket',
+		'https://example.com/Tracking/pixel.gif',
+		'https://example.com/style.css',
+	]
+	for url in urls:
+		ignored = any(pattern in url.lower() for pattern in IGNORED_URL_PATTERNS)
+		assert is_relevant_request('script', url, {}) is not ignored
+
+	assert not is_relevant_request('websocket', 'https://example.com/', {})
+	assert not is_relevant_request('image', 'data:image/png;base64,AAAA', {})
+	assert not is_relevant_request('document', 'https://example.com/next', {'purpose': 'prefetch'})
+
+
+async def test_idle_without_requests_waits_for_the_quiet_window():
+	page = FakePage()
+	detector = NetworkIdleDetector(idle_time=0.05, timeout=2)
+	detector.attach(page)
+
+	loop = asyncio.get_running_loop()
+	start = loop.time()
+	assert await detector.wait()
+	assert 0.04 <= loop.time() - start < 0.5
+
+	detector.detach(page)
+	assert all(not handlers for handlers in page.listeners.values())
+
+
+async def test_wakes_up_when_pending_requests_finish():
+	page = FakePage()
+	detector = NetworkIdleDetector(idle_time=0.05, timeout=5)
+	detector.attach(page)
+
+	loaded = FakeRequest('https://example.com/app.js')
+	failed = FakeRequest('https://example.com/missing.css', resource_type='stylesheet')
+	ignored = FakeRequest('https://example.com/heartbeat', resource_type='document')
+	page.emit('request', loaded)
+	page.emit('request', failed)
+	page.emit('request', ignored)
+	assert detector.pending_requests == {loaded, failed}
+
+	async def finish_requests():
+		await asyncio.sleep(0.1)
+		page.emit('response', _response(loaded))
+		await asyncio.sleep(0.1)
+		page.emit('requestfailed', failed)
+
+	loop = asyncio.get_running_loop()
+	start = loop.time()
+	finisher = asyncio.create_task(finish_requests())
+	assert await detector.wait()
+	await finisher
+
+	assert not detector.pending_requests
+	assert 0.2 <= loop.time() - start < 1
+
+
+async def test_times_out_with_pending_requests():
+	page = FakePage()
+	detector = NetworkIdleDetector(idle_time=0.01, timeout=0.1)
+	detector.attach(page)
+	page.emit('request', FakeRequest('https://example.com/slow', resource_type='document'))
+
+	assert not await detector.wait()
+	assert len(detector.pending_requests) == 1
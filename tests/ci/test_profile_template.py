@@ -0,0 +1,107 @@
+"""Tests for cloning a user_data_dir_template into a new user_data_dir per browser."""
+
+import errno
+import logging
+import shutil
+
+import pytest
+
+from browser_use.browser import profile_template
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.profile_template import clone_user_data_dir
+from browser_use.browser.session import BrowserSession
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+	"""A profile dir that was last used by a (still running) browser"""
+	template = tmp_path / 'golden-profile'
+	(template / 'Default' / 'Cache').mkdir(parents=True)
+	(template / 'Default' / 'Cookies').write_bytes(b'logged in')
+	(template / 'Default' / 'Cache' / 'data_0').write_bytes(b'cached')
+	(template / 'Local State').write_text('{}')
+	(template / 'SingletonLock').symlink_to('otherhost-1234')
+	(template / 'DevToolsActivePort').write_text('9222\n/devtools/browser/abc')
+	return template
+
+
+def test_clone_copies_the_profile_without_browser_state(template_dir, tmp_path):
+	clone = tmp_path / 'clone'
+	clone_user_data_dir(template_dir, clone)
+
+	assert (clone / 'Default' / 'Cookies').read_bytes() == b'logged in'
+	assert (clone / 'Local State').read_text() == '{}'
+	assert not (clone / 'Default' / 'Cache').exists()
+	assert not (clone / 'SingletonLock').is_symlink()
+	assert not (clone / 'DevToolsActivePort').exists()
+
+	# the browser writes to the clone, not the template
+	(clone / 'Default' / 'Cookies').write_bytes(b'logged out')
+	assert (template_dir / 'Default' / 'Cookies').read_bytes() == b'logged in'
+
+
+def test_clone_of_missing_template_fails(tmp_path):
+	with pytest.raises(ValueError):
+		clone_user_data_dir(tmp_path / 'missing', tmp_path / 'clone')
+
+
+async def test_every_launch_gets_a_new_clone_that_stop_deletes(template_dir):
+	browser_session = BrowserSession(browser_profile=BrowserProfile(user_data_dir_template=template_dir))
+
+	await browser_session._clone_user_data_dir_template()
+	first_clone = browser_session.browser_profile.user_data_dir
+	assert first_clone is not None and first_clone.name.startswith('browseruse-tmp-clone-')
+	assert first_clone.parent == template_dir.parent  # same filesystem as the template, so reflinks can work
+	assert (first_clone / 'Default' / 'Cookies').read_bytes() == b'logged in'
+
+	# a relaunch of the same session replaces its clone
+	await browser_session._clone_user_data_dir_template()
+	second_clone = browser_session.browser_profile.user_data_dir
+	assert second_clone != first_clone
+	assert not first_clone.exists()
+
+	await browser_session.stop()
+	assert not second_clone.exists()
+
+
+async def test_kept_clone_survives_stop(template_dir):
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(user_data_dir_template=template_dir, keep_user_data_dir_clone=True)
+	)
+	await browser_session._clone_user_data_dir_template()
+	clone = browser_session.browser_profile.user_data_dir
+	assert clone is not None
+
+	await browser_session.stop()
+	assert (clone / 'Default' / 'Cookies').exists()
+	shutil.rmtree(clone)
+
+
+async def test_clones_go_to_the_configured_dir(template_dir, tmp_path):
+	clone_dir = tmp_path / 'clones'
+	browser_session = BrowserSession(
+		browser_profile=BrowserProfile(user_data_dir_template=template_dir, user_data_dir_clone_dir=clone_dir)
+	)
+	await browser_session._clone_user_data_dir_template()
+	clone = browser_session.browser_profile.user_data_dir
+	assert clone is not None and clone.parent == clone_dir
+
+	await browser_session.stop()
+	assert not clone.exists()
+
+
+def test_falling_back_to_copies_is_logged_once(template_dir, tmp_path, monkeypatch, caplog):
+	def reflink(src, dst):
+		raise OSError(errno.EXDEV, 'Invalid cross-device link', src)
+
+	monkeypatch.setattr(profile_template, '_reflink', reflink)
+	monkeypatch.setattr(profile_template, '_warned_copies', set())
+
+	with caplog.at_level(logging.WARNING, logger=profile_template.__name__):
+		clone_user_data_dir(template_dir, tmp_path / 'first')
+		clone_user_data_dir(template_dir, tmp_path / 'second')
+
+	assert (tmp_path / 'second' / 'Default' / 'Cookies').read_bytes() == b'logged in'
+	warnings = [record for record in caplog.records if 'full copies' in record.getMessage()]
+	assert len(warnings) == 1
+	assert 'Invalid cross-device link' in warnings[0].getMessage()
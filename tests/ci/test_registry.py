@@ -18,7 +18,7 @@ from pydantic import Field
 from pytest_httpserver import HTTPServer
 from pytest_httpserver.httpserver import HandlerType
 
-from browser_use.agent.views import ActionResult
+from browser_use.agent.views import ActionResult, AgentOutput
 from browser_use.browser import BrowserSession
 from browser_use.browser.profile import BrowserProfile
 from browser_use.browser.types import Page
@@ -31,6 +31,7 @@ from browser_use.controller.views import (
 	SearchGoogleAction,
 )
 from browser_use.llm.messages import UserMessage
+from browser_use.llm.schema import SchemaOptimizer
 from tests.ci.conftest import create_mock_llm
 
 # Configure logging
@@ -1032,6 +1033,57 @@ class TestParameterOrdering:
 		assert action.description == 'Extract content from page'
 
 
+class TestActionModelCaching:
+	"""Test that action models and their schemas are reused for the same set of actions"""
+
+	def test_same_action_set_reuses_models(self, registry):
+		@registry.action('Search the docs', domains=['docs.example.com'])
+		async def search_docs(query: str):
+			return ActionResult()
+
+		@registry.action('Say hello')
+		async def say_hello(name: str):
+			return ActionResult()
+
+		class FakePage:
+			def __init__(self, url: str):
+				self.url = url
+
+		docs_model = registry.create_action_model(page=FakePage('https://docs.example.com/a'))
+		assert registry.create_action_model(page=FakePage('https://docs.example.com/b')) is docs_model
+		other_model = registry.create_action_model(page=FakePage('https://example.com'))
+		assert other_model is not docs_model
+		assert registry.create_action_model() is other_model
+
+		agent_output = AgentOutput.type_with_custom_actions(docs_model)
+		assert AgentOutput.type_with_custom_actions(docs_model) is agent_output
+		assert AgentOutput.type_with_custom_actions_flash_mode(docs_model) is not agent_output
+
+		# the schema is built once, but every caller gets a copy it can modify
+		schema = SchemaOptimizer.create_optimized_json_schema(agent_output)
+		del schema['properties']
+		assert 'properties' in SchemaOptimizer.create_optimized_json_schema(agent_output)
+
+		# registering an action changes the set
+		@registry.action('Say goodbye')
+		async def say_goodbye(name: str):
+			return ActionResult()
+
+		assert registry.create_action_model() is not other_model
+
+	def test_prompt_description_is_built_once(self, registry, monkeypatch):
+		@registry.action('Say hello')
+		async def say_hello(name: str):
+			return ActionResult()
+
+		description = registry.get_prompt_description()
+		assert 'Say hello' in description and 'name' in description
+
+		action = registry.registry.actions['say_hello']
+		monkeypatch.setattr(action.param_model, 'model_json_schema', lambda *args, **kwargs: pytest.fail('rebuilt'))
+		assert registry.get_prompt_description() == description
+
+
 class TestParamsModelArgsAndKwargs:
 	async def test_browser_session_double_kwarg(self):
 		"""Run the test to diagnose browser_session parameter issue
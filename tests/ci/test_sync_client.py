@@ -604,3 +604,137 @@ class TestCloudSyncErrorHandling:
 
 		# ~7 should succeed (10 total, ~3 fail)
 		assert len(successful_requests) >= 6
+
+
+class TestCloudSyncBackgroundUpload:
+	"""Test batched background uploads with background_upload=True."""
+
+	@staticmethod
+	def make_event(task: str) -> CreateAgentTaskEvent:
+		return CreateAgentTaskEvent(
+			agent_session_id='test-session',
+			llm_model='test-model',
+			task=task,
+			user_id='test-user-123',
+			device_id='test-device-id',
+			done_output=None,
+			user_feedback_type=None,
+			user_comment=None,
+			gif_url=None,
+		)
+
+	async def test_events_are_batched_and_gzipped(self, httpserver: HTTPServer, temp_config_dir):
+		"""Test that queued events are sent together in one compressed request."""
+		import gzip
+		import json
+
+		from werkzeug.wrappers import Response
+
+		requests = []
+
+		def capture_request(request):
+			assert request.headers['Content-Encoding'] == 'gzip'
+			requests.append(json.loads(gzip.decompress(request.get_data())))
+			return Response('{"processed": 20}', status=200, mimetype='application/json')
+
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(capture_request)
+
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False, background_upload=True)
+		for i in range(20):
+			await service.handle_event(self.make_event(f'Batched task {i}'))
+		# nothing was sent while handling the events
+		assert requests == []
+
+		await service.flush()
+
+		assert len(requests) == 1
+		assert [event['task'] for event in requests[0]['events']] == [f'Batched task {i}' for i in range(20)]
+		assert service.upload_metrics
+		assert service.upload_metrics.sent == 20
+		assert service.upload_metrics.batches == 1
+		assert 0 < service.upload_metrics.bytes_sent < len(json.dumps(requests[0]))
+
+	async def test_failed_batches_are_retried(self, httpserver: HTTPServer, temp_config_dir):
+		"""Test that server errors are retried with backoff."""
+		from werkzeug.wrappers import Response
+
+		attempts = []
+
+		def flaky_handler(request):
+			attempts.append(request)
+			if len(attempts) < 3:
+				return Response('Server Error', status=503)
+			return Response('{"processed": 1}', status=200, mimetype='application/json')
+
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(flaky_handler)
+
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False, background_upload=True)
+		assert service.uploader
+		service.uploader.retry_backoff = 0.01
+		await service.handle_event(self.make_event('Retried task'))
+		await service.flush()
+
+		assert len(attempts) == 3
+		assert service.uploader.metrics.retries == 2
+		assert service.uploader.metrics.sent == 1
+		assert service.uploader.metrics.failed == 0
+
+	async def test_full_queue_drops_events(self, temp_config_dir):
+		"""Test that a full queue drops new events instead of blocking the agent."""
+		import asyncio
+
+		from browser_use.sync.uploader import EventUploader
+
+		sent = []
+
+		async def slow_send(batch):
+			await asyncio.sleep(0.1)
+			sent.extend(batch)
+			return True
+
+		uploader = EventUploader(slow_send, max_queue_size=3, max_batch_size=2, max_batch_delay=0)
+		accepted = [uploader.put(self.make_event(f'Task {i}')) for i in range(5)]
+		await uploader.flush()
+
+		assert accepted == [True, True, True, False, False]
+		assert [event.task for event in sent] == ['Task 0', 'Task 1', 'Task 2']
+		assert uploader.metrics.dropped == 2
+		assert uploader.metrics.max_queue_depth == 3
+
+	async def test_screenshots_are_uploaded_once_as_blobs(self, httpserver: HTTPServer, temp_config_dir):
+		"""Test that repeated screenshots are uploaded once and referenced by url."""
+		import base64
+		import gzip
+		import hashlib
+		import json
+
+		from werkzeug.wrappers import Response
+
+		class ScreenshotEvent(BaseEvent):
+			event_type: str = 'ScreenshotEvent'
+			screenshot_url: str | None = None
+
+		screenshot = b'\x89PNG fake screenshot' * 100
+		digest = hashlib.sha256(screenshot).hexdigest()
+		blobs = []
+		events = []
+
+		def capture_blob(request):
+			blobs.append(request.get_data())
+			return Response(status=201)
+
+		def capture_events(request):
+			events.extend(json.loads(gzip.decompress(request.get_data()))['events'])
+			return Response('{"processed": 1}', status=200, mimetype='application/json')
+
+		httpserver.expect_request(f'/api/v1/blobs/{digest}', method='PUT').respond_with_handler(capture_blob)
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(capture_events)
+
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=False, background_upload=True)
+		data_url = f'data:image/png;base64,{base64.b64encode(screenshot).decode()}'
+		await service.handle_event(ScreenshotEvent(screenshot_url=data_url))
+		await service.handle_event(ScreenshotEvent(screenshot_url=data_url))
+		await service.flush()
+
+		assert blobs == [screenshot]
+		assert [event['screenshot_url'] for event in events] == [httpserver.url_for(f'/api/v1/blobs/{digest}')] * 2
@@ -20,6 +20,7 @@ load_dotenv()
 from browser_use.agent.cloud_events import CreateAgentSessionEvent, CreateAgentTaskEvent
 from browser_use.sync.auth import TEMP_USER_ID, DeviceAuthClient
 from browser_use.sync.service import CloudSync
+from browser_use.sync.wal import EventWAL
 
 # Define config dir for tests - not needed anymore since we'll use env vars
 
@@ -589,13 +590,9 @@ class TestCloudSync:
 		# Call the method under test (temp_config_dir fixture already sets the env var)
 		await service._update_wal_user_ids(service.session_id)
 
-		# Read back the updated file and verify changes
-		content = await anyio.Path(wal_path).read_text()
-
-		updated_events = []
-		for line in content.splitlines():
-			if line.strip():
-				updated_events.append(json.loads(line))
+		# The log itself is left alone, the ids are applied from the metadata sidecar when reading
+		assert await anyio.Path(wal_path).read_text() == content
+		updated_events = list(EventWAL(wal_path).iter_events())
 
 		# Verify all user_ids were updated to the authenticated user's ID
 		assert len(updated_events) == 3
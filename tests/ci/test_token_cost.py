@@ -0,0 +1,166 @@
+"""Tests for the running usage aggregates of TokenCost."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens import service as token_service
+from browser_use.tokens.pricing import INDEX_FILENAME, PricingIndex
+from browser_use.tokens.service import TokenCost
+
+PRICING = {
+	'model-a': {'input_cost_per_token': 0.001, 'output_cost_per_token': 0.002, 'cache_read_input_token_cost': 0.0005},
+	'model-b': {'input_cost_per_token': 0.01, 'output_cost_per_token': 0.02},
+}
+
+
+def make_usage(prompt_tokens: int, completion_tokens: int, cached_tokens: int | None = None) -> ChatInvokeUsage:
+	return ChatInvokeUsage(
+		prompt_tokens=prompt_tokens,
+		prompt_cached_tokens=cached_tokens,
+		prompt_cache_creation_tokens=None,
+		prompt_image_tokens=None,
+		completion_tokens=completion_tokens,
+		total_tokens=prompt_tokens + completion_tokens,
+	)
+
+
+class Clock(datetime):
+	current = datetime(2025, 1, 1, 12, 0, 0)
+
+	@classmethod
+	def now(cls, tz=None):
+		return cls.current
+
+
+def make_service(monkeypatch) -> TokenCost:
+	monkeypatch.setattr(token_service, 'datetime', Clock)
+	tc = TokenCost(include_cost=True)
+	tc._initialized = True  # pricing is set by the tests, nothing to fetch
+	return tc
+
+
+async def test_totals_match_the_history(monkeypatch):
+	tc = make_service(monkeypatch)
+	# usage before the pricing data is loaded gets priced on the next summary
+	tc.add_usage('model-a', make_usage(100, 10, cached_tokens=40))
+	tc._pricing_data = PRICING
+	tc.add_usage('model-a', make_usage(200, 20))
+	tc.add_usage('model-b', make_usage(50, 5))
+	tc.add_usage('unknown-model', make_usage(1, 1))
+
+	summary = await tc.get_usage_summary()
+
+	assert summary.entry_count == 4
+	assert summary.total_prompt_tokens == 351
+	assert summary.total_prompt_cached_tokens == 40
+	assert summary.total_completion_tokens == 36
+	expected_costs = [await tc.calculate_cost(entry.model, entry.usage) for entry in tc.usage_history]
+	assert summary.total_prompt_cost == pytest.approx(sum(cost.prompt_cost for cost in expected_costs if cost))
+	assert summary.total_completion_cost == pytest.approx(sum(cost.completion_cost for cost in expected_costs if cost))
+	assert summary.by_model['model-a'].invocations == 2
+	assert summary.by_model['model-a'].average_tokens_per_invocation == 165
+	assert summary.by_model['model-b'].cost == pytest.approx(50 * 0.01 + 5 * 0.02)
+	assert tc.get_usage_tokens_for_model('model-a').total_tokens == 330
+
+	model_summary = await tc.get_usage_summary(model='model-b')
+	assert model_summary.entry_count == 1 and list(model_summary.by_model) == ['model-b']
+
+	# new prices apply to the whole history
+	tc._pricing_data = {'model-b': {'input_cost_per_token': 1, 'output_cost_per_token': 1}}
+	summary = await tc.get_usage_summary()
+	assert summary.total_cost == 55
+	assert summary.by_model['model-a'].cost == 0
+
+	tc.clear_history()
+	assert (await tc.get_usage_summary()).entry_count == 0
+
+
+async def test_since_queries_use_time_buckets(monkeypatch):
+	tc = make_service(monkeypatch)
+	tc._pricing_data = PRICING
+	start = Clock.current
+	for minute in range(10):
+		for second in (0, 30):
+			Clock.current = start + timedelta(minutes=minute, seconds=second)
+			tc.add_usage('model-a' if second else 'model-b', make_usage(10, 1))
+
+	# exactly on a bucket boundary, and in the middle of a bucket
+	assert (await tc.get_usage_summary(since=start + timedelta(minutes=5))).entry_count == 10
+	summary = await tc.get_usage_summary(since=start + timedelta(minutes=5, seconds=15))
+	assert summary.entry_count == 9
+	assert summary.by_model['model-a'].invocations == 5
+	assert summary.by_model['model-b'].invocations == 4
+	assert summary.total_cost == pytest.approx(5 * (10 * 0.001 + 0.002) + 4 * (10 * 0.01 + 0.02))
+
+	assert (await tc.get_usage_summary(since=start + timedelta(hours=1))).entry_count == 0
+	assert (await tc.get_usage_summary(model='model-a', since=start)).entry_count == 10
+
+
+async def test_pricing_works_offline_from_the_bundled_index(monkeypatch, tmp_path):
+	monkeypatch.setenv('BROWSER_USE_PRICING_REFRESH', 'false')
+	tc = TokenCost(include_cost=True)
+	tc._cache_dir = tmp_path
+
+	pricing = await tc.get_model_pricing('gpt-4o')
+
+	assert pricing and pricing.input_cost_per_token and pricing.output_cost_per_token
+	assert await tc.get_model_pricing('no-such-model') is None
+	assert tc._refresh_task is None
+	assert list(tmp_path.iterdir()) == []
+
+
+async def test_refreshed_pricing_is_cached_as_a_compact_index(monkeypatch, tmp_path):
+	litellm_data = {
+		'sample_spec': {'input_cost_per_token': 'cost per input token', 'litellm_provider': 'one of litellm_providers'},
+		'model-a': {'input_cost_per_token': 1e-06, 'output_cost_per_token': 2e-06, 'supports_vision': True, 'mode': 'chat'},
+		'embedding-only': {'mode': 'embedding', 'max_input_tokens': 8192},
+	}
+	index = PricingIndex.from_litellm(litellm_data)
+	assert list(index) == ['model-a']
+	assert index['model-a'] == {'input_cost_per_token': 1e-06, 'output_cost_per_token': 2e-06}
+
+	index.save(tmp_path / INDEX_FILENAME)
+	monkeypatch.setenv('BROWSER_USE_PRICING_REFRESH', 'false')
+	tc = TokenCost(include_cost=True)
+	tc._cache_dir = tmp_path
+
+	# the cached index takes precedence over the bundled one
+	assert (await tc.get_model_pricing('model-a')).output_cost_per_token == 2e-06  # type: ignore[union-attr]
+	assert await tc.get_model_pricing('gpt-4o') is None
+
+	# a stale index is used right away and refreshed in the background
+	monkeypatch.setenv('BROWSER_USE_PRICING_REFRESH', 'true')
+	index.timestamp -= TokenCost.CACHE_DURATION
+	index.save(tmp_path / INDEX_FILENAME)
+	stale = TokenCost(include_cost=True)
+	stale._cache_dir = tmp_path
+	stale.PRICING_URL = 'http://127.0.0.1:9/unreachable.json'
+	assert await stale.get_model_pricing('model-a')
+	assert stale._refresh_task
+	await stale._refresh_task
+	assert await stale.get_model_pricing('model-a')
+
+
+async def test_missing_bundled_index_means_no_pricing(monkeypatch, tmp_path):
+	monkeypatch.setenv('BROWSER_USE_PRICING_REFRESH', 'false')
+	monkeypatch.setattr('browser_use.tokens.pricing.SNAPSHOT_FILENAME', 'missing_snapshot.json')
+	assert PricingIndex.load_snapshot() is None
+
+	tc = TokenCost(include_cost=True)
+	tc._cache_dir = tmp_path
+	assert await tc.get_model_pricing('gpt-4o') is None
+
+
+async def test_clean_old_caches_keeps_only_the_index(tmp_path):
+	PricingIndex.from_litellm({'model-a': {'input_cost_per_token': 1e-06}}).save(tmp_path / INDEX_FILENAME)
+	for i in range(5):
+		(tmp_path / f'pricing_2025010{i}_000000.json').write_text('{}')
+	(tmp_path / f'{INDEX_FILENAME}.tmp').write_bytes(b'interrupted')
+	tc = TokenCost(include_cost=True)
+	tc._cache_dir = tmp_path
+
+	await tc.clean_old_caches()
+
+	assert [path.name for path in tmp_path.iterdir()] == [INDEX_FILENAME]
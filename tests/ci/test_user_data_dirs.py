@@ -0,0 +1,69 @@
+"""Tests for the shared index of which processes use which user_data_dir."""
+
+import subprocess
+import sys
+
+import psutil
+import pytest
+
+from browser_use.browser import user_data_dirs
+from browser_use.browser.user_data_dirs import UserDataDirIndex
+
+
+@pytest.fixture
+def fake_browser(tmp_path):
+	"""A process started with a chrome-style --user-data-dir argument"""
+	user_data_dir = tmp_path / 'profile'
+	user_data_dir.mkdir()
+	process = subprocess.Popen(
+		[sys.executable, '-c', 'import time; time.sleep(30)', f'--user-data-dir={user_data_dir}', '--remote-debugging-port=0']
+	)
+	yield user_data_dir, process
+	process.kill()
+	process.wait()
+
+
+@pytest.fixture
+def count_scans(monkeypatch):
+	scans = []
+	process_iter = psutil.process_iter
+
+	def counting_process_iter(*args, **kwargs):
+		scans.append(1)
+		return process_iter(*args, **kwargs)
+
+	monkeypatch.setattr(user_data_dirs.psutil, 'process_iter', counting_process_iter)
+	return scans
+
+
+def test_index_finds_the_processes_using_a_dir(fake_browser, count_scans, tmp_path):
+	user_data_dir, process = fake_browser
+	index = UserDataDirIndex(ttl=60)
+
+	# found by the resolved path, whichever way it is spelled
+	assert index.pids_using(tmp_path / 'profile' / '..' / 'profile') == {process.pid}
+	assert index.pids_using(user_data_dir, exclude_pid=process.pid) == set()
+	assert index.pids_using(tmp_path / 'other') == set()
+	assert len(count_scans) == 1  # one scan answers all lookups until the ttl runs out
+
+	# fresh lookups (before deleting a stale lock) always scan again
+	assert index.pids_using(user_data_dir, fresh=True) == {process.pid}
+	assert len(count_scans) == 2
+
+
+def test_registered_browsers_are_found_without_scanning(fake_browser, count_scans):
+	user_data_dir, process = fake_browser
+	index = UserDataDirIndex(ttl=60)
+
+	index.register(user_data_dir, process.pid)
+	assert index.pids_using(user_data_dir) == {process.pid}
+	assert count_scans == []
+
+	# our own browser doesn't conflict with itself, the other processes are still checked
+	assert index.pids_using(user_data_dir, exclude_pid=process.pid) == set()
+	assert len(count_scans) == 1
+
+	process.kill()
+	process.wait()
+	index.unregister(process.pid)
+	assert index.pids_using(user_data_dir) == set()